@@ -0,0 +1,205 @@
+import gc
+import hashlib
+import marshal
+import os
+import zlib
+from enum import Enum
+
+from lexer import Location
+from operations import BinaryOperation, UnaryOperation
+from parser_tree import PTreeElem
+
+def _node_types(klass) -> list:
+    types = [klass]
+    for subclass in klass.__subclasses__():
+        types.extend(_node_types(subclass))
+    return types
+
+# Trees are stored flattened (see encode) into the types marshal knows. Class ids
+# are indexes in NODE_TYPES, in definition order so they only change with
+# parser_tree.py.
+NODE_TYPES = tuple(_node_types(PTreeElem)) + (BinaryOperation, UnaryOperation)
+NODE_IDS = {klass: i for i, klass in enumerate(NODE_TYPES)}
+NODE_FIELDS = tuple(tuple(name for name in klass.fields() if name != 'location')
+                    if issubclass(klass, PTreeElem) else () for klass in NODE_TYPES)
+
+# Any change to the files building the tree invalidates the cached trees
+COMPILER_FILES = ('lexer.py', 'lex_dispatch.py', 'parser_tree.py', 'operations.py', 'ast_cache.py',
+                  os.path.join('ply', 'lex.py'), os.path.join('ply', 'yacc.py'))
+MAGIC = b'PSAST2'
+
+
+def compiler_version() -> str:
+    h = hashlib.sha256(MAGIC)
+    root = os.path.dirname(os.path.abspath(__file__))
+    for name in COMPILER_FILES:
+        with open(os.path.join(root, name), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+LIST = -1
+
+
+def encode(tree) -> list:
+    """Flattens tree in postorder: values are pushed as they are, a node is the
+    tuple (class id, packed location) built from the values of its fields, a list
+    the tuple (LIST, length) and an enum member the tuple (class id, value).
+
+    The result is a flat list, marshal never has to recurse into the tree."""
+    out = []
+    stack = [(tree, False)]
+    while stack:
+        elem, instruction = stack.pop()
+        if instruction:
+            out.append(elem)
+        elif isinstance(elem, PTreeElem):
+            klass = NODE_IDS[type(elem)]
+            location = elem.location
+            stack.append(((klass, location.packed if location is not None else None), True))
+            stack.extend((getattr(elem, name), False) for name in reversed(NODE_FIELDS[klass]))
+        elif isinstance(elem, list):
+            stack.append(((LIST, len(elem)), True))
+            stack.extend((item, False) for item in reversed(elem))
+        elif isinstance(elem, Enum):
+            out.append((NODE_IDS[type(elem)], elem.value))
+        elif isinstance(elem, tuple):
+            raise ValueError("Tuples can not be stored in the AST cache")
+        else:
+            out.append(elem)
+    return out
+
+
+def decode(data:list):
+    stack = []
+    push = stack.append
+    for entry in data:
+        if entry.__class__ is not tuple:
+            push(entry)
+            continue
+        klassId, arg = entry
+        if klassId == LIST:
+            if arg:
+                items = stack[-arg:]
+                del stack[-arg:]
+            else:
+                items = []
+            push(items)
+            continue
+        klass = NODE_TYPES[klassId]
+        if issubclass(klass, Enum):
+            push(klass(arg))
+            continue
+        node = object.__new__(klass)
+        if arg is None:
+            node.location = None
+        else:
+            location = object.__new__(Location)
+            location.packed = arg
+            node.location = location
+        fields = NODE_FIELDS[klassId]
+        if fields:
+            for name, value in zip(fields, stack[-len(fields):]):
+                setattr(node, name, value)
+            del stack[-len(fields):]
+        push(node)
+    if len(stack) != 1:
+        raise ValueError("Corrupted AST cache entry")
+    return stack[0]
+
+
+class AstCache:
+    """Abstract syntax trees of source files stored on disk, keyed by the hash
+    of the source and of the compiler.
+
+    Entries are kept in a single directory, least recently used ones are removed
+    once the directory grows over maxSize bytes."""
+
+    def __init__(self, directory:str, maxSize:int=64 * 1024 * 1024) -> None:
+        self.directory = directory
+        self.maxSize = maxSize
+        self.version = compiler_version()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def key(self, code) -> str:
+        """code is the source as a str or as bytes-like UTF-8 (a memory mapped file)"""
+        h = hashlib.sha256(self.version.encode())
+        h.update(code.encode('utf-8', 'surrogatepass') if isinstance(code, str) else code)
+        return h.hexdigest()
+
+    def path(self, key:str) -> str:
+        return os.path.join(self.directory, key + '.ast')
+
+    def load(self, code:str):
+        """Returns the cached tree of code, or None when it is not cached"""
+        path = self.path(self.key(code))
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            if not data.startswith(MAGIC):
+                raise ValueError(f"{path} is not an AST cache entry")
+            # Rebuilding a tree only allocates, the collector would just rescan it
+            enabled = gc.isenabled()
+            gc.disable()
+            try:
+                tree = decode(marshal.loads(zlib.decompress(data[len(MAGIC):])))
+            finally:
+                if enabled:
+                    gc.enable()
+        except (OSError, ValueError, EOFError, TypeError, IndexError, zlib.error):
+            self.misses += 1
+            return None
+        # The modification time orders entries for the LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return tree
+
+    def store(self, code:str, tree) -> bool:
+        """Saves tree as the one of code, returns False if it could not be stored"""
+        if tree is None:
+            return False
+        try:
+            data = MAGIC + zlib.compress(marshal.dumps(encode(tree)), 1)
+        except (ValueError, KeyError, AttributeError):
+            # Not a tree
+            return False
+        path = self.path(self.key(code))
+        tmpname = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmpname, 'wb') as f:
+                f.write(data)
+            os.replace(tmpname, path)
+        except OSError:
+            return False
+        self.stores += 1
+        self.evict()
+        return True
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache fits in maxSize"""
+        try:
+            entries = [(entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                       for entry in os.scandir(self.directory) if entry.name.endswith('.ast')]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.maxSize:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'stores': self.stores, 'evictions': self.evictions}
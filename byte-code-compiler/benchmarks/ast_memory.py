@@ -0,0 +1,122 @@
+"""Reports how much memory the abstract syntax tree of a generated module retains,
+with slotted nodes and packed locations, and before them: with a __dict__ per
+node and locations holding their line and column as two strings.
+
+Run from the byte-code-compiler folder:
+    python benchmarks/ast_memory.py
+"""
+import gc
+import os
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer import PS_Lexer, Location
+from parser_tree import parser, count_nodes, PTreeElem
+
+
+class DictLocation:
+    """Location as it was before being packed"""
+
+    def __init__(self, lineno, col) -> None:
+        self.line = str(lineno)
+        self.col = str(col)
+
+
+_dict_classes = {}
+
+
+def dict_class(cls: type) -> type:
+    """Class without slots standing for the node class cls"""
+    klass = _dict_classes.get(cls)
+    if klass is None:
+        klass = _dict_classes[cls] = type(cls.__name__, (), {})
+    return klass
+
+
+def rebuild(tree, node_class, location_class):
+    """Copies the nodes, lists and locations of tree into instances of
+    node_class(type of the node) and location_class, sharing the other leaves"""
+    memo = {}
+    stack = []
+
+    def convert(elem):
+        if isinstance(elem, (PTreeElem, Location)):
+            target = memo.get(id(elem))
+            if target is None:
+                if isinstance(elem, Location):
+                    target = location_class(elem.line, elem.col)
+                else:
+                    target = object.__new__(node_class(type(elem)))
+                    stack.append((elem, target))
+                memo[id(elem)] = target
+            return target
+        if isinstance(elem, list):
+            target = []
+            stack.append((elem, target))
+            return target
+        return elem
+
+    root = convert(tree)
+    while stack:
+        source, target = stack.pop()
+        if isinstance(source, list):
+            target.extend([convert(item) for item in source])
+        else:
+            for name in source.fields():
+                setattr(target, name, convert(getattr(source, name)))
+    return root
+
+
+def retained_by(build) -> tuple:
+    """Result of build() and the memory it retains"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, retained
+
+
+def generate_module(functions: int) -> str:
+    lines = []
+    for i in range(functions):
+        lines.append(f"int f{i}(int a, int_64 b) {{\n")
+        lines.append(f"    int c = a * {i} + b;\n")
+        lines.append(f"    while (c > 0) {{ c -= 1; }}\n")
+        lines.append(f"    return c;\n")
+        lines.append("}\n")
+        lines.append(f"bool g{i} = not (f{i}(1, 2) == 3) or true;\n")
+    return "".join(lines)
+
+
+def parse_args():
+    args = ArgumentParser()
+    args.add_argument("--functions", required=False, type=int, default=2_000,
+                      help="Number of functions in the generated module")
+    return args.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    code = generate_module(args.functions)
+
+    tree, retained = retained_by(lambda: parser.parse(code, lexer=PS_Lexer()))
+    nodes = count_nodes(tree)
+
+    # Both copies share the same leaves (names, operations...), so the
+    # difference of what they retain is the one of the node layouts
+    slotted, slotted_retained = retained_by(lambda: rebuild(tree, lambda cls: cls, Location))
+    del slotted
+    unslotted, unslotted_retained = retained_by(lambda: rebuild(tree, dict_class, DictLocation))
+    del unslotted
+    before = retained + unslotted_retained - slotted_retained
+
+    print(f"{nodes} nodes")
+    print(f"before (__dict__ nodes, string locations): {before / 1024:10.1f}KiB, {before / nodes:6.1f} bytes/node")
+    print(f"after (slotted nodes, packed locations):   {retained / 1024:10.1f}KiB, {retained / nodes:6.1f} bytes/node")
+    print(f"saved: {1 - retained / before:.0%}")
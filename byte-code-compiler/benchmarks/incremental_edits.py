@@ -0,0 +1,80 @@
+"""Times keystrokes on a big source through the incremental document.
+
+Run from the byte-code-compiler folder:
+    python benchmarks/incremental_edits.py [--lines N] [--shape SHAPE] [--edits N]
+Statements are typed one character at a time at random places of a generated
+program, then deleted the same way. Each keystroke is an edit of the document
+returning its diagnostics. The tree of the document is checked against a full
+parse of the final source, and the time of a full parse is given to compare.
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from incremental import IncrementalDocument
+from lexer import PS_Lexer
+from parser_tree import parser
+from program_generator import SHAPES, generate_program
+
+TYPED = ("int typed = v0 + 3;\n", "v1 = f0(v2, 4);\n", "while (v0 < 3) { v0++; }\n")
+
+
+def statement_offsets(code:str) -> list:
+    """Offsets of the lines following a statement or an opening brace, where a
+    statement can be typed"""
+    return [i + 1 for i in range(1, len(code) - 1) if code[i] == '\n' and code[i - 1] in ';{']
+
+
+def parse_args():
+    args = ArgumentParser()
+    args.add_argument("--lines", required=False, type=int, default=50_000,
+                      help="Number of lines of the generated program (default: 50000)")
+    args.add_argument("--shape", required=False, choices=SHAPES, default='mixed',
+                      help="Kind of generated program (default: mixed)")
+    args.add_argument("--edits", required=False, type=int, default=20,
+                      help="Number of statements typed and deleted (default: 20)")
+    args.add_argument("--seed", required=False, type=int, default=0,
+                      help="Seed of the program and of the edits (default: 0)")
+    return args.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    rand = random.Random(args.seed)
+    code = generate_program(args.shape, args.lines, args.seed)
+
+    start = time.perf_counter()
+    parser.parse_compiled(code, lexer=PS_Lexer())
+    full = time.perf_counter() - start
+    start = time.perf_counter()
+    document = IncrementalDocument(code)
+    opened = time.perf_counter() - start
+    print(f"{args.lines} lines: full parse {full * 1000:.0f}ms, document opened in {opened * 1000:.0f}ms "
+          f"({len(document.chunks)} chunks)")
+
+    latencies = []
+    offsets = statement_offsets(code)
+    for _ in range(args.edits):
+        offset = rand.choice(offsets)
+        typed = rand.choice(TYPED)
+        for i, char in enumerate(typed):
+            start = time.perf_counter()
+            document.edit(offset + i, 0, char)
+            latencies.append(time.perf_counter() - start)
+        for i in reversed(range(len(typed))):
+            start = time.perf_counter()
+            document.edit(offset + i, 1, '')
+            latencies.append(time.perf_counter() - start)
+
+    if document.code != code or document.diagnostics():
+        sys.exit("The edits did not give the source back")
+    if repr(document.module()) != repr(parser.parse_compiled(code, lexer=PS_Lexer())):
+        sys.exit("The tree of the document differs from a full parse")
+    latencies.sort()
+    print(f"{len(latencies)} keystrokes: median {statistics.median(latencies) * 1000:.2f}ms, "
+          f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.2f}ms, max {latencies[-1] * 1000:.2f}ms")
@@ -0,0 +1,82 @@
+"""Measures the typing stage after a one function edit, with and without the
+typing cache.
+
+Run from the byte-code-compiler folder:
+    python benchmarks/incremental_typing.py [--lines N] [--shape SHAPE] [--repeat N]
+The program is checked once to fill the cache, then each run edits the body of
+one function in the middle of the program and types it again: from scratch, and
+with the cache which only checks the edited body, annotating the other ones
+from it or not (as when only typing, -C T). Parsing is not timed.
+"""
+import gc
+import os
+import re
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer import PS_Lexer
+from parser_tree import parser
+from program_generator import SHAPES, generate_program
+from type_checker import check_module
+from typing_cache import TypingCache
+
+
+def edit_body(code:str, run:int) -> str:
+    """code with a return of a function in its middle changed"""
+    returns = [match.start() for match in re.finditer(r'\breturn ', code)]
+    position = returns[len(returns) // 2] + len('return ')
+    return code[:position] + f"{run} + " + code[position:]
+
+
+def parse_args():
+    args = ArgumentParser()
+    args.add_argument("--lines", required=False, type=int, default=40_000,
+                      help="Number of lines of the generated program (default: 40000)")
+    args.add_argument("--shape", required=False, choices=SHAPES, default='typed',
+                      help="Kind of generated program (default: typed)")
+    args.add_argument("--repeat", required=False, type=int, default=3,
+                      help="Number of edits, the best time is kept (default: 3)")
+    return args.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    code = generate_program(args.shape, args.lines)
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'program.psc')
+        cache = TypingCache(directory)
+        cache.check(source, code, parser.parse_compiled(code, lexer=PS_Lexer()))
+        filled = cache.stats()
+        # Same entry, its bodies are left out of the counts
+        unannotated_cache = TypingCache(directory)
+        full = incremental = unannotated = float('inf')
+        # As in driver._compile, which types without the collector
+        gc.disable()
+        for run in range(1, args.repeat + 1):
+            code = edit_body(code, run)
+            tree = parser.parse_compiled(code, lexer=PS_Lexer())
+            gc.collect()
+            start = time.perf_counter()
+            check_module(tree)
+            full = min(full, time.perf_counter() - start)
+            tree = parser.parse_compiled(code, lexer=PS_Lexer())
+            gc.collect()
+            start = time.perf_counter()
+            cache.check(source, code, tree)
+            incremental = min(incremental, time.perf_counter() - start)
+            tree = parser.parse_compiled(code, lexer=PS_Lexer())
+            gc.collect()
+            start = time.perf_counter()
+            unannotated_cache.check(source, code, tree, annotate=False)
+            unannotated = min(unannotated, time.perf_counter() - start)
+        gc.enable()
+    # Bodies checked and reused by each edit
+    checked = (cache.checked - filled['checked bodies']) / args.repeat
+    reused = (cache.reused - filled['reused bodies']) / args.repeat
+    print(f"{args.shape:>12} {args.lines:8} lines  full {full * 1000:8.1f}ms  incremental {incremental * 1000:8.1f}ms"
+          f"  not annotated {unannotated * 1000:8.1f}ms"
+          f"  {checked:.0f} bodies checked, {reused:.0f} reused", flush=True)
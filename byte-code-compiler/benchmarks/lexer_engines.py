@@ -0,0 +1,77 @@
+"""Compares the token throughput of the lexer engines, and checks they agree.
+
+Run from the byte-code-compiler folder:
+    python benchmarks/lexer_engines.py [--lines N] [--shapes ...] [--repeat N]
+Every engine lexes the same generated programs, with lexCode (a token object
+per token) and lexBuffer. The token streams of every engine are compared to
+the ones of the PLY engine first, the script fails if they differ.
+"""
+import gc
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer import PS_Lexer
+from program_generator import SHAPES, generate_program
+
+
+def lex_code(lexer:PS_Lexer, code:str) -> int:
+    count = 0
+    for _ in lexer.lexCode(code):
+        count += 1
+    return count
+
+
+def lex_buffer(lexer:PS_Lexer, code:str) -> int:
+    return len(lexer.lexBuffer(code))
+
+
+def tokens(lexer:PS_Lexer, code:str) -> list:
+    return [(str(tok), tok.col) for tok in lexer.lexCode(code)] + [str(tok) for tok in lexer.lexBuffer(code)]
+
+
+def best_time(run, lexer:PS_Lexer, code:str, repeat:int) -> tuple:
+    best = float('inf')
+    count = 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        count = run(lexer, code)
+        best = min(best, time.perf_counter() - start)
+    return count, best
+
+
+def parse_args():
+    args = ArgumentParser()
+    args.add_argument("--lines", required=False, type=int, default=10_000,
+                      help="Number of lines of each generated program (default: 10000)")
+    args.add_argument("--shapes", required=False, nargs='+', choices=SHAPES, default=list(SHAPES),
+                      help="Kinds of generated programs (default: all)")
+    args.add_argument("--repeat", required=False, type=int, default=3,
+                      help="Number of timed runs, the best one is kept (default: 3)")
+    return args.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    # PLY first: the speedups are relative to its lexCode
+    lexers = {engine: PS_Lexer(engine) for engine in sorted(PS_Lexer.ENGINES, key=lambda engine: engine != 'ply')}
+    reference = lexers['ply']
+    for shape in args.shapes:
+        code = generate_program(shape, args.lines)
+        expected = tokens(reference, code)
+        for engine, lexer in lexers.items():
+            if lexer is not reference and tokens(lexer, code) != expected:
+                sys.exit(f"The {engine} engine does not give the tokens of the ply engine on {shape}")
+
+        base = None
+        for engine, lexer in lexers.items():
+            for name, run in (("lexCode", lex_code), ("lexBuffer", lex_buffer)):
+                count, seconds = best_time(run, lexer, code, args.repeat)
+                if base is None:
+                    base = seconds
+                print(f"{shape:>12} {engine:<9} {name:<10} {seconds:8.3f}s  {count / seconds:10.0f} tokens/s"
+                      f"  x{base / seconds:5.2f}", flush=True)
@@ -0,0 +1,72 @@
+"""Compares the tokens/sec of parser.parse and parser.parse_compiled.
+
+Run from the byte-code-compiler folder:
+    python benchmarks/parser_throughput.py [FILE ...]
+The given files (by default test_files/parsing/good) are concatenated many times
+and lexed once into a TokenBuffer, so only the parsing loop is timed. Files the
+parser rejects are skipped; if none is left a generated module is used instead.
+"""
+import glob
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lexer import PS_Lexer
+from parser_tree import parser
+from ast_memory import generate_module
+
+
+def load_corpus(paths) -> str:
+    parts = []
+    for path in paths:
+        with open(path, 'r') as f:
+            code = f.read()
+        try:
+            parser.parse(code, lexer=PS_Lexer())
+        except SyntaxError:
+            print(f"Skipping {path}: rejected by the parser")
+            continue
+        parts.append(code)
+    if not parts:
+        print("No usable file, using a generated module")
+        parts.append(generate_module(20))
+    return "\n".join(parts)
+
+
+def time_parse(parse, buffer, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        buffer.input()
+        start = time.perf_counter()
+        parse(lexer=buffer)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def parse_args():
+    args = ArgumentParser()
+    args.add_argument("files", metavar='FILE', nargs='*',
+                      default=sorted(glob.glob(os.path.join(ROOT, 'test_files', 'parsing', 'good', '*.psc'))),
+                      help="Code files making the corpus")
+    args.add_argument("--copies", required=False, type=int, default=200,
+                      help="Number of times the corpus is concatenated")
+    args.add_argument("--repeat", required=False, type=int, default=5,
+                      help="Number of timed runs, the best one is kept")
+    return args.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    code = "\n".join([load_corpus(args.files)] * args.copies)
+    buffer = PS_Lexer().lexBuffer(code)
+
+    elapsed = time_parse(parser.parse, buffer, args.repeat)
+    print(f"parse:          {len(buffer) / elapsed:12.0f} tokens/sec")
+
+    buffer.emitTypeIds = True
+    elapsed_compiled = time_parse(parser.parse_compiled, buffer, args.repeat)
+    print(f"parse_compiled: {len(buffer) / elapsed_compiled:12.0f} tokens/sec ({elapsed / elapsed_compiled:.2f}x)")
@@ -0,0 +1,165 @@
+"""Generates valid P# programs of a given size and shape for the benchmarks.
+
+Run from the byte-code-compiler folder:
+    python benchmarks/program_generator.py SHAPE LINES [--seed N] [-o FILE]
+The same shape, size and seed always give the same program.
+"""
+import random
+import sys
+import textwrap
+from argparse import ArgumentParser
+
+TYPES = ('int', 'int_16', 'int_32', 'int_64', 'bool', 'float_32', 'char')
+BIN_OPS = ('+', '-', '*', '/', '%', '&', '|', '^')
+CMP_OPS = ('==', '!=', '<', '>', '<=', '>=')
+ASSIGN_OPS = ('=', '+=', '-=', '*=', '|=', '^=')
+
+
+class ProgramGenerator:
+    """Writes a program of about `lines` lines, one statement per line"""
+
+    def __init__(self, lines:int, seed:int=0) -> None:
+        self.lines = lines
+        self.random = random.Random(seed)
+        self.out = []
+
+    def variable(self, count:int=8) -> str:
+        return f"v{self.random.randrange(count)}"
+
+    def operand(self) -> str:
+        choice = self.random.randrange(6)
+        if choice == 0:
+            return str(self.random.randrange(1000))
+        if choice == 1:
+            return f"0x{self.random.randrange(1 << 16):X}"
+        if choice == 2:
+            return f"f{self.random.randrange(4)}({self.variable()}, {self.random.randrange(10)})"
+        if choice == 3:
+            return f"{self.variable()}[{self.random.randrange(10)}]"
+        return self.variable()
+
+    def expression(self, operands:int) -> str:
+        parts = [self.operand()]
+        for i in range(1, operands):
+            parts.append(self.random.choice(BIN_OPS))
+            if i % 5 == 4:
+                parts.append(f"({self.operand()} - {self.operand()})")
+            else:
+                parts.append(self.operand())
+        return " ".join(parts)
+
+    def condition(self) -> str:
+        return f"{self.variable()} {self.random.choice(CMP_OPS)} {self.random.randrange(100)}"
+
+    def statement(self) -> str:
+        choice = self.random.randrange(4)
+        if choice == 0:
+            return f"{self.random.choice(TYPES)} {self.variable(64)} = {self.expression(3)};"
+        if choice == 1:
+            return f"{self.variable()} {self.random.choice(ASSIGN_OPS)} {self.expression(4)};"
+        if choice == 2:
+            return f"{self.variable()}++;"
+        return f"{self.variable()} = f{self.random.randrange(4)}({self.expression(2)}, {self.variable()});"
+
+    # Shapes: each one appends whole top level declarations until the size is reached
+
+    def functions(self, index:int) -> None:
+        self.out.append(f"int func{index}(int v0, int_64 v1, bool v2) {{")
+        for _ in range(self.random.randrange(3, 12)):
+            self.out.append("    " + self.statement())
+        self.out.append(f"    while ({self.condition()}) {{ {self.statement()} }}")
+        self.out.append(f"    return {self.expression(3)};")
+        self.out.append("}")
+
+    def nesting(self, index:int) -> None:
+        depth = self.random.randrange(8, 32)
+        self.out.append(f"void nested{index}(int v0, int v1) {{")
+        for level in range(depth):
+            indent = "    " * (level + 1)
+            if level % 2 == 0:
+                self.out.append(f"{indent}while ({self.condition()}) {{")
+            else:
+                self.out.append(f"{indent}if ({self.condition()}) {{ {self.statement()} }} else {{")
+            self.out.append(f"{indent}    {self.statement()}")
+        for level in reversed(range(depth)):
+            self.out.append("    " * (level + 1) + "}")
+        self.out.append("}")
+
+    def expressions(self, index:int) -> None:
+        # Long expressions are wrapped so that lines stay comparable between shapes
+        code = f"int expr{index} = {self.expression(self.random.randrange(50, 200))};"
+        self.out.extend(textwrap.wrap(code, width=80, break_long_words=False, subsequent_indent="    "))
+
+    def classes(self, index:int) -> None:
+        self.out.append(f"class Class{index} {{")
+        for i in range(self.random.randrange(20, 60)):
+            self.out.append(f"    {self.random.choice(TYPES)} field{i};")
+            if i % 10 == 9:
+                self.out.append(f"    int method{i}(int v0) {{ {self.statement()} return v0; }}")
+        self.out.append("}")
+
+    def typed(self, index:int) -> None:
+        # Declares every name it uses and only calls functions declared before,
+        # so the whole program type checks
+        self.out.append(f"int_32 typed{index}(int_32 v0, int_64 v1, bool v2) {{")
+        for i in range(3, 8):
+            self.out.append(f"    int_64 v{i} = {self.random.randrange(1000)};")
+
+        def operand() -> str:
+            choice = self.random.randrange(5)
+            if choice == 0:
+                return str(self.random.randrange(1000))
+            if choice == 1 and index:
+                return f"typed{self.random.randrange(index)}(v0, v{self.random.choice((1, 3, 4))}, v2)"
+            return f"v{self.random.choice((0, 1, 3, 4, 5, 6, 7))}"
+
+        for _ in range(self.random.randrange(3, 12)):
+            parts = [operand()]
+            for _ in range(self.random.randrange(1, 5)):
+                parts.append(self.random.choice(BIN_OPS))
+                parts.append(operand())
+            self.out.append(f"    v{self.random.choice((1, 3, 4, 5, 6, 7))} {self.random.choice(ASSIGN_OPS)} {' '.join(parts)};")
+        self.out.append(f"    while (v0 < {self.random.randrange(100)} and v2) {{ v0++; }}")
+        self.out.append(f"    return v0 + {self.random.randrange(100)};")
+        self.out.append("}")
+
+    def mixed(self, index:int) -> None:
+        getattr(self, self.random.choice(('functions', 'nesting', 'expressions', 'classes')))(index)
+
+    def generate(self, shape:str) -> str:
+        if shape not in SHAPES:
+            raise ValueError(f"Unknown shape {shape}, expected one of {', '.join(SHAPES)}")
+        build = getattr(self, shape)
+        index = 0
+        while len(self.out) < self.lines:
+            build(index)
+            index += 1
+        return "\n".join(self.out) + "\n"
+
+
+SHAPES = ('functions', 'nesting', 'expressions', 'classes', 'mixed', 'typed')
+
+
+def generate_program(shape:str, lines:int, seed:int=0) -> str:
+    return ProgramGenerator(lines, seed).generate(shape)
+
+
+def parse_args():
+    args = ArgumentParser()
+    args.add_argument("shape", choices=SHAPES, help="Kind of code generated")
+    args.add_argument("lines", type=int, help="Approximate number of lines of the program")
+    args.add_argument("--seed", required=False, type=int, default=0,
+                      help="Seed of the random choices (default: 0)")
+    args.add_argument("-o", "--output", required=False, default=None,
+                      help="File written, the program is printed when not given")
+    return args.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    program = generate_program(args.shape, args.lines, args.seed)
+    if args.output is None:
+        sys.stdout.write(program)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(program)
@@ -0,0 +1,96 @@
+"""Checks that parsing a module scales linearly with its number of statements,
+in time and in peak memory.
+
+Run from the byte-code-compiler folder:
+    python benchmarks/statement_list_scaling.py
+Exits with a non zero status when the time per statement of the biggest module
+grows more than --max-ratio times over the one of the smallest module, or its
+peak memory per statement more than --max-memory-ratio times.
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer import PS_Lexer
+from parser_tree import parser
+
+
+def generate_statements(count: int) -> str:
+    lines = []
+    for i in range(count):
+        if i % 2 == 0:
+            lines.append(f"int v{i} = {i} + x;\n")
+        else:
+            lines.append(f"x = v{i-1};\n")
+    return "".join(lines)
+
+
+def time_parse(code: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            parser.parse(code, lexer=PS_Lexer())
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def peak_parse_memory(code: str) -> int:
+    """Peak of the memory allocated while parsing code, apart from code itself"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        parser.parse(code, lexer=PS_Lexer())
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def parse_args():
+    args = ArgumentParser()
+    args.add_argument("--sizes", required=False, type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                      help="Number of statements of each generated module")
+    args.add_argument("--max-ratio", required=False, type=float, default=2.0, dest='max_ratio',
+                      help="Maximum allowed growth of the time per statement between the smallest and biggest module")
+    args.add_argument("--max-memory-ratio", required=False, type=float, default=1.5, dest='max_memory_ratio',
+                      help="Maximum allowed growth of the peak memory per statement between the smallest and biggest module")
+    return args.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    sizes = sorted(args.sizes)
+    per_statement = {}
+    memory_per_statement = {}
+    for size in sizes:
+        code = generate_statements(size)
+        elapsed = time_parse(code, repeat=max(1, min(5, 100_000 // size)))
+        # Measured on its own parse: tracing allocations slows parsing down
+        peak = peak_parse_memory(code)
+        per_statement[size] = elapsed / size
+        memory_per_statement[size] = peak / size
+        print(f"{size:>8} statements: {elapsed:8.3f}s total, {per_statement[size] * 1e6:8.2f}us/statement, "
+              f"{peak / 2**20:8.1f}MiB peak, {memory_per_statement[size]:8.1f}B/statement")
+
+    ratio = per_statement[sizes[-1]] / per_statement[sizes[0]]
+    memory_ratio = memory_per_statement[sizes[-1]] / memory_per_statement[sizes[0]]
+    print(f"Time per statement ratio ({sizes[-1]} vs {sizes[0]}): {ratio:.2f}")
+    print(f"Peak memory per statement ratio ({sizes[-1]} vs {sizes[0]}): {memory_ratio:.2f}")
+    failed = False
+    if ratio > args.max_ratio:
+        print(f"Parsing time does not scale linearly (ratio above {args.max_ratio})")
+        failed = True
+    if memory_ratio > args.max_memory_ratio:
+        print(f"Parsing memory does not scale linearly (ratio above {args.max_memory_ratio})")
+        failed = True
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,63 @@
+"""Compares the peak memory of parsing a whole module with streaming its declarations.
+
+Run from the byte-code-compiler folder:
+    python benchmarks/streaming_memory.py [--lines N] [--shape SHAPE]
+Both runs parse the same token buffer. The streaming run drops each declaration
+once it got it, like a pipelined later stage would.
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer import PS_Lexer
+from parser_tree import parser, parse_declarations
+from program_generator import SHAPES, generate_program
+
+
+def measure(run) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = run()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def parse_module(buffer) -> int:
+    buffer.input()
+    module = parser.parse_compiled(lexer=buffer)
+    return len(module.classDecl) + len(module.funcDecl) + len(module.varDecl) + len(module.statements)
+
+
+def stream_declarations(buffer) -> int:
+    buffer.input()
+    count = 0
+    for _ in parse_declarations(lexer=buffer):
+        count += 1
+    return count
+
+
+def parse_args():
+    args = ArgumentParser()
+    args.add_argument("--lines", required=False, type=int, default=20_000,
+                      help="Number of lines of the generated module")
+    args.add_argument("--shape", required=False, choices=SHAPES, default='functions',
+                      help="Kind of generated module")
+    return args.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    buffer = PS_Lexer().lexBuffer(generate_program(args.shape, args.lines))
+    buffer.emitTypeIds = True
+
+    for name, run in (("parse_compiled", parse_module), ("parse_declarations", stream_declarations)):
+        count, elapsed, peak = measure(lambda: run(buffer))
+        print(f"{name:<20} {count} declarations  {elapsed:7.3f}s  peak {peak / 1024 / 1024:8.2f}MiB")
@@ -0,0 +1,192 @@
+"""Times every stage of the compiler on generated programs and compares runs.
+
+Run from the byte-code-compiler folder:
+    python benchmarks/suite.py run [--shapes ...] [--sizes ...] [-o results.json]
+    python benchmarks/suite.py compare BASELINE.json RESULTS.json [--threshold 0.1]
+`run` stores the best time of each stage for each generated program in a JSON
+file. `compare` exits with a non zero status when a stage of RESULTS is slower
+than in BASELINE by more than the threshold (a fraction of the baseline time).
+`run --baseline FILE` runs and compares in one go.
+"""
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constant_folding import fold_constants
+from lexer import PS_Lexer
+from parser_tree import parser, count_nodes
+from program_generator import SHAPES, generate_program
+from type_checker import check_module
+
+
+class Case:
+    """A generated program, and what the stages already computed from it"""
+
+    def __init__(self, shape:str, lines:int, seed:int) -> None:
+        self.shape = shape
+        self.lines = lines
+        self.code = generate_program(shape, lines, seed)
+        self.lexer = PS_Lexer()
+        self.buffer = self.lexer.lexBuffer(self.code)
+        self.tokens = len(self.buffer)
+        self.tree = None
+
+
+# Each stage returns the number of nodes it produced, or None. They are run in
+# this order, so a stage can use what the previous ones stored in the case.
+
+def stage_lex(case:Case):
+    for _ in case.lexer.lexCode(case.code):
+        pass
+
+
+def stage_lex_buffer(case:Case):
+    case.lexer.lexBuffer(case.code)
+
+
+def stage_parse(case:Case):
+    return count_nodes(parser.parse(case.code, lexer=case.lexer))
+
+
+def stage_parse_compiled(case:Case):
+    case.buffer.input()
+    case.buffer.emitTypeIds = True
+    case.tree = parser.parse_compiled(lexer=case.buffer)
+    case.buffer.emitTypeIds = False
+    return count_nodes(case.tree)
+
+
+def stage_typing(case:Case):
+    check_module(case.tree)
+
+
+def stage_folding(case:Case):
+    # Only the first run folds anything, the next ones walk the folded tree
+    fold_constants(case.tree)
+
+
+STAGES = {
+    'lex': stage_lex,
+    'lex_buffer': stage_lex_buffer,
+    'parse': stage_parse,
+    'parse_compiled': stage_parse_compiled,
+    'typing': stage_typing,
+    'folding': stage_folding,
+}
+
+
+def time_stage(stage, case:Case, repeat:int):
+    best = float('inf')
+    nodes = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        nodes = stage(case)
+        best = min(best, time.perf_counter() - start)
+    return best, nodes
+
+
+def run(shapes, sizes, stages, repeat:int, seed:int) -> dict:
+    results = {}
+    for shape in shapes:
+        for lines in sizes:
+            case = Case(shape, lines, seed)
+            # Big programs are only timed once, they take long enough to be stable
+            case_repeat = max(1, min(repeat, 100_000 // lines))
+            measures = results[f"{shape}/{lines}"] = {}
+            for name in stages:
+                seconds, nodes = time_stage(STAGES[name], case, case_repeat)
+                measure = {'seconds': seconds, 'tokens': case.tokens, 'tokensPerSec': case.tokens / seconds}
+                if nodes is not None:
+                    measure['nodes'] = nodes
+                    measure['nodesPerSec'] = nodes / seconds
+                measures[name] = measure
+                print(f"{shape:>12} {lines:>8} lines  {name:<15} {seconds:9.3f}s  {case.tokens / seconds:10.0f} tokens/s",
+                      flush=True)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline:dict, current:dict, threshold:float) -> list:
+    """Prints the time ratio of each stage measured in both runs, returns the regressions"""
+    regressions = []
+    for case, measures in sorted(current['results'].items()):
+        for stage, measure in sorted(measures.items()):
+            base = baseline['results'].get(case, {}).get(stage)
+            if base is None:
+                print(f"{case:>20} {stage:<15} not in the baseline")
+                continue
+            ratio = measure['seconds'] / base['seconds']
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = "  REGRESSION"
+                regressions.append((case, stage, ratio))
+            print(f"{case:>20} {stage:<15} {base['seconds']:9.3f}s -> {measure['seconds']:9.3f}s  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def parse_args():
+    args = ArgumentParser()
+    commands = args.add_subparsers(dest='command', required=True)
+
+    run_args = commands.add_parser('run', help="Times the stages on generated programs")
+    run_args.add_argument("--shapes", required=False, nargs='+', choices=SHAPES, default=list(SHAPES),
+                          help="Kinds of generated programs (default: all)")
+    run_args.add_argument("--sizes", required=False, type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                          help="Number of lines of the generated programs (default: 1000 10000 100000)")
+    run_args.add_argument("--stages", required=False, nargs='+', choices=list(STAGES), default=list(STAGES),
+                          help="Stages timed (default: all)")
+    run_args.add_argument("--repeat", required=False, type=int, default=3,
+                          help="Number of timed runs of small programs, the best one is kept (default: 3)")
+    run_args.add_argument("--seed", required=False, type=int, default=0,
+                          help="Seed of the program generator (default: 0)")
+    run_args.add_argument("-o", "--output", required=False, default=None,
+                          help="JSON file the results are written to")
+    run_args.add_argument("--baseline", required=False, default=None,
+                          help="JSON results the new ones are compared to")
+    run_args.add_argument("--threshold", required=False, type=float, default=0.1,
+                          help="Slowdown over which a stage is a regression, as a fraction (default: 0.1)")
+
+    compare_args = commands.add_parser('compare', help="Compares two JSON results")
+    compare_args.add_argument("baseline", help="Reference JSON results")
+    compare_args.add_argument("current", help="JSON results checked against the baseline")
+    compare_args.add_argument("--threshold", required=False, type=float, default=0.1,
+                              help="Slowdown over which a stage is a regression, as a fraction (default: 0.1)")
+    return args.parse_args()
+
+
+def load(path:str) -> dict:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.command == 'run':
+        current = run(args.shapes, args.sizes, args.stages, args.repeat, args.seed)
+        if args.output is not None:
+            with open(args.output, 'w') as f:
+                json.dump(current, f, indent=2)
+        baseline = load(args.baseline) if args.baseline is not None else None
+    else:
+        current = load(args.current)
+        baseline = load(args.baseline)
+
+    if baseline is not None:
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} stage(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
@@ -0,0 +1,62 @@
+"""Measures how many expressions per second the typing stage checks.
+
+Run from the byte-code-compiler folder:
+    python benchmarks/typing_throughput.py [--lines N] [--shapes ...] [--repeat N] [--jobs N]
+Each generated program is parsed once, then typed several times and the best
+time is kept. Only the 'typed' shape is well typed: the other ones use names
+they never declare, so most of their time goes to reporting errors.
+"""
+import gc
+import os
+import sys
+import time
+from argparse import ArgumentParser
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lexer import PS_Lexer
+from parser_tree import PExpression, PTernary, PTreeElem, parser
+from program_generator import SHAPES, generate_program
+from type_checker import check_module
+
+
+def count_expressions(tree) -> int:
+    count = 0
+    stack = [tree]
+    while stack:
+        elem = stack.pop()
+        if isinstance(elem, list):
+            stack.extend(elem)
+        elif isinstance(elem, PTreeElem):
+            if isinstance(elem, (PExpression, PTernary)):
+                count += 1
+            stack.extend(getattr(elem, name) for name in elem.fields())
+    return count
+
+
+def parse_args():
+    args = ArgumentParser()
+    args.add_argument("--lines", required=False, type=int, default=20_000,
+                      help="Number of lines of each generated program (default: 20000)")
+    args.add_argument("--shapes", required=False, nargs='+', choices=SHAPES, default=['typed'],
+                      help="Kinds of generated programs (default: typed)")
+    args.add_argument("--repeat", required=False, type=int, default=3,
+                      help="Number of timed runs, the best one is kept (default: 3)")
+    args.add_argument("--jobs", required=False, type=int, default=1,
+                      help="Number of forked processes checking the function bodies, as --typing-jobs (default: 1)")
+    return args.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    for shape in args.shapes:
+        tree = parser.parse_compiled(generate_program(shape, args.lines), lexer=PS_Lexer())
+        expressions = count_expressions(tree)
+        best = float('inf')
+        for _ in range(args.repeat):
+            gc.collect()
+            start = time.perf_counter()
+            errors = check_module(tree, args.jobs)
+            best = min(best, time.perf_counter() - start)
+        print(f"{shape:>12} {expressions:8} expressions {best:8.3f}s  {expressions / best:10.0f} expressions/s"
+              f"  {len(errors)} errors", flush=True)
@@ -0,0 +1,487 @@
+"""Constant folding: evaluates at compile time the expressions of a typed module
+whose operands are all constants, and replaces them by literals.
+
+Values are computed in the type the typing stage gives the expression: integers
+wrap around at the width of their type, unsigned ones stay positive and float_32
+results are rounded to single precision. Divisions by zero, out of range shifts
+and casts of floats which do not fit their integer type are left to run time.
+
+Globals initialized with a constant and never assigned afterwards are constants
+too, when no code can run before their initialization: no module statement
+before their declaration calls a function or builds an object.
+"""
+import math
+import struct
+
+from operations import UnaryOperation
+from parser_tree import (PAssert, PAssign, PBinOp, PBreak, PCall, PCast, PContinue, PCopyAssign, PDot, PExpression,
+                         PFor, PForeach, PIdentifier, PIf, PIndex, PNewArray, PNewObj, PNumeric, PReturn, PScope, PSkip,
+                         PString, PTernary, PTreeElem, PType, PUnOp, PUType, PVarDecl, PWhile)
+from symbols import GLOBAL
+from type_checker import ARITHMETIC, BITWISE, COMPARISON, EQUALITY, LOGICAL, OPERATOR_KINDS
+from type_system import (BOOL, BOOL_TYPE, ERROR_TYPE, FLOAT, FLOAT32_TYPE, FLOAT64_TYPE, INT, INT32_TYPE, INT64_TYPE,
+                         TYPE_NAMES, UNSIGNED_TYPE_NAMES, Type, integer_range)
+
+
+def wrap(value:int, typ:Type) -> int:
+    """value as an integer of type typ holds it, in two's complement"""
+    bits = typ.bits
+    value &= (1 << bits) - 1
+    if typ.signed and value >> (bits - 1):
+        value -= 1 << bits
+    return value
+
+
+def round_float(value:float, typ:Type):
+    """value rounded to the precision of typ, None if it overflows"""
+    if typ is FLOAT32_TYPE:
+        try:
+            value = struct.unpack('f', struct.pack('f', value))[0]
+        except OverflowError:
+            return None
+    return value if math.isfinite(value) else None
+
+
+def convert(value, source:Type, target:Type):
+    """value of type source converted (implicitly or by a cast) to target, None
+    when the conversion is left to run time"""
+    if target is source:
+        return value
+    kind = target.kind
+    if kind == BOOL:
+        return value != 0
+    if kind == INT:
+        if source.kind == FLOAT:
+            if not math.isfinite(value):
+                return None
+            value = int(value)
+            low, high = integer_range(target)
+            return value if low <= value <= high else None
+        return wrap(int(value), target)
+    if kind == FLOAT:
+        return round_float(float(value), target)
+    return None
+
+
+def divide(left:int, right:int) -> int:
+    """Integer division rounding toward zero"""
+    quotient = abs(left) // abs(right)
+    return -quotient if (left < 0) != (right < 0) else quotient
+
+
+def evaluate_arithmetic(op:str, left, right, typ:Type):
+    if typ.kind == INT:
+        if op == 'PLUS':
+            value = left + right
+        elif op == 'MINUS':
+            value = left - right
+        elif op == 'TIMES':
+            value = left * right
+        elif right == 0:
+            return None
+        elif op == 'DIVIDE':
+            value = divide(left, right)
+        else:
+            # The remainder has the sign of the dividend
+            value = left - right * divide(left, right)
+        return wrap(value, typ)
+    if op == 'PLUS':
+        value = left + right
+    elif op == 'MINUS':
+        value = left - right
+    elif op == 'TIMES':
+        value = left * right
+    elif right == 0:
+        return None
+    elif op == 'DIVIDE':
+        value = left / right
+    else:
+        value = math.fmod(left, right)
+    return round_float(value, typ)
+
+
+def evaluate_comparison(op:str, left, right) -> bool:
+    if op == 'BOOL_EQ':
+        return left == right
+    if op == 'BOOL_NEQ':
+        return left != right
+    if op == 'BOOL_GEQ':
+        return left >= right
+    if op == 'BOOL_LEQ':
+        return left <= right
+    if op == 'BOOL_GT':
+        return left > right
+    return left < right
+
+
+def evaluate_bitwise(op:str, left, right, typ:Type):
+    if op == 'LOGIC_AND':
+        value = left & right
+    elif op == 'LOGIC_OR':
+        value = left | right
+    else:
+        value = left ^ right
+    return bool(value) if typ is BOOL_TYPE else wrap(value, typ)
+
+
+def is_literal(node) -> bool:
+    if node.__class__ is PNumeric:
+        return True
+    if node.__class__ is not PExpression:
+        return False
+    value = node.rvalue
+    return value.__class__ is PNumeric or value is True or value is False
+
+
+class ConstantFolder:
+    def __init__(self) -> None:
+        # (value, Type) of the constant globals, by Variable
+        self.constants = {}
+        self.folded = 0
+        # Variables assigned anywhere, and the names of the assigned identifiers
+        # the typing stage did not resolve
+        self.assigned = set()
+        # Globals read by the code being folded
+        self.reads = set()
+        # Whether the code folded since it was reset calls a function or builds an object
+        self.calls = False
+        self.expressionRules = {
+            PExpression: self.foldValue,
+            PNumeric: self.foldNumber,
+            PString: self.foldNothing,
+            PBinOp: self.foldBinOp,
+            PAssign: self.foldAssign,
+            PCopyAssign: self.foldAssign,
+            PUnOp: self.foldUnOp,
+            PCall: self.foldCall,
+            PCast: self.foldCast,
+            PIndex: self.foldIndex,
+            PDot: self.foldDot,
+            PIdentifier: self.foldNothing,
+            PNewArray: self.foldNewArray,
+            PNewObj: self.foldNewObj,
+            PTernary: self.foldTernary,
+        }
+        self.statementRules = {
+            PVarDecl: self.foldNothing,
+            PIf: self.foldIf,
+            PWhile: self.foldWhile,
+            PFor: self.foldFor,
+            PForeach: self.foldForeach,
+            PReturn: self.foldReturn,
+            PBreak: self.foldNothing,
+            PContinue: self.foldNothing,
+            PAssert: self.foldAssert,
+            PScope: self.foldScope,
+            PSkip: self.foldNothing,
+        }
+
+    def foldModule(self, module) -> None:
+        # Which globals are never assigned is only known once all the module is
+        # folded: the code reading the constant ones is folded again after
+        self.foldStatements(module.statements)
+        units = [node.inner_scope for node in module.classDecl]
+        units.extend(node.body for node in module.funcDecl)
+        readers = []
+        for unit in units:
+            self.reads = set()
+            self.foldScope(unit)
+            if self.reads:
+                readers.append((unit, self.reads))
+        self.foldGlobals(module.statements)
+        if self.constants:
+            for unit, reads in readers:
+                if not reads.isdisjoint(self.constants):
+                    self.foldScope(unit)
+
+    def foldGlobals(self, statements:list) -> None:
+        """Folds the module statements again, with the values of the constant
+        globals declared before, and finds the constant globals"""
+        self.calls = False
+        for i, statement in enumerate(statements):
+            if statement.__class__ is not PAssign or statement.left.__class__ is not PVarDecl:
+                statements[i] = self.foldStatement(statement)
+                continue
+            value = statement.rvalue
+            constant = self.expressionRules[value.__class__](value)
+            if constant is None:
+                continue
+            if not is_literal(value):
+                statement.rvalue = self.literal(value, constant)
+            variable = getattr(statement.left.id, 'symbol', None)
+            if variable is None or self.calls or variable in self.assigned or variable.name in self.assigned:
+                continue
+            value = convert(constant[0], constant[1], variable.type)
+            if value is not None:
+                self.constants[variable] = (value, variable.type)
+
+    def literal(self, node, constant:tuple) -> PExpression:
+        """Literal node replacing node, whose value is constant"""
+        value, typ = constant
+        location = node.location
+        if typ is BOOL_TYPE:
+            literal = PExpression(location, value)
+        else:
+            number = PNumeric(location, value)
+            number.type = typ
+            literal = PExpression(location, number)
+        literal.type = typ
+        return literal
+
+    def foldChild(self, node):
+        """node, or the literal replacing it if it is constant"""
+        constant = self.expressionRules[node.__class__](node)
+        if constant is None or is_literal(node):
+            return node
+        return self.literal(node, constant)
+
+    def foldList(self, items:list) -> None:
+        """Folds the expressions of an ExprList in place"""
+        stack = [items]
+        while stack:
+            items = stack.pop()
+            for i, item in enumerate(items):
+                if item.__class__ is list:
+                    stack.append(item)
+                elif isinstance(item, PTreeElem):
+                    items[i] = self.foldChild(item)
+
+    def foldNothing(self, node) -> None:
+        return None
+
+    # Statements, each rule folds the expressions of the statement in place
+
+    def foldStatement(self, node):
+        """node, or the literal replacing it if it is a constant expression"""
+        rule = self.statementRules.get(node.__class__)
+        if rule is None:
+            return self.foldChild(node)
+        rule(node)
+        return node
+
+    def foldStatements(self, statements:list) -> None:
+        for i, statement in enumerate(statements):
+            statements[i] = self.foldStatement(statement)
+
+    def foldScope(self, node:PScope) -> None:
+        self.foldStatements(node.statements)
+        for decl in node.funcDecl:
+            self.foldScope(decl.body)
+
+    def foldIf(self, node:PIf) -> None:
+        node.condition = self.foldChild(node.condition)
+        self.foldScope(node.if_true)
+        if node.if_false is not None:
+            node.if_false = self.foldStatement(node.if_false)
+
+    def foldWhile(self, node:PWhile) -> None:
+        node.condition = self.foldChild(node.condition)
+        self.foldScope(node.bloc)
+
+    def foldFor(self, node:PFor) -> None:
+        node.init = self.foldStatement(node.init)
+        node.condition = self.foldChild(node.condition)
+        self.foldScope(node.bloc)
+        node.postExpr = self.foldStatement(node.postExpr)
+
+    def foldForeach(self, node:PForeach) -> None:
+        node.iterable = self.foldChild(node.iterable)
+        self.foldScope(node.bloc)
+
+    def foldReturn(self, node:PReturn) -> None:
+        if node.returnVal is not None:
+            node.returnVal = self.foldChild(node.returnVal)
+
+    def foldAssert(self, node:PAssert) -> None:
+        node.assertExpr = self.foldChild(node.assertExpr)
+
+    # Expressions, each rule returns the (value, Type) of a constant node or None.
+    # The parent of a constant node replaces it, a node which is not constant
+    # replaces its constant operands.
+
+    def foldValue(self, node:PExpression):
+        value = node.rvalue
+        cls = value.__class__
+        if cls is PIdentifier:
+            symbol = getattr(value, 'symbol', None)
+            if symbol is None or symbol.kind is not GLOBAL:
+                return None
+            self.reads.add(symbol)
+            constant = self.constants.get(symbol)
+            if constant is not None:
+                self.folded += 1
+            return constant
+        if cls is PNumeric:
+            return self.foldNumber(value)
+        if value is True or value is False:
+            return value, BOOL_TYPE
+        if value is None:
+            return None
+        if cls is list:
+            self.foldList(value)
+            return None
+        return self.expressionRules[cls](value)
+
+    def foldNumber(self, node:PNumeric):
+        value = node.rvalue
+        # The type the typing stage gave the literal, or the folding which made it
+        typ = getattr(node, 'type', None)
+        if typ is not None:
+            return None if typ is ERROR_TYPE else (value, typ)
+        if isinstance(value, float):
+            return value, FLOAT64_TYPE
+        if -0x80000000 <= value <= 0x7FFFFFFF:
+            return value, INT32_TYPE
+        if -0x8000000000000000 <= value <= 0x7FFFFFFFFFFFFFFF:
+            return value, INT64_TYPE
+        return None
+
+    def foldBinOp(self, node:PBinOp):
+        left, right = node.left, node.rvalue
+        leftConstant = self.expressionRules[left.__class__](left)
+        op = node.op._name_
+        kind = OPERATOR_KINDS[op]
+        if kind is LOGICAL and leftConstant is not None and leftConstant[0] is (op == 'BOOL_OR'):
+            # false and ..., true or ...: the right operand is never evaluated
+            self.folded += 1
+            return leftConstant
+        rightConstant = self.expressionRules[right.__class__](right)
+        constant = None
+        if leftConstant is not None and rightConstant is not None:
+            constant = self.evaluateBinOp(node, op, kind, leftConstant, rightConstant)
+        if constant is not None:
+            self.folded += 1
+            return constant
+        if leftConstant is not None and not is_literal(left):
+            node.left = self.literal(left, leftConstant)
+        if rightConstant is not None and not is_literal(right):
+            node.rvalue = self.literal(right, rightConstant)
+        return None
+
+    def evaluateBinOp(self, node:PBinOp, op:str, kind:str, left:tuple, right:tuple):
+        """(value, Type) of node, whose operands are constant, or None"""
+        (leftValue, leftType), (rightValue, rightType) = left, right
+        # As typed with the operands the sources have: once they are folded, a
+        # literal operand would narrow the result to the type of the other one
+        typ = getattr(node, 'type', None)
+        if typ is None or typ is ERROR_TYPE:
+            return None
+        if kind is ARITHMETIC:
+            if typ.kind != INT and typ.kind != FLOAT:
+                return None
+            value = evaluate_arithmetic(op, convert(leftValue, leftType, typ), convert(rightValue, rightType, typ), typ)
+        elif kind is COMPARISON or kind is EQUALITY:
+            common = leftType.common.get(rightType)
+            if common is not None and common.kind == FLOAT:
+                leftValue, rightValue = convert(leftValue, leftType, common), convert(rightValue, rightType, common)
+                if leftValue is None or rightValue is None:
+                    return None
+            value = evaluate_comparison(op, leftValue, rightValue)
+        elif kind is LOGICAL:
+            # The left operand is true for and, false for or
+            value = rightValue
+        elif kind is BITWISE:
+            value = evaluate_bitwise(op, convert(leftValue, leftType, typ), convert(rightValue, rightType, typ), typ)
+        else:
+            if not 0 <= rightValue < typ.bits:
+                return None
+            value = wrap(leftValue << rightValue, typ) if op == 'SHIFT_LEFT' else leftValue >> rightValue
+        return None if value is None else (value, typ)
+
+    def foldAssign(self, node:PAssign) -> None:
+        left = node.left
+        if left.__class__ is PIdentifier:
+            self.assigned.add(getattr(left, 'symbol', None) or left.identifier)
+        elif left.__class__ is not PVarDecl:
+            self.expressionRules[left.__class__](left)
+        node.rvalue = self.foldChild(node.rvalue)
+        return None
+
+    def foldUnOp(self, node:PUnOp):
+        operand = node.rvalue
+        op = node.op
+        if op is not UnaryOperation.MINUS and op is not UnaryOperation.LOGIC_NOT:
+            # Increments and decrements
+            if operand.__class__ is PIdentifier:
+                self.assigned.add(getattr(operand, 'symbol', None) or operand.identifier)
+            else:
+                self.expressionRules[operand.__class__](operand)
+            return None
+        constant = self.expressionRules[operand.__class__](operand)
+        if constant is None:
+            return None
+        value, typ = constant
+        if op is UnaryOperation.LOGIC_NOT:
+            value = not value
+        elif typ.kind == INT:
+            value = wrap(-value, typ)
+        elif typ.kind == FLOAT:
+            value = -value
+        else:
+            value = None
+        if value is None:
+            if not is_literal(operand):
+                node.rvalue = self.literal(operand, constant)
+            return None
+        self.folded += 1
+        return value, typ
+
+    def foldCast(self, node:PCast):
+        operand = node.rvalue
+        constant = self.expressionRules[operand.__class__](operand)
+        if constant is None:
+            return None
+        target = node.cast_to
+        if target.__class__ is PType:
+            target = TYPE_NAMES.get(target.type_identifier)
+        elif target.__class__ is PUType:
+            target = UNSIGNED_TYPE_NAMES.get(target.type_identifier)
+        else:
+            target = None
+        value = convert(constant[0], constant[1], target) if target is not None and target.numeric else None
+        if value is None:
+            if not is_literal(operand):
+                node.rvalue = self.literal(operand, constant)
+            return None
+        self.folded += 1
+        return value, target
+
+    def foldCall(self, node:PCall) -> None:
+        if node.id.__class__ is PDot:
+            self.foldDot(node.id)
+        self.foldList(node.args)
+        self.calls = True
+        return None
+
+    def foldIndex(self, node:PIndex) -> None:
+        node.rvalue = self.foldChild(node.rvalue)
+        node.index = self.foldChild(node.index)
+        return None
+
+    def foldDot(self, node:PDot) -> None:
+        node.left = self.foldChild(node.left)
+        return None
+
+    def foldNewArray(self, node:PNewArray) -> None:
+        node.rvalue = self.foldChild(node.rvalue)
+        return None
+
+    def foldNewObj(self, node:PNewObj) -> None:
+        self.foldList(node.args)
+        # Building an object runs the initial values of its fields
+        self.calls = True
+        return None
+
+    def foldTernary(self, node:PTernary) -> None:
+        node.condition = self.foldChild(node.condition)
+        node.if_true = self.foldChild(node.if_true)
+        node.if_false = self.foldChild(node.if_false)
+        return None
+
+
+def fold_constants(module) -> int:
+    """Folds the constant expressions of a typed module in place, returns the
+    number of operations, casts and reads of constant globals folded"""
+    folder = ConstantFolder()
+    folder.foldModule(module)
+    return folder.folded
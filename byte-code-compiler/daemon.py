@@ -0,0 +1,214 @@
+"""Compile daemon, serving the compilations of clients on a Unix socket.
+
+Started with `main.py --daemon`, it keeps a pool of worker processes whose
+lexer, parser tables and tree caches stay loaded between compilations, so a
+`main.py --connect ...` client does not pay for them again. Requests of
+concurrent clients are compiled by the same pool.
+
+A request is one JSON line with the command line of the client and its working
+directory. The answer is streamed back as JSON lines: {"out": line} and
+{"err": line} for what the compiler prints, then {"exit": status}. The daemon
+exits once no request came for its idle timeout.
+
+The default socket is in $XDG_RUNTIME_DIR, or else in a psc-<uid> folder of
+the temporary folder which only the user can open. Clients and the daemon
+only use a socket which the user owns, so another user can not stand in for
+the daemon.
+"""
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import time
+
+
+def default_socket() -> str:
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime and os.path.isdir(runtime):
+        return os.path.join(runtime, 'psc.sock')
+    directory = os.path.join(tempfile.gettempdir(), f'psc-{os.getuid()}')
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{directory} is not a folder only the user can open")
+    return os.path.join(directory, 'psc.sock')
+
+
+def owned(path:str) -> bool:
+    """Whether path exists and belongs to the user"""
+    try:
+        return os.lstat(path).st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def forward(argv, path:str=None):
+    """Has the daemon run the command line argv and prints what it answers.
+    Returns the exit status, or None if no daemon took the request."""
+    try:
+        path = path or default_socket()
+    except OSError:
+        return None
+    if not owned(path):
+        # No daemon, or a socket of another user
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+    except OSError:
+        client.close()
+        return None
+    answered = False
+    with client, client.makefile('rwb') as stream:
+        try:
+            stream.write(json.dumps({'argv': list(argv), 'cwd': os.getcwd()}).encode('utf-8') + b'\n')
+            stream.flush()
+            for line in stream:
+                message = json.loads(line)
+                answered = True
+                if 'exit' in message:
+                    return message['exit']
+                if 'err' in message:
+                    print(message['err'], file=sys.stderr, flush=True)
+                else:
+                    print(message['out'])
+        except OSError:
+            pass
+    if not answered:
+        # The daemon was exiting when it accepted the connection
+        return None
+    print("The compile daemon stopped before finishing", file=sys.stderr, flush=True)
+    return 1
+
+
+class CompileDaemon:
+    def __init__(self, path:str, workers:int, idleTimeout:float) -> None:
+        self.path = path
+        self.workers = workers
+        self.idleTimeout = idleTimeout
+        self.executor = None
+        # Requests being served, and when the last one ended
+        self.active = 0
+        self.lastRequest = time.monotonic()
+        self.lock = threading.Lock()
+
+    def log(self, text:str) -> None:
+        print(text, file=sys.stderr, flush=True)
+
+    def listen(self) -> socket.socket:
+        """The listening socket, None if another daemon already listens on the path"""
+        if os.path.lexists(self.path):
+            if not owned(self.path):
+                raise PermissionError(f"{self.path} belongs to another user")
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+                return None
+            except OSError:
+                # Left by a daemon which did not exit cleanly
+                os.unlink(self.path)
+            finally:
+                probe.close()
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Only the user can connect: the daemon reads and writes files for its clients
+        umask = os.umask(0o177)
+        try:
+            listener.bind(self.path)
+        finally:
+            os.umask(umask)
+        listener.listen()
+        return listener
+
+    def serve(self) -> int:
+        from concurrent.futures import ProcessPoolExecutor
+        from driver import get_lexer
+
+        try:
+            listener = self.listen()
+        except OSError as e:
+            self.log(f"Can not listen on {self.path}: {e}")
+            return 1
+        if listener is None:
+            self.log(f"A compile daemon already listens on {self.path}")
+            return 1
+        # Workers are all started before the threads serving the clients, and
+        # build the lexer and load the parser tables before the first request
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=get_lexer)
+        for future in [self.executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+        self.log(f"Compile daemon listening on {self.path} with {self.workers} workers")
+        listener.settimeout(min(1.0, self.idleTimeout))
+        try:
+            while True:
+                try:
+                    connection, _ = listener.accept()
+                except socket.timeout:
+                    with self.lock:
+                        if not self.active and time.monotonic() - self.lastRequest >= self.idleTimeout:
+                            break
+                    continue
+                connection.settimeout(None)
+                with self.lock:
+                    self.active += 1
+                threading.Thread(target=self.handle, args=(connection,), daemon=True).start()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            listener.close()
+            os.unlink(self.path)
+            self.executor.shutdown(cancel_futures=True)
+        self.log("Compile daemon stopped")
+        return 0
+
+    def handle(self, connection:socket.socket) -> None:
+        try:
+            with connection, connection.makefile('rwb') as stream:
+                line = stream.readline()
+                if not line:
+                    return
+
+                def send(**message):
+                    stream.write(json.dumps(message).encode('utf-8') + b'\n')
+                    stream.flush()
+
+                send(exit=self.compile(json.loads(line), send))
+        except (OSError, ValueError) as e:
+            # The client went away, or did not send a request
+            self.log(f"Request failed: {e}")
+        finally:
+            with self.lock:
+                self.active -= 1
+                self.lastRequest = time.monotonic()
+
+    def compile(self, request:dict, send) -> int:
+        from main import parse_args, run
+
+        try:
+            args = parse_args(request['argv'])
+        except SystemExit as e:
+            # The client parses the same arguments before sending them
+            send(err="Invalid arguments")
+            return e.code
+        try:
+            return run(args, lambda line: send(out=line), lambda line: send(err=line),
+                       self.executor, request['cwd'])
+        except Exception as e:
+            send(err=f"{type(e).__name__}: {e}")
+            return 1
+
+
+def serve(path:str=None, workers:int=1, idleTimeout:float=600) -> int:
+    """Runs a compile daemon until it is idle for idleTimeout seconds"""
+    if path is None:
+        try:
+            path = default_socket()
+        except OSError as e:
+            print(f"No socket for the compile daemon: {e}", file=sys.stderr, flush=True)
+            return 1
+    return CompileDaemon(path, workers, idleTimeout).serve()
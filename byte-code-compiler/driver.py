@@ -0,0 +1,276 @@
+import gc
+import os
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+from ast_cache import AstCache
+from constant_folding import fold_constants
+from lexer import LexerError, PS_Lexer
+from parser_tree import parser, count_nodes
+from type_checker import check_module
+from typing_cache import TypingCache
+
+# The lexer and the caches of a process are built by its first compilation and
+# reused for the next files. Worker processes get their own ones.
+_lexer = None
+_caches = {}
+_typing_caches = {}
+
+
+class StageProfile:
+    """Measures of one stage on one file. Use it as a context manager around the stage.
+
+    The peak memory is only traced when traceMemory is set: tracemalloc makes the
+    stages several times slower, the times are then not comparable to untraced ones."""
+    __slots__ = ('stage', 'wall', 'cpu', 'peakMemory', 'tokens', 'nodes', 'cached', 'folded', 'traceMemory')
+
+    def __init__(self, stage:str, traceMemory:bool=False) -> None:
+        self.stage = stage
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peakMemory = None
+        self.tokens = None
+        self.nodes = None
+        self.cached = False
+        # Nodes the folding stage replaced by constants
+        self.folded = None
+        self.traceMemory = traceMemory
+
+    def __enter__(self) -> 'StageProfile':
+        if self.traceMemory:
+            tracemalloc.start()
+        self.cpu = time.process_time()
+        self.wall = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.wall = time.perf_counter() - self.wall
+        self.cpu = time.process_time() - self.cpu
+        if self.traceMemory:
+            self.peakMemory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    def asDict(self) -> dict:
+        stats = {name: getattr(self, name) for name in self.__slots__}
+        if self.tokens is not None and self.wall > 0:
+            stats['tokensPerSec'] = self.tokens / self.wall
+        if self.nodes is not None and self.wall > 0:
+            stats['nodesPerSec'] = self.nodes / self.wall
+        return stats
+
+
+class CompileResult:
+    """What compiling one file printed, and the error which stopped it if any"""
+    __slots__ = ('path', 'output', 'error', 'cacheStats', 'profile')
+
+    def __init__(self, path:str) -> None:
+        self.path = path
+        self.output = []
+        self.error = None
+        self.cacheStats = {}
+        # StageProfiles of the stages run, when profiling
+        self.profile = []
+
+
+def source_files(paths, cwd:str=None) -> list:
+    """The given files, with directories replaced by the .psc files they contain.
+    Relative paths are relative to cwd when given, and stay relative."""
+    files = []
+    for path in paths:
+        full = os.path.join(cwd, path) if cwd is not None else path
+        if os.path.isdir(full):
+            found = []
+            for root, dirs, names in os.walk(full):
+                dirs[:] = [name for name in dirs if name != '__pscache__']
+                shown = path if root == full else os.path.join(path, os.path.relpath(root, full))
+                found.extend(os.path.join(shown, name) for name in names if name.endswith('.psc'))
+            files.extend(sorted(found))
+        else:
+            files.append(path)
+    return files
+
+
+def get_lexer() -> PS_Lexer:
+    global _lexer
+    if _lexer is None:
+        _lexer = PS_Lexer()
+    return _lexer
+
+
+def cache_directory(options, path:str) -> str:
+    # Absolute, as daemon workers compile from the working directory of each client
+    return os.path.abspath(options.cache_dir) if options.cache_dir else os.path.join(os.path.dirname(os.path.abspath(path)), '__pscache__')
+
+
+def get_cache(options, path:str) -> AstCache:
+    cache_dir = cache_directory(options, path)
+    cache = _caches.get(cache_dir)
+    if cache is None:
+        cache = _caches[cache_dir] = AstCache(cache_dir, options.cache_size * 1024 * 1024)
+    return cache
+
+
+def get_typing_cache(options, path:str) -> TypingCache:
+    cache_dir = cache_directory(options, path)
+    cache = _typing_caches.get(cache_dir)
+    if cache is None:
+        cache = _typing_caches[cache_dir] = TypingCache(cache_dir)
+    return cache
+
+
+def compile_file(path:str, options) -> CompileResult:
+    """Runs the stages asked by options on the file at path"""
+    result = CompileResult(path)
+    try:
+        _compile(path, options, result)
+    except LexerError as e:
+        # With the location and the text at fault
+        result.error = f"{path}: LexerError: {e}"
+    except (OSError, SyntaxError) as e:
+        # ParsingError is a SyntaxError, its message holds the location
+        result.error = f"{path}: {type(e).__name__}: {getattr(e, 'msg', None) or e}"
+    return result
+
+
+def _compile(path:str, options, result:CompileResult) -> None:
+    output = result.output
+    if not os.path.isfile(path):
+        raise IOError(f"Given path ({path}) must point to an existing FILE!")
+    lexer = get_lexer()
+    if options.mmap:
+        # Mapped sources are bytes, only the token buffer lexes them
+        code = lexer.mapFile(path)
+    else:
+        with open(path, 'r') as f:
+            code = f.read()
+    use_buffer = options.token_buffer or not isinstance(code, str)
+
+    buffer = None
+    if options.profile:
+        # Profiling lexes in its own stage, the parser then reads the token buffer
+        with StageProfile('lexer', options.trace_memory) as stage:
+            buffer = lexer.lexBuffer(code)
+        stage.tokens = len(buffer)
+        result.profile.append(stage)
+    elif use_buffer and (options.print_tokens or options.print_reconstructed_code):
+        buffer = lexer.lexBuffer(code)
+
+    def lex_tokens():
+        if buffer is not None:
+            return iter(buffer)
+        return lexer.lexCode(code)
+
+    if options.print_tokens:
+        output.append("Printing tokens:")
+        output.extend('\t'+str(tok) for tok in lex_tokens())
+        output.append('\n')
+
+    if options.print_reconstructed_code:
+        output.append("Printing reconstructed code:")
+        output.append(" ".join(str(tok.value) for tok in lex_tokens()) + " \n")
+
+    if options.stage == 'L': #Lex only
+        return
+
+    cache = None if options.no_cache else get_cache(options, path)
+    before = cache.stats() if cache is not None else {}
+    stage = StageProfile('parser', options.trace_memory)
+    try:
+        with stage if options.profile else nullcontext():
+            # A cached tree skips the lexer and the parser
+            p = cache.load(code) if cache is not None else None
+            stage.cached = p is not None
+            if p is None:
+                if buffer is not None or use_buffer:
+                    if buffer is None:
+                        buffer = lexer.lexBuffer(code)
+                    buffer.input()
+                    buffer.emitTypeIds = True
+                    p = parser.parse_compiled(lexer=buffer)
+                else:
+                    p = parser.parse_compiled(code, lexer=lexer)
+                if cache is not None:
+                    cache.store(code, p)
+    finally:
+        if cache is not None:
+            result.cacheStats = {name: count - before[name] for name, count in cache.stats().items()}
+    if options.profile:
+        stage.tokens = len(buffer)
+        stage.nodes = count_nodes(p)
+        result.profile.append(stage)
+    if options.print_ast:
+        output.append(str(p))
+    if options.stage == 'P':
+        return
+
+    # The stages after parsing only annotate and rewrite the tree, the collector
+    # would just rescan it: a cached tree, rebuilt with the collector disabled, is still all young
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        _compile_tree(path, code, p, options, result)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _compile_tree(path:str, code, p, options, result:CompileResult) -> None:
+    # Restoring the annotations of the bodies taken from the typing cache costs
+    # about as much as checking them: it is only used when asked for
+    typing_cache = get_typing_cache(options, path) if options.typing_cache and not options.no_cache else None
+    before = typing_cache.stats() if typing_cache is not None else {}
+    stage = StageProfile('typing', options.trace_memory)
+    with stage if options.profile else nullcontext():
+        # The cache only checks the bodies which changed since the last compilation,
+        # and only annotates the other ones if the next stages run
+        if typing_cache is not None:
+            errors = typing_cache.check(path, code, p, options.typing_jobs, options.stage != 'T')
+        else:
+            errors = check_module(p, options.typing_jobs)
+    if typing_cache is not None:
+        result.cacheStats.update((name, count - before[name]) for name, count in typing_cache.stats().items())
+    if options.profile:
+        stage.nodes = count_nodes(p)
+        result.profile.append(stage)
+    if errors:
+        result.error = "\n".join(f"{path}: TypingError: {error}" for error in errors)
+        return
+    if options.stage == 'T':
+        return
+
+    stage = StageProfile('folding', options.trace_memory)
+    with stage if options.profile else nullcontext():
+        folded = fold_constants(p)
+    if options.profile:
+        stage.folded = folded
+        result.profile.append(stage)
+
+    # RTL, ERTL, LTL and byte code stages come next
+
+
+def compile_file_in(cwd:str, path:str, options) -> CompileResult:
+    """compile_file with relative paths taken from cwd. Only for worker processes,
+    as it changes the working directory of the process."""
+    if cwd is not None:
+        os.chdir(cwd)
+    return compile_file(path, options)
+
+
+def compile_files(paths, options, jobs:int=1, executor=None, cwd:str=None):
+    """Compiles the files and yields their results in the order of paths.
+
+    With more than one job the files are spread over a pool of processes, each of
+    them building the lexer and loading the parser tables once. A pool which is
+    already running can be given as executor instead, its workers then compile
+    relative paths from cwd."""
+    if executor is not None:
+        yield from executor.map(compile_file_in, [cwd] * len(paths), paths, [options] * len(paths))
+        return
+    if jobs <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield compile_file(path, options)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(compile_file, paths, [options] * len(paths))
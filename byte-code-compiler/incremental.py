@@ -0,0 +1,392 @@
+"""Incremental lexing and parsing of a source being edited.
+
+The source is kept as a list of chunks, each one made of whole lines holding
+whole top level declarations or statements. An edit only relexes and reparses
+the chunks it touches, the trees of the other ones are kept as they are.
+
+Errors stay in the chunks holding them: a declaration which does not parse is a
+chunk with an error, the declarations after it are parsed on their own, and an
+illegal character only breaks the chunk it is in.
+"""
+from bisect import bisect_right
+from itertools import accumulate
+
+from lexer import Location, LexerError, PS_Lexer, TokenBuffer
+from parser_tree import ParsingError, PClassDecl, PFuncDecl, PModule, PTreeElem, PVarDecl, parse_declarations
+
+_OPEN = frozenset(TokenBuffer.typeIds[name] for name in
+                  ('Punctuation_OpenParen', 'Punctuation_OpenBracket', 'Punctuation_OpenBrace'))
+_CLOSE = frozenset(TokenBuffer.typeIds[name] for name in
+                   ('Punctuation_CloseParen', 'Punctuation_CloseBracket', 'Punctuation_CloseBrace'))
+_EOL = TokenBuffer.typeIds['Punctuation_EoL']
+_CLOSE_BRACE = TokenBuffer.typeIds['Punctuation_CloseBrace']
+_ELSE = TokenBuffer.typeIds['Keyword_Control_Else']
+_CLOSERS = frozenset((')', ']', '}'))
+
+
+class Diagnostic:
+    """An error found in the source"""
+    __slots__ = ('message', 'location')
+
+    def __init__(self, message:str, location:Location) -> None:
+        self.message = message
+        self.location = location
+
+    def __str__(self) -> str:
+        return f"{self.location}: {self.message}"
+
+    def __repr__(self) -> str:
+        return f"Diagnostic({self.message!r}, {self.location!r})"
+
+
+class Chunk:
+    """Lines of the source and what they parse to. The locations in items and
+    error count lines from treeLine for the first line of the chunk."""
+    __slots__ = ('text', 'lineCount', 'items', 'first', 'treeLine', 'error', 'errorToken')
+
+    def __init__(self, text:str, items=(), first=None, treeLine:int=1, error:Diagnostic=None,
+                 errorToken:str=None) -> None:
+        self.text = text
+        self.lineCount = text.count('\n')
+        # Top level declarations and statements, in order
+        self.items = list(items)
+        # Location of the first token, None without tokens
+        self.first = first
+        self.treeLine = treeLine
+        self.error = error
+        # Text of the token the error is on, None when the text ran out before
+        # the end of a declaration: the text after the chunk may complete it
+        self.errorToken = errorToken
+
+
+def _split_points(buffer:TokenBuffer) -> list:
+    """Indices of the tokens which start a top level declaration or statement on
+    a new line, and can start a chunk: the source is cut at the start of their line"""
+    types = buffer.types
+    lines = buffer.lines
+    starts = buffer.starts
+    code = buffer.code
+    points = []
+    depth = 0
+    count = len(types)
+    for i in range(count - 1):
+        typeId = types[i]
+        if typeId in _OPEN:
+            depth += 1
+        elif typeId in _CLOSE and depth:
+            # A closing bracket too many is an error of its declaration only
+            depth -= 1
+        if depth or (typeId != _EOL and typeId != _CLOSE_BRACE):
+            continue
+        nextId = types[i + 1]
+        if nextId == _ELSE or lines[i + 1] == lines[i]:
+            continue
+        # A multiline comment between the two tokens could run over the cut
+        lineStart = starts[i + 1] - buffer.cols[i + 1] + 1
+        if '/*' in code[buffer.ends[i]:lineStart]:
+            continue
+        points.append(i + 1)
+    return points
+
+
+def _shift_locations(items, lines:int) -> None:
+    """Moves the locations of the trees by a number of lines. Locations are
+    shared by nodes and never modified, each one is replaced by a moved copy once."""
+    moved = {}
+    seen = set()
+    stack = list(items)
+    while stack:
+        elem = stack.pop()
+        if isinstance(elem, list):
+            stack.extend(elem)
+        elif isinstance(elem, PTreeElem) and id(elem) not in seen:
+            seen.add(id(elem))
+            location = elem.location
+            if isinstance(location, Location):
+                new = moved.get(id(location))
+                if new is None:
+                    new = moved[id(location)] = Location(location.line + lines, location.col)
+                elem.location = new
+            stack.extend(getattr(elem, name) for name in elem.fields())
+
+
+class IncrementalDocument:
+    """A source file being edited. edit() applies a change and returns the
+    diagnostics of the whole file; declarations() and module() give its trees.
+
+    Only the chunks touched by an edit are lexed and parsed again, with the
+    chunks around them when they may parse together (see _reparse)."""
+
+    def __init__(self, code:str, lexer:PS_Lexer=None) -> None:
+        self.lexer = lexer if lexer is not None else PS_Lexer()
+        self.chunks = [Chunk(code)]
+        self._code = code
+        self._reparse(0, 1, code)
+
+    @property
+    def code(self) -> str:
+        if self._code is None:
+            self._code = ''.join(chunk.text for chunk in self.chunks)
+        return self._code
+
+    def _offsets(self) -> list:
+        """Offset of the start of each chunk, and of the end of the source"""
+        return [0] + list(accumulate(len(chunk.text) for chunk in self.chunks))
+
+    def line(self, number:int) -> tuple:
+        """(offset of its start, text without its new line) of the line with the
+        given number, the first one being 1. Lines past the end are empty."""
+        offset = 0
+        for chunk in self.chunks:
+            # Only the last chunk can end without a new line
+            if number <= chunk.lineCount or chunk is self.chunks[-1]:
+                start = 0
+                for _ in range(number - 1):
+                    start = chunk.text.find('\n', start) + 1
+                    if start == 0:
+                        return offset + len(chunk.text), ''
+                end = chunk.text.find('\n', start)
+                return offset + start, chunk.text[start:end if end >= 0 else len(chunk.text)]
+            number -= chunk.lineCount
+            offset += len(chunk.text)
+        return offset, ''
+
+    def edit(self, offset:int, deleted:int, inserted:str) -> list:
+        """Replaces the deleted characters at offset by the inserted text"""
+        offsets = self._offsets()
+        if offset < 0 or deleted < 0 or offset + deleted > offsets[-1]:
+            raise ValueError(f"Edit of {deleted} characters at {offset} out of the source ({offsets[-1]} characters)")
+        first = min(bisect_right(offsets, offset) - 1, len(self.chunks) - 1)
+        # A deletion ending at the start of a chunk joins it to the previous one
+        last = min(bisect_right(offsets, offset + deleted) - 1, len(self.chunks) - 1)
+        text = ''.join(chunk.text for chunk in self.chunks[first:last + 1])
+        start = offset - offsets[first]
+        text = text[:start] + inserted + text[start + deleted:]
+        self._code = None
+        self._reparse(first, last + 1, text)
+        return self.diagnostics()
+
+    def _reparse(self, first:int, last:int, text:str) -> None:
+        """Replaces the chunks from first to last (excluded) by the chunks of text.
+        When text or the chunks next to it have errors, text is parsed again with
+        them, as an edit can join them in one declaration. Further chunks are only
+        joined to close a declaration: a bracket closed in text, opened in the
+        last chunk before it with an unterminated declaration, or the reverse.
+
+        Errors are those of the smallest text which does not parse, so an error
+        at its end can be reported on another line than a whole parse would."""
+        chunks, joinable = self._parse(text)
+        chunks = self._join(first, last, text, chunks, joinable)
+        if chunks is None:
+            return
+        if any(chunk.error is not None for chunk in chunks):
+            if '/*' in text and last < len(self.chunks):
+                # A comment opened in text may only end in a later chunk
+                chunks, _ = self._parse(text + ''.join(chunk.text for chunk in self.chunks[last:]))
+                last = len(self.chunks)
+            elif self._close(first, last, text, chunks):
+                return
+        self.chunks[first:last] = chunks
+
+    def _join(self, first:int, last:int, text:str, chunks:list, joinable:bool):
+        """chunks, or None when text parses without errors with the chunks next
+        to it, which it then replaced"""
+        before = first > 0 and (joinable or self.chunks[first - 1].error is not None)
+        after = last < len(self.chunks) and (joinable or self.chunks[last].error is not None)
+        if not before and not after:
+            return chunks
+        if before:
+            first -= 1
+            text = self.chunks[first].text + text
+        if after:
+            text += self.chunks[last].text
+            last += 1
+        wider, _ = self._parse(text)
+        if any(chunk.error is not None for chunk in wider):
+            return chunks
+        self.chunks[first:last] = wider
+        return None
+
+    def _close(self, first:int, last:int, text:str, chunks:list) -> bool:
+        """Joins text with the distant chunks whose declaration it may close: the
+        chunks with an error before text, when they run out before the end of
+        their declaration and text has closing brackets too many, or the reverse
+        after text. Returns whether they parse together, and then replaced the chunks."""
+        if any(chunk.errorToken in _CLOSERS for chunk in chunks):
+            while True:
+                opened = next((i for i in range(first - 1, -1, -1) if self.chunks[i].error is not None), None)
+                if opened is None or self.chunks[opened].errorToken is not None:
+                    return False
+                text = ''.join(chunk.text for chunk in self.chunks[opened:first]) + text
+                first = opened
+                chunks, _ = self._parse(text)
+                if all(chunk.error is None for chunk in chunks):
+                    break
+                if not any(chunk.errorToken in _CLOSERS for chunk in chunks):
+                    return False
+        elif chunks[-1].error is not None and chunks[-1].errorToken is None:
+            while True:
+                closed = next((i for i in range(last, len(self.chunks)) if self.chunks[i].error is not None), None)
+                if closed is None or self.chunks[closed].errorToken not in _CLOSERS:
+                    return False
+                text += ''.join(chunk.text for chunk in self.chunks[last:closed + 1])
+                last = closed + 1
+                chunks, _ = self._parse(text)
+                if all(chunk.error is None for chunk in chunks):
+                    break
+                if chunks[-1].error is None or chunks[-1].errorToken is not None:
+                    return False
+        else:
+            return False
+        self.chunks[first:last] = chunks
+        return True
+
+    def _lex(self, text:str) -> tuple:
+        """Tokens of text, and the (offset, LexerError) of its illegal characters,
+        lexed as spaces. The buffer is None if text can not be lexed that way."""
+        errors = []
+        code = text
+        while True:
+            try:
+                return self.lexer.lexBuffer(code), errors
+            except LexerError as e:
+                line, col = e.location.line, e.location.col
+                offset = (self.lexer.newlines[line - 2] + col if line > 1 else col - 1)
+                if not 0 <= offset < len(code) or code[offset] == ' ':
+                    return None, [(0, e)]
+                errors.append((offset, e))
+                code = code[:offset] + ' ' + code[offset + 1:]
+
+    def _parse(self, text:str) -> tuple:
+        """Chunks of text, whose trees count lines from the first line of text,
+        and whether the error of the first or last one may go away with the text
+        around text: it is on the first token, or at the end of text"""
+        buffer, lexerErrors = self._lex(text)
+        if buffer is None:
+            e = lexerErrors[0][1]
+            return [Chunk(text, error=Diagnostic(e.msg, e.location), errorToken=text[:1])], False
+        points = [0] + _split_points(buffer) + [len(buffer)]
+        # Offset in text of the line of each point
+        cuts = [0] + [buffer.starts[i] - buffer.cols[i] + 1 for i in points[1:-1]] + [len(text)]
+        # Illegal characters, by the index of the range of points holding them
+        broken = {}
+        for offset, e in lexerErrors:
+            broken.setdefault(bisect_right(cuts, offset) - 1, (offset, e))
+        chunks = []
+        joinable = False
+        line = 1
+        i = 0
+        while i < len(points) - 1:
+            start = points[i]
+            lexerError = broken.get(i)
+            if lexerError is not None:
+                offset, lexerError = lexerError
+                items, error, j = (), None, i + 1
+            else:
+                items, error, j = self._parseRange(buffer, points, i, broken)
+            end = points[j]
+            if lexerError is not None:
+                chunk = Chunk(text[cuts[i]:cuts[j]], treeLine=line, error=Diagnostic(lexerError.msg, lexerError.location),
+                              errorToken=text[offset])
+            elif error is not None:
+                chunk = Chunk(text[cuts[i]:cuts[j]], treeLine=line, error=self._diagnostic(error, buffer, end),
+                              errorToken=error.problem_token)
+                if error.problem_token is None:
+                    joinable = joinable or end == len(buffer)
+                else:
+                    joinable = joinable or (i == 0 and error.location.line == buffer.lines[0]
+                                            and error.location.col == buffer.cols[0])
+            else:
+                first = Location(buffer.lines[start], buffer.cols[start]) if start < end else None
+                chunk = Chunk(text[cuts[i]:cuts[j]], items, first, line)
+            chunks.append(chunk)
+            line += chunk.lineCount
+            i = j
+        return chunks, joinable
+
+    def _parseRange(self, buffer:TokenBuffer, points:list, i:int, broken:dict) -> tuple:
+        """(items, ParsingError or None, j): the tokens from points[i] to points[j]
+        parse to items, or give the error. A declaration cut at a split point goes
+        on in the next ranges: while the parser runs out of tokens, the range is
+        extended to the next point."""
+        start = points[i]
+        j = i + 1
+        try:
+            return self._parseTokens(buffer, start, points[j]), None, j
+        except ParsingError as e:
+            error = e
+        while error.problem_token is None and j + 1 < len(points) and j not in broken:
+            try:
+                return self._parseTokens(buffer, start, points[j + 1]), None, j + 1
+            except ParsingError as e:
+                if e.problem_token is not None:
+                    # Not the rest of the declaration
+                    break
+                error = e
+                j += 1
+        return (), error, j
+
+    @staticmethod
+    def _parseTokens(buffer:TokenBuffer, start:int, end:int) -> list:
+        buffer.input(start=start, end=end)
+        buffer.emitTypeIds = True
+        return list(parse_declarations(lexer=buffer))
+
+    @staticmethod
+    def _diagnostic(error:ParsingError, buffer:TokenBuffer, end:int) -> Diagnostic:
+        if error.problem_token is None:
+            # End of the tokens: where the next one starts, or the end of the text
+            offset = buffer.starts[end] if end < len(buffer) else len(buffer.code)
+            return Diagnostic(error.msg, Location(*buffer.getLocation(offset)))
+        return Diagnostic(f"Unexpected symbol '{error.problem_token}'", error.location)
+
+    def diagnostics(self) -> list:
+        """Diagnostics of the source, with their location in the whole source"""
+        found = []
+        line = 1
+        for chunk in self.chunks:
+            if chunk.error is not None:
+                location = chunk.error.location
+                found.append(Diagnostic(chunk.error.message,
+                                        Location(location.line - chunk.treeLine + line, location.col)))
+            line += chunk.lineCount
+        return found
+
+    def declarations(self) -> list:
+        """Top level declarations and statements of the source in order, their
+        locations moved to the lines they are on in the whole source"""
+        items = []
+        line = 1
+        for chunk in self.chunks:
+            if chunk.treeLine != line:
+                _shift_locations(chunk.items, line - chunk.treeLine)
+                if chunk.first is not None:
+                    chunk.first = Location(chunk.first.line + line - chunk.treeLine, chunk.first.col)
+                if chunk.error is not None:
+                    location = chunk.error.location
+                    chunk.error = Diagnostic(chunk.error.message,
+                                             Location(location.line + line - chunk.treeLine, location.col))
+                chunk.treeLine = line
+            items.extend(chunk.items)
+            line += chunk.lineCount
+        return items
+
+    def module(self) -> PModule:
+        """The module the whole source parses to, as parse_compiled gives it"""
+        items = self.declarations()
+        location = next((chunk.first for chunk in self.chunks if chunk.first is not None), None)
+        if location is None:
+            lexer = PS_Lexer()
+            lexer.input(self.code)
+            location = Location(*lexer.getLocation(len(self.code)))
+        module = PModule(location, functions=[], varDecl=[], classDecl=[], statements=[])
+        for item in items:
+            if isinstance(item, PClassDecl):
+                module.classDecl.append(item)
+            elif isinstance(item, PVarDecl):
+                module.varDecl.append(item)
+            elif isinstance(item, PFuncDecl):
+                module.funcDecl.append(item)
+            else:
+                module.statements.append(item)
+        return module
@@ -0,0 +1,316 @@
+"""Language server for P# sources, over stdio.
+
+Run it from the editor:
+    python language_server.py [--debounce SECONDS]
+It speaks the Language Server Protocol (JSON-RPC messages with Content-Length
+headers) on stdin and stdout, and logs on stderr. The lexer and the parser are
+built once when the server starts. Each open document is kept as an
+IncrementalDocument, so a change only relexes and reparses what it touches.
+
+Changes are applied and checked once no other change came for the debounce
+delay: a check planned for an older version of a document is cancelled.
+"""
+import asyncio
+import json
+import os
+import sys
+import threading
+import traceback
+from argparse import ArgumentParser
+
+from driver import get_lexer
+from incremental import IncrementalDocument
+from parser_tree import PAssign, PClassDecl, PFuncDecl, PVarDecl
+
+# JSON-RPC error codes
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+REQUEST_CANCELLED = -32800
+
+# LSP enumerations
+SEVERITY_ERROR = 1
+SYNC_INCREMENTAL = 2
+SYMBOL_CLASS = 5
+SYMBOL_FUNCTION = 12
+SYMBOL_VARIABLE = 13
+
+
+def read_message(stream):
+    """Next JSON-RPC message on a binary stream, None at its end"""
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode('ascii').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    if length is None:
+        raise ValueError("Message without a Content-Length header")
+    return json.loads(stream.read(length).decode('utf-8'))
+
+
+def write_message(stream, message:dict) -> None:
+    body = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    stream.write(b'Content-Length: %d\r\n\r\n' % len(body) + body)
+    stream.flush()
+
+
+def utf16_length(text:str) -> int:
+    return len(text.encode('utf-16-le')) // 2
+
+
+def from_utf16(text:str, units:int) -> int:
+    """Number of characters of text in its first units UTF-16 code units"""
+    if text.isascii():
+        return min(units, len(text))
+    count = 0
+    for i, char in enumerate(text):
+        if count >= units:
+            return i
+        count += 2 if ord(char) > 0xFFFF else 1
+    return len(text)
+
+
+class OpenDocument:
+    """A document open in the editor and the changes not applied yet"""
+    __slots__ = ('uri', 'version', 'document', 'pending', 'check')
+
+    def __init__(self, uri:str, version:int, text:str) -> None:
+        self.uri = uri
+        self.version = version
+        self.document = IncrementalDocument(text, get_lexer())
+        # contentChanges waiting for the debounce delay
+        self.pending = []
+        # Task publishing the diagnostics of the pending changes
+        self.check = None
+
+    def offset(self, position:dict) -> int:
+        start, text = self.document.line(position['line'] + 1)
+        return start + from_utf16(text, position['character'])
+
+    def position(self, line:int, col:int) -> dict:
+        """LSP position of a location of the document (1 based line and column)"""
+        _, text = self.document.line(line)
+        return {'line': line - 1, 'character': utf16_length(text[:max(col - 1, 0)])}
+
+    def flush(self) -> None:
+        """Applies the pending changes"""
+        changes, self.pending = self.pending, []
+        for change in changes:
+            if 'range' not in change:
+                self.document = IncrementalDocument(change['text'], get_lexer())
+                continue
+            start = self.offset(change['range']['start'])
+            end = self.offset(change['range']['end'])
+            self.document.edit(start, end - start, change['text'])
+
+
+class LanguageServer:
+    def __init__(self, reader, writer, debounce:float=0.2) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.debounce = debounce
+        self.documents = {}
+        self.shutdown = False
+        # Ids of the requests read and not handled yet, and of those of them the
+        # client cancelled. Cancellations of other requests are ignored.
+        self.pending = set()
+        self.cancelled = set()
+        self.requestLock = threading.Lock()
+        self.writeLock = threading.Lock()
+        self.loop = None
+        self.queue = None
+
+    def send(self, message:dict) -> None:
+        message['jsonrpc'] = '2.0'
+        with self.writeLock:
+            write_message(self.writer, message)
+
+    def notify(self, method:str, params) -> None:
+        self.send({'method': method, 'params': params})
+
+    def log(self, text:str) -> None:
+        print(text, file=sys.stderr, flush=True)
+
+    def run(self) -> int:
+        """Serves until the exit notification, returns the exit status"""
+        return asyncio.run(self.serve())
+
+    async def serve(self) -> int:
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        threading.Thread(target=self.readMessages, daemon=True).start()
+        while True:
+            message = await self.queue.get()
+            if message is None or message.get('method') == 'exit':
+                return 0 if self.shutdown else 1
+            self.dispatch(message)
+            # Let planned checks whose delay is over run between messages
+            await asyncio.sleep(0)
+
+    def readMessages(self) -> None:
+        """Reads the messages in a thread, so cancellations are seen before the
+        requests they cancel get handled"""
+        try:
+            while True:
+                message = read_message(self.reader)
+                if message is not None and message.get('method') == '$/cancelRequest':
+                    request = message['params']['id']
+                    with self.requestLock:
+                        if request in self.pending:
+                            self.cancelled.add(request)
+                    continue
+                if message is not None and 'id' in message and 'method' in message:
+                    with self.requestLock:
+                        self.pending.add(message['id'])
+                self.loop.call_soon_threadsafe(self.queue.put_nowait, message)
+                if message is None:
+                    return
+        except (OSError, ValueError) as e:
+            self.log(f"Unreadable message: {e}")
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, None)
+
+    def dispatch(self, message:dict) -> None:
+        method = message.get('method')
+        if method is None:
+            # Response to a request of the server, none are sent
+            return
+        handler = getattr(self, 'on_' + method.replace('/', '_').replace('$', ''), None)
+        if 'id' not in message:
+            if handler is not None:
+                handler(message.get('params'))
+            return
+        request = message['id']
+        with self.requestLock:
+            self.pending.discard(request)
+            cancelled = request in self.cancelled
+            self.cancelled.discard(request)
+        if cancelled:
+            self.send({'id': request, 'error': {'code': REQUEST_CANCELLED, 'message': "Request cancelled"}})
+            return
+        if handler is None:
+            self.send({'id': request, 'error': {'code': METHOD_NOT_FOUND, 'message': f"Unknown method {method}"}})
+            return
+        try:
+            self.send({'id': request, 'result': handler(message.get('params'))})
+        except Exception as e:
+            self.log(traceback.format_exc())
+            self.send({'id': request, 'error': {'code': INTERNAL_ERROR, 'message': str(e)}})
+
+    # Diagnostics
+
+    def schedule(self, opened:OpenDocument) -> None:
+        """Plans the check of a document, cancelling the one planned before"""
+        if opened.check is not None:
+            opened.check.cancel()
+        opened.check = self.loop.create_task(self.check(opened, opened.version))
+
+    async def check(self, opened:OpenDocument, version:int) -> None:
+        await asyncio.sleep(self.debounce)
+        if self.documents.get(opened.uri) is not opened or opened.version != version:
+            return
+        opened.check = None
+        try:
+            opened.flush()
+            self.publish(opened)
+        except Exception:
+            self.log(traceback.format_exc())
+
+    def publish(self, opened:OpenDocument) -> None:
+        diagnostics = []
+        for diagnostic in opened.document.diagnostics():
+            line = max(diagnostic.location.line, 1)
+            start = opened.position(line, diagnostic.location.col)
+            end = dict(start, character=start['character'] + 1)
+            diagnostics.append({'range': {'start': start, 'end': end}, 'severity': SEVERITY_ERROR,
+                                'source': 'psc', 'message': diagnostic.message})
+        self.notify('textDocument/publishDiagnostics',
+                    {'uri': opened.uri, 'version': opened.version, 'diagnostics': diagnostics})
+
+    # Messages of the client
+
+    def on_initialize(self, params) -> dict:
+        return {
+            'capabilities': {
+                'textDocumentSync': {'openClose': True, 'change': SYNC_INCREMENTAL},
+                'documentSymbolProvider': True,
+            },
+            'serverInfo': {'name': 'psc-language-server'},
+        }
+
+    def on_initialized(self, params) -> None:
+        pass
+
+    def on_shutdown(self, params) -> None:
+        self.shutdown = True
+        for opened in self.documents.values():
+            if opened.check is not None:
+                opened.check.cancel()
+        return None
+
+    def on_textDocument_didOpen(self, params) -> None:
+        document = params['textDocument']
+        self.on_textDocument_didClose(params)
+        opened = self.documents[document['uri']] = OpenDocument(document['uri'], document['version'], document['text'])
+        self.publish(opened)
+
+    def on_textDocument_didChange(self, params) -> None:
+        opened = self.documents.get(params['textDocument']['uri'])
+        if opened is None:
+            return
+        opened.version = params['textDocument']['version']
+        opened.pending.extend(params['contentChanges'])
+        self.schedule(opened)
+
+    def on_textDocument_didClose(self, params) -> None:
+        opened = self.documents.pop(params['textDocument']['uri'], None)
+        if opened is not None:
+            if opened.check is not None:
+                opened.check.cancel()
+            self.notify('textDocument/publishDiagnostics', {'uri': opened.uri, 'diagnostics': []})
+
+    def on_textDocument_documentSymbol(self, params) -> list:
+        opened = self.documents.get(params['textDocument']['uri'])
+        if opened is None:
+            return []
+        # Requests see every change received before them
+        opened.flush()
+        symbols = []
+        for item in opened.document.declarations():
+            if isinstance(item, PAssign) and isinstance(item.left, PVarDecl):
+                item = item.left
+            if isinstance(item, PFuncDecl):
+                name, kind = item.id, SYMBOL_FUNCTION
+            elif isinstance(item, PClassDecl):
+                name, kind = item.identifier, SYMBOL_CLASS
+            elif isinstance(item, PVarDecl):
+                name, kind = item.id, SYMBOL_VARIABLE
+            else:
+                continue
+            start = opened.position(item.location.line, item.location.col)
+            symbols.append({'name': getattr(name, 'identifier', name), 'kind': kind,
+                            'location': {'uri': opened.uri, 'range': {'start': start, 'end': start}}})
+        return symbols
+
+
+def parse_args():
+    args = ArgumentParser()
+    args.add_argument("--debounce", required=False, type=float, default=0.2,
+                      help="Seconds without changes before a document is checked (default: 0.2)")
+    return args.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    # Builds the lexer and loads the parser tables before the first message
+    get_lexer()
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer, args.debounce)
+    status = server.run()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    # The reading thread may still wait on stdin, which would block a normal exit
+    os._exit(status)
@@ -0,0 +1,311 @@
+"""First character dispatch engine for the rules of a PLY lexer.
+
+PLY matches every token with one master regex made of all the rules, tried in
+order, then calls the function of the rule that matched. Here the rules that
+can start with each ASCII character are worked out once from their regexes, so
+a token is matched by a small regex made of only those rules (still tried in
+PLY's order, so the first matching rule wins exactly as with PLY), or without
+any regex when the first of them is a single character literal.
+"""
+import copy
+import re
+
+from ply.lex import LexToken
+
+try:
+    from re import _parser as sre_parse, _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+ASCII = frozenset(range(128))
+
+_CATEGORY_TESTS = {
+    sre_constants.CATEGORY_DIGIT: r'\d',
+    sre_constants.CATEGORY_NOT_DIGIT: r'\D',
+    sre_constants.CATEGORY_SPACE: r'\s',
+    sre_constants.CATEGORY_NOT_SPACE: r'\S',
+    sre_constants.CATEGORY_WORD: r'\w',
+    sre_constants.CATEGORY_NOT_WORD: r'\W',
+}
+
+
+def _category_chars(category) -> frozenset:
+    test = _CATEGORY_TESTS.get(category)
+    if test is None:
+        return ASCII
+    regex = re.compile(test)
+    return frozenset(c for c in ASCII if regex.match(chr(c)))
+
+
+def _class_chars(items) -> frozenset:
+    """ASCII characters matched by the items of a [...] class"""
+    chars = set()
+    negate = False
+    for op, arg in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            chars.add(arg)
+        elif op is sre_constants.RANGE:
+            chars.update(range(arg[0], arg[1] + 1))
+        elif op is sre_constants.CATEGORY:
+            chars.update(_category_chars(arg))
+        else:
+            return ASCII
+    chars &= ASCII
+    return ASCII - chars if negate else frozenset(chars)
+
+
+def first_chars(items) -> tuple:
+    """(ASCII characters a parsed pattern can start with, can it match the empty
+    string). Anything not understood gives every character: the set can be too
+    big, which only costs a failed match, never too small."""
+    chars = set()
+    for op, arg in items:
+        nullable = False
+        if op is sre_constants.LITERAL:
+            if arg < 128:
+                chars.add(arg)
+        elif op is sre_constants.NOT_LITERAL:
+            chars.update(ASCII - {arg})
+        elif op is sre_constants.ANY:
+            chars.update(ASCII - {ord('\n')})
+        elif op is sre_constants.IN:
+            chars.update(_class_chars(arg))
+        elif op is sre_constants.SUBPATTERN:
+            sub, nullable = first_chars(arg[-1])
+            chars.update(sub)
+        elif op is sre_constants.BRANCH:
+            for alternative in arg[1]:
+                sub, subNullable = first_chars(alternative)
+                chars.update(sub)
+                nullable = nullable or subNullable
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            sub, nullable = first_chars(arg[2])
+            chars.update(sub)
+            nullable = nullable or arg[0] == 0
+        elif op is sre_constants.AT:
+            # Zero width: \b, ^, $...
+            nullable = True
+        else:
+            return ASCII, True
+        if not nullable:
+            return frozenset(chars), False
+    return frozenset(chars), True
+
+
+class DispatchTable:
+    """For each ASCII character (an int for bytes code), what matches a token
+    starting with it: the name of its rule when it is a single character literal
+    tried first, else a (regex, rule names by group index) pair. Characters no
+    rule can start with are missing; the other ones go through the master regexes."""
+
+    def __init__(self, rules, flags:int, encode:bool=False) -> None:
+        self.byChar = {}
+        patterns = {}
+        parsed = [(name, pattern, sre_parse.parse(pattern, flags)) for name, pattern in rules]
+        starts = [(name, pattern, first_chars(items)[0]) for name, pattern, items in parsed]
+        literals = {name: items[0][1] for name, _, items in parsed
+                    if len(items) == 1 and items[0][0] is sre_constants.LITERAL}
+        for char in sorted(ASCII):
+            candidates = tuple((name, pattern) for name, pattern, chars in starts if char in chars)
+            if not candidates:
+                continue
+            key = char if encode else chr(char)
+            if literals.get(candidates[0][0]) == char:
+                self.byChar[key] = candidates[0][0]
+                continue
+            entry = patterns.get(candidates)
+            if entry is None:
+                regex = '|'.join(f'(?P<t_{name}>{pattern})' for name, pattern in candidates)
+                if encode:
+                    compiled = re.compile(regex.encode('ascii'), flags & ~re.UNICODE)
+                else:
+                    compiled = re.compile(regex, flags)
+                names = [None] * (compiled.groups + 1)
+                for group, index in compiled.groupindex.items():
+                    if group.startswith('t_'):
+                        names[index] = group[2:]
+                entry = patterns[candidates] = (compiled, names)
+            self.byChar[key] = entry
+
+
+def ply_rules(lexer) -> list:
+    """(name, pattern) of the rules of a PLY lexer, in the order PLY tries them"""
+    rules = []
+    for regex, indexfunc in lexer.lexre:
+        for group, index in sorted(regex.groupindex.items(), key=lambda item: item[1]):
+            func, name = indexfunc[index]
+            if func is None or not group.startswith('t_'):
+                raise ValueError("Only function rules can be dispatched")
+            rules.append((name, getattr(func, 'regex', func.__doc__)))
+    return rules
+
+
+class DispatchLexer:
+    """Drop-in replacement of a PLY lexer built from the same rules.
+
+    discarded rules never produce a token, reserved maps the text of 'ID'
+    tokens to their type and valueRules are the names of the rules whose
+    function computes the value of the token; the function of any other rule
+    is not called. Other rules must just return their token."""
+
+    def __init__(self, lexer, discarded=(), reserved=None, valueRules=()) -> None:
+        self.plyLexer = lexer
+        self.lexre = lexer.lexre
+        self.rules = ply_rules(lexer)
+        self.flags = lexer.lexreflags
+        self.discarded = frozenset(discarded)
+        self.reserved = reserved or {}
+        functions = {entry[1]: entry[0] for regex, indexfunc in lexer.lexre for entry in indexfunc if entry}
+        self.valueRules = {name: functions[name] for name in valueRules}
+        self.errorf = lexer.lexerrorf
+        self.table = DispatchTable(self.rules, self.flags)
+        # Built on first use, shared with the clones
+        self.bytesTables = []
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+
+    def clone(self, object=None) -> 'DispatchLexer':
+        """Copy of the lexer sharing its tables, with the rule functions bound to
+        object if given, like PLY's Lexer.clone"""
+        c = copy.copy(self)
+        c.plyLexer = self.plyLexer.clone(object)
+        c.lexre = c.plyLexer.lexre
+        if object:
+            c.valueRules = {name: getattr(object, func.__name__) for name, func in self.valueRules.items()}
+            c.errorf = c.plyLexer.lexerrorf
+        c.input('')
+        c.lineno = 1
+        return c
+
+    def bytesTable(self) -> DispatchTable:
+        if not self.bytesTables:
+            self.bytesTables.append(DispatchTable(self.rules, self.flags, encode=True))
+        return self.bytesTables[0]
+
+    def input(self, s) -> None:
+        self.lexdata = s
+        self.lexpos = 0
+        self.lexlen = len(s)
+
+    def match(self, code, pos:int, table, master):
+        """(rule name, end) of the token at pos, or None if no rule matches"""
+        entry = table.get(code[pos])
+        if entry is None:
+            for regex, indexfunc in master:
+                m = regex.match(code, pos)
+                if m:
+                    return indexfunc[m.lastindex][1], m.end()
+            return None
+        if entry.__class__ is str:
+            return entry, pos + 1
+        regex, names = entry
+        m = regex.match(code, pos)
+        if m is None:
+            return None
+        return names[m.lastindex], m.end()
+
+    def token(self):
+        code = self.lexdata
+        pos = self.lexpos
+        length = self.lexlen
+        table = self.table.byChar
+        discarded = self.discarded
+        while pos < length:
+            found = self.match(code, pos, table, self.lexre)
+            if found is None:
+                tok = lex_token('error', code[pos:], self.lineno, pos)
+                tok.lexer = self
+                self.lexpos = pos
+                if self.errorf:
+                    self.errorf(tok)
+                raise SyntaxError(f"Illegal character {code[pos]!r} at index {pos}")
+            name, end = found
+            if name in discarded:
+                pos = end
+                continue
+            self.lexpos = end
+            value = code[pos:end]
+            if name == 'ID':
+                name = self.reserved.get(value, 'ID')
+            tok = lex_token(name, value, self.lineno, pos)
+            rule = self.valueRules.get(name)
+            if rule is not None:
+                tok = rule(tok)
+            return tok
+        self.lexpos = pos
+        return None
+
+    def scan(self, code, master, reserved, buffer, newlines, typeIds, errorf) -> None:
+        """Appends all the tokens of code to a TokenBuffer. master are the PLY master
+        regexes for the kind of code (str or bytes), used for non ASCII characters,
+        and reserved the reserved words with keys of that kind. newlines are the
+        offsets of the new lines of code. errorf(pos) is called on an illegal
+        character and must raise"""
+        table = self.table.byChar if isinstance(code, str) else self.bytesTable().byChar
+        # Token type id of each rule, None for discarded ones
+        ids = {name: (None if name in self.discarded else typeIds.get(name)) for name, _ in self.rules}
+        idId = typeIds['ID']
+        reservedIds = {word: typeIds[name] for word, name in reserved.items()}
+        getEntry = table.get
+        appendType = buffer.types.append
+        appendStart = buffer.starts.append
+        appendEnd = buffer.ends.append
+        appendLine = buffer.lines.append
+        appendCol = buffer.cols.append
+        pos = 0
+        length = len(code)
+        line = 1
+        lineStart = 0
+        nextLine = 0
+        lineCount = len(newlines)
+        nextNewline = newlines[0] if lineCount else length
+        while pos < length:
+            entry = getEntry(code[pos])
+            if entry.__class__ is str:
+                typeId = ids[entry]
+                end = pos + 1
+            else:
+                if entry is None:
+                    found = self.match(code, pos, {}, master)
+                    if found is None:
+                        errorf(pos)
+                    name, end = found
+                else:
+                    regex, names = entry
+                    m = regex.match(code, pos)
+                    if m is None:
+                        errorf(pos)
+                    name = names[m.lastindex]
+                    end = m.end()
+                typeId = ids[name]
+                if typeId is None:
+                    pos = end
+                    continue
+                if typeId == idId:
+                    typeId = reservedIds.get(code[pos:end], idId)
+            if pos > nextNewline:
+                while nextLine < lineCount and newlines[nextLine] < pos:
+                    lineStart = newlines[nextLine] + 1
+                    nextLine += 1
+                line = nextLine + 1
+                nextNewline = newlines[nextLine] if nextLine < lineCount else length
+            appendType(typeId)
+            appendStart(pos)
+            appendEnd(end)
+            appendLine(line)
+            appendCol(pos - lineStart + 1)
+            pos = end
+
+
+def lex_token(type, value, lineno:int, lexpos:int):
+    tok = LexToken()
+    tok.type = type
+    tok.value = value
+    tok.lineno = lineno
+    tok.lexpos = lexpos
+    return tok
@@ -1,12 +1,33 @@
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_left
+
 import ply.lex as lex
 from ply.yacc import NullLogger
+from lex_dispatch import DispatchLexer
+
+# Validated master regexes of the rules, reused by the next runs
+LEXTAB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__', 'lextab.pickle')
 
 class Location:
     """Track the location of a token in the code"""
+    # line and column are packed in a single int to keep AST nodes small.
+    # The column is stored shifted by one so the unknown location (-1, -1) fits too.
+    __slots__ = ('packed',)
+    COL_SPAN = 1 << 32
+
+    def __init__(self, lineno:int, col:int) -> None:
+        self.packed = lineno * Location.COL_SPAN + col + 1
+
+    @property
+    def line(self) -> int:
+        return self.packed // Location.COL_SPAN
 
-    def __init__(self, lineno, col) -> None:
-        self.line = str(lineno)
-        self.col = str(col)
+    @property
+    def col(self) -> int:
+        return self.packed % Location.COL_SPAN - 1
 
     def __str__(self) -> str:
         return f"Line {self.line} " +\
@@ -119,16 +140,34 @@ class PS_Lexer:
         'ID'
     ] + list(reserved.values())
 
-    def __init__(self):
+    # Rules that only skip text and never produce a token
+    discarded = ('Comment_Singleline', 'Comment_Multiline', 'newline', 'Whitespace')
+    # Rules that compute the value of their token from its text. They do not use
+    # the lexer instance, so TokenBuffer can call them on tokens it rebuilds.
+    valueRules = ('Number_Char', 'Number_Hex', 'Number_Int', 'Number_Float')
+
+    # 'dispatch' matches tokens through the first character dispatch tables of
+    # lex_dispatch, 'ply' through the PLY master regexes. Both give the same tokens.
+    ENGINES = ('dispatch', 'ply')
+    # Lexer of each engine built by the first PS_Lexer of the process. The next
+    # ones clone it instead of building it again.
+    _built = {}
+    # Master regexes compiled for bytes, by master regex strings
+    _bytesMasters = {}
+
+    def __init__(self, engine:str='dispatch'):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown lexer engine {engine}, expected one of {', '.join(self.ENGINES)}")
+        self.engine = engine
         self.lexer = None
         self.lineno = 0
         self.lexpos = 0
         self.code = ""
+        self.newlines = []
         self.build()
 
     def t_Comment_Singleline(self,t):
         r'//.*'
-        t.lexer.lineno += 1
         pass
         #Discard comment
 
@@ -345,47 +384,247 @@ class PS_Lexer:
         return t
 
     def t_error(self,t):
-        line = str(t.lineno)
-        col = t.lexpos - self.code.rfind('\n', 0, t.lexpos)
+        line, col = self.getLocation(t.lexpos)
 
         raise LexerError("Illegal character", location=Location(line, col), token=t.value)
 
     def t_eof(self,t):
         return None
 
-    # Build the lexer
+    # Build the lexer, or clone the one already built with the same engine
     def build(self, **kwargs):
+        # Lexers built with options are not shared
+        shared = not kwargs
+        built = PS_Lexer._built.get(self.engine) if shared else None
+        if built is not None:
+            self.lexer = built.clone(self)
+            return
+        kwargs.setdefault('picklefile', LEXTAB_PATH)
         self.lexer = lex.lex(module=self, errorlog=NullLogger(), **kwargs)
+        if self.engine == 'dispatch':
+            self.lexer = DispatchLexer(self.lexer, self.discarded, self.reserved, self.valueRules)
+        if shared:
+            PS_Lexer._built[self.engine] = self.lexer
 
     def lexCode(self, code):
-        self.code = code
-        self.lexer.input(code)
+        self.input(code)
         while True:
-            token = self.lexer.token()
+            token = self.token()
             if not token:
                 break
             yield token
 
+    def lexBuffer(self, code) -> 'TokenBuffer':
+        """Lexes the whole code into a TokenBuffer without building a token object per token.
+
+        code can also be UTF-8 encoded bytes or any bytes-like object, such as an
+        mmap of a source file: it is then matched in place and never copied."""
+        if isinstance(code, str):
+            self.input(code)
+            master = self.lexer.lexre
+            reserved = self.reserved
+        else:
+            self.code = code
+            self.newlines = array('q', (m.start() for m in re.finditer(b'\n', code)))
+            master = self.bytesMaster()
+            reserved = {word.encode(): name for word, name in self.reserved.items()}
+        buffer = TokenBuffer(code, self.newlines)
+        if self.engine == 'dispatch':
+            self.lexer.scan(code, master, reserved, buffer, self.newlines, TokenBuffer.typeIds, self.illegal)
+            return buffer
+        typeIds = TokenBuffer.typeIds
+        discarded = self.discarded
+        newlines = self.newlines
+        append = buffer.append
+        pos = 0
+        length = len(code)
+        # Tokens come in order, so the current line only ever moves forward
+        line = 1
+        lineStart = 0
+        while pos < length:
+            for regex, rules in master:
+                m = regex.match(code, pos)
+                if m:
+                    break
+            else:
+                self.illegal(pos)
+            end = m.end()
+            name = rules[m.lastindex][1]
+            if name not in discarded:
+                if name == 'ID':
+                    name = reserved.get(m.group(), 'ID')
+                while line <= len(newlines) and newlines[line - 1] < pos:
+                    lineStart = newlines[line - 1] + 1
+                    line += 1
+                append(typeIds[name], pos, end, line, pos - lineStart + 1)
+            pos = end
+        return buffer
+
+    def illegal(self, pos:int):
+        """Raises the LexerError of an illegal character at pos in the code being lexed"""
+        line, col = self.getLocation(pos)
+        token = self.code[pos:]
+        if not isinstance(token, str):
+            token = bytes(self.code[pos:pos + 32]).decode('utf-8', 'replace')
+        raise LexerError("Illegal character", location=Location(line, col), token=token)
+
+    def bytesMaster(self) -> list:
+        """The master regular expressions of the lexer compiled for bytes"""
+        key = tuple(regex.pattern for regex, _ in self.lexer.lexre)
+        master = PS_Lexer._bytesMasters.get(key)
+        if master is None:
+            master = PS_Lexer._bytesMasters[key] = [
+                (re.compile(regex.pattern.encode('ascii'), regex.flags & ~re.UNICODE), rules)
+                for regex, rules in self.lexer.lexre]
+        return master
+
+    @staticmethod
+    def mapFile(path:str):
+        """Read only memory map of the file at path, to be lexed by lexBuffer"""
+        with open(path, 'rb') as f:
+            try:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can not be mapped
+                return b''
+
+    def lexFile(self, path:str) -> 'TokenBuffer':
+        """Lexes the file at path into a TokenBuffer through a memory map, so the
+        source is never loaded in memory as a whole. The buffer keeps the map open."""
+        return self.lexBuffer(self.mapFile(path))
+
     def input(self, code, **kwargs):
         self.code = code
+        # Offsets of every new line, so the location of a token is a binary search away
+        self.newlines = [m.start() for m in re.finditer('\n', code)]
         self.lexer.input(code, **kwargs)
 
+    def getLocation(self, lexpos):
+        """Returns the (line, column) of the character at lexpos, both starting at 1"""
+        line = bisect_left(self.newlines, lexpos) + 1
+        if line > 1:
+            return line, lexpos - self.newlines[line - 2]
+        return line, lexpos + 1
+
     def token(self):
         tok = self.lexer.token()
         self.lexpos = self.lexer.lexpos
-        self.lineno = self.lexer.lineno
-        
-        line = self.lineno
-        if self.code.rfind('\n', 0, self.lexpos) >= 0:
-            col = self.lexpos - self.code.rfind('\n', 0, self.lexpos)
-        else:
-            col = self.lexpos
+
         if tok is not None:
-            # offset correctly to point to first char of token
-            col += 1 - len(str(tok.value))
+            line, col = self.getLocation(tok.lexpos)
+            tok.lineno = line
             #add location info
             setattr(tok, "line", line)
             setattr(tok, "col", col)
+        else:
+            line, _ = self.getLocation(self.lexpos)
+        self.lineno = line
         return tok
 
-tokens = PS_Lexer.tokens
\ No newline at end of file
+tokens = PS_Lexer.tokens
+
+
+class TokenBuffer:
+    """Tokens of a whole source file stored column wise in int arrays.
+
+    Only the type, offsets and location of each token are stored. Token objects
+    and their values are built from slices of the source when they are read, so a
+    buffer is cheap to keep around, to pickle and to share between processes.
+    A buffer can be given to the parser as its lexer."""
+
+    typeNames = tuple(PS_Lexer.tokens)
+    typeIds = {name: i for i, name in enumerate(typeNames)}
+    valueRules = {PS_Lexer.tokens.index(name): getattr(PS_Lexer, 't_' + name) for name in PS_Lexer.valueRules}
+
+    def __init__(self, code, newlines=()) -> None:
+        # str, or UTF-8 bytes-like code (bytes, mmap...) whose token texts are decoded when read
+        self.code = code
+        self.isText = isinstance(code, str)
+        # Offsets and line numbers are 64 bits: mapped sources can be over 2 GiB
+        self.newlines = array('q', newlines)
+        self.types = array('i')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.lines = array('q')
+        self.cols = array('i')
+        # Parser interface state
+        self.emitTypeIds = False
+        self.position = 0
+        # Index of the token ending the input, None for the end of the buffer
+        self.end = None
+        self.lineno = 1
+        self.lexpos = 0
+
+    def append(self, typeId:int, start:int, end:int, line:int, col:int) -> None:
+        self.types.append(typeId)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.cols.append(col)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    # Same lookup as the lexer, on the newline offsets of the buffer
+    getLocation = PS_Lexer.getLocation
+
+    def typeName(self, index:int) -> str:
+        return self.typeNames[self.types[index]]
+
+    def text(self, index:int) -> str:
+        if self.isText:
+            return self.code[self.starts[index]:self.ends[index]]
+        return str(self.code[self.starts[index]:self.ends[index]], 'utf-8')
+
+    def view(self, index:int):
+        """The source of a token as a slice of the code which does not copy it
+        (a memoryview when the code is bytes-like)"""
+        if self.isText:
+            return self.code[self.starts[index]:self.ends[index]]
+        return memoryview(self.code)[self.starts[index]:self.ends[index]]
+
+    def __getitem__(self, index:int) -> lex.LexToken:
+        typeId = self.types[index]
+        tok = lex.LexToken()
+        tok.type = self.typeNames[typeId]
+        tok.value = self.text(index)
+        tok.lineno = tok.line = self.lines[index]
+        tok.lexpos = self.starts[index]
+        tok.col = self.cols[index]
+        rule = self.valueRules.get(typeId)
+        if rule is not None:
+            tok = rule(None, tok)
+        return tok
+
+    def value(self, index:int):
+        return self[index].value
+
+    def __iter__(self):
+        for i in range(len(self.types)):
+            yield self[i]
+
+    # Same interface as PS_Lexer so the parser can read tokens from the buffer.
+    # With emitTypeIds set, token() gives the type of tokens as their id in
+    # typeNames, which the parser compiled on PS_Lexer.tokens uses directly.
+
+    def input(self, code=None, start:int=0, end:int=None, **kwargs):
+        """Restarts the token stream, from the token at index start to the one
+        before end, so a range of the buffer can be parsed on its own"""
+        self.position = start
+        self.end = end
+        self.lineno = self.lines[start] if start < len(self.types) else 1
+        self.lexpos = self.starts[start] if start < len(self.types) else 0
+
+    def token(self):
+        index = self.position
+        end = len(self.types) if self.end is None else self.end
+        if index >= end:
+            self.lexpos = self.starts[end] if end < len(self.types) else len(self.code)
+            return None
+        self.position = index + 1
+        self.lineno = self.lines[index]
+        self.lexpos = self.ends[index]
+        tok = self[index]
+        if self.emitTypeIds:
+            tok.type = self.types[index]
+        return tok
@@ -1,15 +1,11 @@
+import json
 import os
+import sys
 from argparse import ArgumentParser
 
-from lexer import PS_Lexer
-from parser_tree import parser
+# The compiler is only imported when compiling here, so a --connect client starts fast
 
-def validate_path(path:str):
-    assert(isinstance(path, str))
-    if not os.path.exists(path) or not os.path.isfile(path):
-        raise IOError(f"Given path ({path}) must point to an existing FILE!")
-
-def parse_args():
+def parse_args(argv=None):
     args = ArgumentParser()
     
     args.add_argument("--print-tokens", required=False, default=False, action='store_true', dest='print_tokens',
@@ -18,55 +14,141 @@ def parse_args():
                         help="Prints the code reconstructed from the token list (Removes white space and comments)")
     args.add_argument("--print-ast", required=False, default=False, action='store_true', dest='print_ast',
                         help="Prints the abstract syntax tree on a single line")
+    args.add_argument("--token-buffer", required=False, default=False, action='store_true', dest='token_buffer',
+                        help="Lexes the file once into a compact token buffer shared by all the stages")
+    args.add_argument("--mmap", required=False, default=False, action='store_true', dest='mmap',
+                        help="Lexes the files through a memory map instead of reading them (implies --token-buffer)")
+    args.add_argument("--no-cache", required=False, default=False, action='store_true', dest='no_cache',
+                        help="Always lexes, parses and types all of the file instead of using the cached abstract syntax tree (and typing results with --typing-cache)")
+    args.add_argument("--typing-cache", required=False, default=False, action='store_true', dest='typing_cache',
+                        help="Only types again the function bodies which changed since the last compilation. Faster when only typing (-C T) or when the file has typing errors, slower otherwise")
+    args.add_argument("--cache-dir", required=False, default=None, dest='cache_dir',
+                        help="Directory of the abstract syntax tree and typing caches (default: __pscache__ next to the file)")
+    args.add_argument("--cache-size", required=False, type=int, default=64, dest='cache_size',
+                        help="Size in MiB over which the least recently used cached trees are removed (default: 64)")
+    args.add_argument("--cache-stats", required=False, default=False, action='store_true', dest='cache_stats',
+                        help="Prints the cache hits, misses, stores and evictions, and with --typing-cache the function bodies typed again or reused")
+    args.add_argument("--time-stages", required=False, default=False, action='store_true', dest='time_stages',
+                        help="Prints the wall time, CPU time, peak memory and throughput of each stage of each file")
+    args.add_argument("--profile-json", required=False, default=None, metavar='JSON_FILE', dest='profile_json',
+                        help="Writes the measures of --time-stages to the given JSON file")
+    args.add_argument("--trace-memory", required=False, default=False, action='store_true', dest='trace_memory',
+                        help="Also measures the peak memory of each stage with tracemalloc (makes the stages several times slower)")
     args.add_argument('-C','--compile-to', required=False, choices=['L', 'P', 'T', 'R', 'E', 'L', 'B'], dest='stage', default='B',
                       help="Compiles until the given stage: L=Lexer, P=Parser, T=Typing, R=RTL, E=ERTL, L=LTL, B=ByteCode (default)")
-    args.add_argument("filepath", metavar='FILE', help="The code file to pass to the compiler")
-
-    return args.parse_args()
-
-if __name__ != '__main__':
-    exit(0)
-
-args = parse_args()
-code = ""
-with open(args.filepath, 'r') as f:
-    code = f.read()
-
-if args.print_tokens:
-    l = PS_Lexer()
-    print("Printing tokens:")
-    for tok in l.lexCode(code):
-        print('\t'+str(tok), flush=False)
-    print('\n', flush=True)
-
-if args.print_reconstructed_code:
-    l = PS_Lexer()
-    print("Printing reconstructed code:")
-    for tok in l.lexCode(code):
-        print(tok.value, end=" ", flush=False)
-    print('\n', flush=True)
-
-if args.stage == 'L': #Lex only
-    exit(0)
-
-p = parser.parse(code, tracking=True, lexer=PS_Lexer())
-if args.print_ast:
-    print(p)
-
-if args.stage == 'P': #Parse only
-    exit(0)
-
-if args.stage == 'T': #Typing only
-    exit(0)
-
-if args.stage == 'R': #RTL only
-    exit(0)
-
-if args.stage == 'E': #ERTL only
-    exit(0)
-
-if args.stage == 'L': #LTL only
-    exit(0)
-
-if args.stage == 'B':  # Compiled all the way to byte code
-    exit(0)
+    args.add_argument("-j", "--jobs", required=False, type=int, default=1,
+                        help="Number of worker processes compiling the files in parallel (default: 1)")
+    args.add_argument("--typing-jobs", required=False, type=int, default=1, dest='typing_jobs',
+                        help="Number of forked processes checking the function bodies of each file in parallel (default: 1)")
+    args.add_argument("--daemon", required=False, default=False, action='store_true', dest='daemon',
+                        help="Serves the compilations of --connect clients on a local socket, keeping the lexer, the parser and the caches loaded in --jobs worker processes")
+    args.add_argument("--connect", required=False, default=False, action='store_true', dest='connect',
+                        help="Has the daemon compile the files, or compiles them here if no daemon is listening")
+    args.add_argument("--socket", required=False, default=None, metavar='PATH', dest='socket',
+                        help="Unix socket of the daemon (default: psc.sock in $XDG_RUNTIME_DIR, or in a private psc-<uid> folder of the temporary folder)")
+    args.add_argument("--idle-timeout", required=False, type=float, default=600, metavar='SECONDS', dest='idle_timeout',
+                        help="Seconds without requests after which the daemon exits (default: 600)")
+    args.add_argument("--watch", required=False, default=None, metavar='DIR', dest='watch',
+                        help="Compiles the .psc files of DIR, then recompiles the changed files until interrupted")
+    args.add_argument("--poll-interval", required=False, type=float, default=0.5, metavar='SECONDS', dest='poll_interval',
+                        help="Seconds between two scans of the watched files (default: 0.5)")
+    args.add_argument("filepaths", metavar='FILE', nargs='*',
+                        help="The code files to pass to the compiler, directories are searched for .psc files")
+
+    parser = args
+    args = parser.parse_args(argv)
+    if not args.filepaths and not args.daemon and args.watch is None:
+        parser.error("the following arguments are required: FILE")
+    # Profiled runs lex into a token buffer first, so lexer and parser are timed apart
+    args.profile = args.time_stages or args.profile_json is not None or args.trace_memory
+    return args
+
+def print_profile(path:str, profile:list, out=print):
+    out(f"Stages of {path}:")
+    for stage in profile:
+        line = f"\t{stage.stage:<8} wall {stage.wall * 1000:9.2f}ms  cpu {stage.cpu * 1000:9.2f}ms"
+        if stage.peakMemory is not None:
+            line += f"  peak {stage.peakMemory / 1024:9.1f}KiB"
+        if stage.tokens is not None:
+            line += f"  {stage.tokens} tokens ({stage.tokens / max(stage.wall, 1e-9):.0f}/s)"
+        if stage.nodes is not None:
+            line += f"  {stage.nodes} nodes ({stage.nodes / max(stage.wall, 1e-9):.0f}/s)"
+        if stage.folded is not None:
+            line += f"  {stage.folded} folded"
+        if stage.cached:
+            line += "  (cached)"
+        out(line)
+
+def write_profile(filepath:str, results:list):
+    totals = {}
+    for _, profile in results:
+        for stage in profile:
+            total = totals.setdefault(stage.stage, {'files': 0, 'wall': 0.0, 'cpu': 0.0, 'peakMemory': None, 'tokens': 0, 'nodes': 0, 'folded': 0})
+            total['files'] += 1
+            total['wall'] += stage.wall
+            total['cpu'] += stage.cpu
+            if stage.peakMemory is not None:
+                total['peakMemory'] = max(total['peakMemory'] or 0, stage.peakMemory)
+            total['tokens'] += stage.tokens or 0
+            total['nodes'] += stage.nodes or 0
+            total['folded'] += stage.folded or 0
+    data = {
+        'files': [{'path': path, 'stages': [stage.asDict() for stage in profile]} for path, profile in results],
+        'totals': totals,
+    }
+    with open(filepath, 'w') as f:
+        json.dump(data, f, indent=2)
+
+def print_error(line:str):
+    print(line, file=sys.stderr, flush=True)
+
+def run(args, out=print, err=print_error, executor=None, cwd:str=None, paths:list=None) -> int:
+    """Compiles the files of args, or the given paths, returns the exit status.
+    out and err are given the lines to print; the daemon compiles with its pool of workers from the working directory of its client"""
+    from driver import compile_files, source_files
+
+    if paths is None:
+        paths = source_files(args.filepaths, cwd)
+    if args.jobs < 1:
+        raise ValueError(f"--jobs must be at least 1, got {args.jobs}")
+    if args.typing_jobs < 1:
+        raise ValueError(f"--typing-jobs must be at least 1, got {args.typing_jobs}")
+
+    failed = 0
+    cache_stats = {}
+    profiles = []
+    # Results come back in the order of the files, whichever worker compiled them
+    for result in compile_files(paths, args, args.jobs, executor, cwd):
+        for line in result.output:
+            out(line)
+        for name, count in result.cacheStats.items():
+            cache_stats[name] = cache_stats.get(name, 0) + count
+        if result.profile:
+            profiles.append((result.path, result.profile))
+            if args.time_stages:
+                print_profile(result.path, result.profile, out)
+        if result.error is not None:
+            failed += 1
+            err(result.error)
+
+    if args.cache_stats and not args.no_cache:
+        out("Cache: " + ", ".join(f"{count} {name}" for name, count in cache_stats.items()))
+    if args.profile_json is not None:
+        write_profile(os.path.join(cwd or '', args.profile_json), profiles)
+    if len(paths) > 1:
+        out(f"Compiled {len(paths) - failed} of {len(paths)} files")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.daemon:
+        from daemon import serve
+        exit(serve(args.socket, args.jobs, args.idle_timeout))
+    if args.watch is not None:
+        from watch import watch
+        exit(watch(args))
+    status = None
+    if args.connect:
+        from daemon import forward
+        status = forward(sys.argv[1:], args.socket)
+    exit(run(args) if status is None else status)
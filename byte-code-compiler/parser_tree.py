@@ -1,9 +1,9 @@
+import os
 import ply.yacc as yacc
 from ply.lex import LexToken
 from ply.yacc import YaccProduction
-from lexer import tokens, Location
+from lexer import tokens, Location, PS_Lexer
 from operations import BinaryOperation, UnaryOperation
-from copy import deepcopy
 
 
 class ParsingError(SyntaxError):
@@ -17,32 +17,122 @@ class ParsingError(SyntaxError):
 
 # P.... classes are there to build the abstract syntax tree
 
+# Slots which later stages fill on the nodes of a parsed tree (the type of an
+# expression...). They are not fields: not printed, copied nor cached.
+ANNOTATIONS = frozenset({'type', 'symbol', 'frameSize'})
+
+
 class PTreeElem:
+    # Nodes are slotted to keep big trees small. Each class only lists the
+    # attributes it adds, its own ones come first when it gets printed.
+    __slots__ = ('location',)
+
     def __init__(self, location) -> None:
         self.location = location
 
+    @classmethod
+    def fields(cls) -> tuple:
+        """Names of all the attributes of the node, in printing order"""
+        fields = cls.__dict__.get('_fields')
+        if fields is None:
+            fields = tuple(name for klass in cls.__mro__
+                           for name in klass.__dict__.get('__slots__', ()) if name not in ANNOTATIONS)
+            setattr(cls, '_fields', fields)
+        return fields
+
+    # Trees can be deeper than the recursion limit (long operator chains), so
+    # printing and copying walk them with an explicit stack.
+
     def __repr__(self):
-        return self.__class__.__name__+f"({self.__dict__})"
+        parts = []
+        stack = [(self, False)]
+        while stack:
+            elem, text = stack.pop()
+            if text:
+                parts.append(elem)
+            elif isinstance(elem, PTreeElem):
+                todo = [(elem.__class__.__name__ + "({", True)]
+                for i, name in enumerate(elem.fields()):
+                    todo.append((("" if i == 0 else ", ") + repr(name) + ": ", True))
+                    todo.append((getattr(elem, name), False))
+                todo.append(("})", True))
+                stack.extend(reversed(todo))
+            elif isinstance(elem, list):
+                todo = [("[", True)]
+                for i, item in enumerate(elem):
+                    if i:
+                        todo.append((", ", True))
+                    todo.append((item, False))
+                todo.append(("]", True))
+                stack.extend(reversed(todo))
+            else:
+                parts.append(repr(elem))
+        return "".join(parts)
+
+    def __copy__(self):
+        copy = object.__new__(self.__class__)
+        for name in self.fields():
+            setattr(copy, name, getattr(self, name))
+        return copy
+
+    def __deepcopy__(self, memo=None):
+        """Copies the nodes and lists of the tree, leaves (locations, names,
+        operations...) are shared as they are never modified"""
+        memo = {} if memo is None else memo
+        root = memo.get(id(self))
+        if root is not None:
+            return root
+        root = self.__copy__()
+        memo[id(self)] = root
+        # Copied containers whose children still point to the original tree
+        stack = [root]
+        while stack:
+            elem = stack.pop()
+            if isinstance(elem, list):
+                children = enumerate(elem)
+            else:
+                children = ((name, getattr(elem, name)) for name in elem.fields())
+            for key, child in list(children):
+                if isinstance(child, (PTreeElem, list)):
+                    copy = memo.get(id(child))
+                    if copy is None:
+                        copy = child.__copy__() if isinstance(child, PTreeElem) else list(child)
+                        memo[id(child)] = copy
+                        stack.append(copy)
+                    if isinstance(elem, list):
+                        elem[key] = copy
+                    else:
+                        setattr(elem, key, copy)
+        return root
 
 
 class PIdentifier(PTreeElem):
+    # symbol: Variable or Function named, set by the typing stage
+    __slots__ = ('identifier', 'symbol')
+
     def __init__(self, location, identifier:str):
         self.identifier = identifier
         super().__init__(location)
 
 
 class PType(PTreeElem):
-    def __init__(self, location, typ: str) -> None:
-        self.typ = typ
+    __slots__ = ('type_identifier',)
+
+    def __init__(self, location, type_identifier):
+        self.type_identifier = type_identifier
         super().__init__(location)
 
 
 class PArray(PType):
+    __slots__ = ()
+
     def __init__(self, location, arrType: PType) -> None:
         super().__init__(location, arrType)
 
 
 class PScope(PTreeElem):
+    __slots__ = ('funcDecl', 'varDecl', 'statements')
+
     def __init__(self, location, *, functions=None, varDecl=None, statements=None):
         self.funcDecl = functions
         self.varDecl = varDecl
@@ -51,6 +141,9 @@ class PScope(PTreeElem):
 
 
 class PModule(PScope):
+    # frameSize: number of slots of the globals, set by the typing stage
+    __slots__ = ('classDecl', 'frameSize')
+
     def __init__(self, location, *, functions=None, varDecl=None, classDecl=None, statements=None):
         self.classDecl = classDecl
         super().__init__(location, functions=functions,
@@ -58,6 +151,9 @@ class PModule(PScope):
 
 
 class PClassDecl(PScope):
+    # frameSize: number of fields of the instances, set by the typing stage
+    __slots__ = ('identifier', 'inner_scope', 'frameSize')
+
     def __init__(self, location, identifier, inner_scope, parentClassId=None, interfaces=None):
         self.identifier = identifier
         self.inner_scope = inner_scope
@@ -66,17 +162,24 @@ class PClassDecl(PScope):
 
 
 class PStatement(PTreeElem):
+    __slots__ = ()
+
     def __init__(self, location):
         super().__init__(location)
 
 
 class PExpression(PStatement):
+    # type: Type of the value, set by the typing stage
+    __slots__ = ('rvalue', 'type')
+
     def __init__(self, location, rvalue):
         self.rvalue = rvalue
         super().__init__(location)
 
 
 class PEnum(PScope):
+    __slots__ = ('identifier', 'enum_values')
+
     def __init__(self, location, identifier, values: list[PStatement]):
         self.identifier = identifier
         self.enum_values = values
@@ -86,6 +189,9 @@ class PVarDecl:
     pass
 
 class PFuncDecl(PTreeElem):
+    # frameSize: number of slots of the arguments and locals, set by the typing stage
+    __slots__ = ('returnType', 'id', 'args', 'body', 'frameSize')
+
     def __init__(self, location, returnType: PType, id: PIdentifier, args: list[PVarDecl], body: PScope):
         self.returnType = returnType
         self.id = id
@@ -95,22 +201,22 @@ class PFuncDecl(PTreeElem):
 
 
 class PlValue(PExpression):
+    __slots__ = ()
+
     def __init__(self, location, lvalue):
         super().__init__(location, lvalue)
 
 
-class PType(PTreeElem):
-    def __init__(self, location, type_identifier):
-        self.type_identifier = type_identifier
-        super().__init__(location)
-
-
 class PUType(PType):
+    __slots__ = ()
+
     def __init__(self, location, type_identifier):
         super().__init__(location, type_identifier)
 
 
 class PNumeric(PExpression):
+    __slots__ = ('typ',)
+
     def __init__(self, location, value):
         if isinstance(value, float):
             self.typ = "float"
@@ -121,20 +227,26 @@ class PNumeric(PExpression):
 class PIndex(PExpression):
     """for indexing : array[idx]"""
 
+    __slots__ = ('index',)
+
     def __init__(self, location, array: PExpression, idx: PExpression):
         if location is None:
             location = idx.location
-        self.index = idx.rvalue
+        self.index = idx
         super().__init__(location, array)
 
 
 class PDot(PlValue):
+    __slots__ = ('left',)
+
     def __init__(self, location, left, right):
         self.left = left
-        super().__init__(location, rvalue=right)
+        super().__init__(location, right)
 
 
 class PVarDecl(PlValue):
+    __slots__ = ('typ', 'id')
+
     def __init__(self, location, typ: PType, id: PIdentifier):
         self.typ = typ
         self.id = id
@@ -142,6 +254,8 @@ class PVarDecl(PlValue):
         
 
 class PBinOp(PExpression):
+    __slots__ = ('left', 'op')
+
     def __init__(self, location, left: PExpression, op: BinaryOperation, right: PExpression):
         self.left = left
         self.op = op
@@ -149,22 +263,30 @@ class PBinOp(PExpression):
 
 
 class PAssign(PBinOp):
+    __slots__ = ()
+
     def __init__(self, location, lvalue: PlValue, rvalue: PExpression):
         super().__init__(location, left=lvalue, right=rvalue, op=None)
 
 
 class PCopyAssign(PBinOp):
+    __slots__ = ()
+
     def __init__(self, location, lvalue: PlValue, rvalue: PExpression):
         super().__init__(location, left=lvalue, right=rvalue, op=None)
 
 
 class PUnOp(PExpression):
+    __slots__ = ('op',)
+
     def __init__(self, location, op: UnaryOperation, right: PExpression):
         self.op = op
         super().__init__(location, right)
 
 
 class PCall(PExpression):
+    __slots__ = ('id', 'args')
+
     def __init__(self, location, id: PIdentifier, args=list[PExpression]):
         self.id = id
         self.args = args
@@ -172,36 +294,50 @@ class PCall(PExpression):
 
 
 class PSkip(PStatement):
+    __slots__ = ()
+
     def __init__(self, location):
         super().__init__(location)
         # do nothing empty block
 
 class PReturn(PStatement):
+    __slots__ = ('returnVal',)
+
     def __init__(self, location, returnVal: PExpression):
         self.returnVal = returnVal
         super().__init__(location)
 
 class PAssert(PStatement):
+    __slots__ = ('assertExpr',)
+
     def __init__(self, location, assertExpr: PExpression):
         self.assertExpr = assertExpr
         super().__init__(location)
 
 class PString(PExpression):
+    __slots__ = ()
+
     def __init__(self, location, value: str):
         super().__init__(location, value)
 
 
 class PContinue(PStatement):
+    __slots__ = ()
+
     def __init__(self, location):
         super().__init__(location)
 
 
 class PBreak(PStatement):
+    __slots__ = ()
+
     def __init__(self, location):
         super().__init__(location)
 
 
 class PIf(PStatement):
+    __slots__ = ('condition', 'if_true', 'if_false')
+
     def __init__(self, location, condition: PExpression, if_true: PScope, if_false: PScope = None):
         self.condition = condition
         self.if_true = if_true
@@ -210,6 +346,8 @@ class PIf(PStatement):
 
 
 class PTernary(PStatement):
+    __slots__ = ('condition', 'if_true', 'if_false', 'type')
+
     def __init__(self, location, condition: PExpression, if_true: PReturn, if_false: PReturn):
         self.condition = condition
         self.if_true = if_true
@@ -218,6 +356,8 @@ class PTernary(PStatement):
 
 
 class PWhile(PStatement):
+    __slots__ = ('condition', 'bloc')
+
     def __init__(self, location, condition: PExpression, bloc: PScope):
         self.condition = condition
         self.bloc = bloc
@@ -225,6 +365,8 @@ class PWhile(PStatement):
 
 
 class PFor(PStatement):
+    __slots__ = ('init', 'condition', 'postExpr', 'bloc')
+
     def __init__(self, location, init: PStatement, condition: PExpression, postExpr: PStatement, bloc: PScope):
         self.init = init
         self.condition = condition
@@ -233,12 +375,16 @@ class PFor(PStatement):
         super().__init__(location)
         
 class PCast(PExpression):
+    __slots__ = ('cast_to',)
+
     def __init__(self, location, cast_to:PType, rvalue:PExpression):
         self.cast_to = cast_to
         super().__init__(location, rvalue)
 
 
 class PForeach(PStatement):
+    __slots__ = ('varDecl', 'iterable', 'bloc')
+
     def __init__(self, location, varDecl: PVarDecl, iterable: PIdentifier, bloc: PScope):
         self.varDecl = varDecl
         self.iterable = iterable
@@ -246,23 +392,45 @@ class PForeach(PStatement):
         super().__init__(location)
         
 class PNewObj(PExpression):
+    __slots__ = ('object', 'args')
+
     def __init__(self, location, object:PType, arguments:list[PExpression]):
         self.object = object
         self.args = arguments
         super().__init__(location, object)
         
 class PNewArray(PExpression):
+    __slots__ = ('typ',)
+
     def __init__(self, location, typ:PType, array_length:PExpression):
         self.typ = typ
         super().__init__(location,array_length)
 
 class PImport(PStatement):
+    __slots__ = ('module', 'item')
+
     def __init__(self, location, module: PIdentifier, item: PIdentifier):
         self.module = module
         self.item = item
         super().__init__(location)
 
 
+def count_nodes(tree) -> int:
+    """Number of distinct nodes in a tree, or in a list of trees"""
+    count = 0
+    seen = set()
+    stack = [tree]
+    while stack:
+        elem = stack.pop()
+        if isinstance(elem, list):
+            stack.extend(elem)
+        elif isinstance(elem, PTreeElem) and id(elem) not in seen:
+            seen.add(id(elem))
+            count += 1
+            stack.extend(getattr(elem, name) for name in elem.fields())
+    return count
+
+
 # p_..... functions are for building the grammar
 
 precedence = (
@@ -290,9 +458,35 @@ precedence = (
 start = 'Module'
 
 
+def _location(p: YaccProduction, index: int = 1) -> Location:
+    """Location of the first token of the index-th symbol of a production.
+
+    It is read from the symbol itself (a token, or the node built for a
+    nonterminal), so the parser does not need to track positions."""
+    symbol = p.slice[index]
+    if isinstance(symbol, LexToken):
+        return Location(symbol.lineno, symbol.col)
+    location = getattr(symbol, 'location', None)
+    if location is not None:
+        return location
+    value = symbol.value
+    while isinstance(value, list) and value:
+        value = value[0]
+    if isinstance(value, PTreeElem):
+        return value.location
+    # empty production: current position of the lexer
+    return Location(*p.lexer.getLocation(p.lexer.lexpos))
+
+
+def _keep_location(p: YaccProduction):
+    """For rules passing a node through unchanged: remembers on the produced
+    symbol where the production started when it is not the node's location"""
+    p.slice[0].location = _location(p)
+
+
 def p_module(p: YaccProduction):
     """Module : GlobalStatementList"""
-    p[0] = deepcopy(p[1])
+    p[0] = p[1]
 
 
 def p_statement(p: YaccProduction):
@@ -308,77 +502,78 @@ def p_statement(p: YaccProduction):
                  | Continue
                  | Expr Punctuation_EoL
                  | ignore"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
     if p[1] is None:
         raise ParsingError()
+    if getattr(p.slice[1], 'location', None) is not None:
+        _keep_location(p)
     p[0] = p[1]
 
 
 def p_scope(p: YaccProduction):
     """Scope : Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
+    _keep_location(p)
     p[0] = p[2]
 
 
-def p_all_statements_statement(p: YaccProduction):
-    """GlobalStatementList : StatementList"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
-    p[0] = PModule(loc, functions=deepcopy(p[1].funcDecl), varDecl=deepcopy(
-        p[1].varDecl), classDecl=[], statements=deepcopy(p[1].statements))
+# StatementList, GlobalStatementList and TypedArgs are left recursive: each new
+# element is reduced as soon as it is complete and appended to the list built so
+# far, so the parse stack does not grow with the number of elements.
+
+def _is_empty(scope: PScope) -> bool:
+    if isinstance(scope, PModule) and scope.classDecl:
+        return False
+    return not (scope.funcDecl or scope.varDecl or scope.statements)
+
+
+def _add_to_scope(scope: PScope, statement, loc: Location) -> PScope:
+    if _is_empty(scope):
+        # The scope starts at its first statement
+        scope.location = loc
+    if isinstance(statement, PVarDecl):
+        scope.varDecl.append(statement)
+    elif isinstance(statement, PFuncDecl):
+        scope.funcDecl.append(statement)
+    else:
+        scope.statements.append(statement)
+    return scope
+
+
+def p_all_statements_empty(p: YaccProduction):
+    """GlobalStatementList : empty"""
+    loc = _location(p)
+    p[0] = PModule(loc, functions=[], varDecl=[], classDecl=[], statements=[])
 
 
-def p_all_statements_classDecl(p: YaccProduction):
-    """GlobalStatementList : ClassDecl"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
-    p[0] = PModule(loc, functions=[], varDecl=[],
-                   classDecl=[p[1]], statements=[])
+# When streaming (see parse_declarations) top level declarations and statements
+# are handed over as soon as they are reduced instead of being kept in the module.
 
 def p_all_statements_addStatement(p: YaccProduction):
-    """GlobalStatementList : Statement GlobalStatementList"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
-    if isinstance(p[1], PVarDecl):
-        p[0] = PModule(loc, functions=deepcopy(p[2].funcDecl), varDecl=[p[1]]+deepcopy(
-            p[2].varDecl), classDecl=deepcopy(p[2].classDecl), statements=deepcopy(p[2].statements))
-    elif isinstance(p[1], PFuncDecl):
-        p[0] = PModule(loc, functions=[p[1]]+deepcopy(p[2].funcDecl), varDecl=deepcopy(
-            p[2].varDecl), classDecl=deepcopy(p[2].classDecl), statements=deepcopy(p[2].statements))
+    """GlobalStatementList : GlobalStatementList Statement"""
+    if p.emit(p[2]):
+        p[0] = p[1]
     else:
-        p[0] = PModule(loc, functions=deepcopy(p[2].funcDecl), varDecl=deepcopy(
-            p[2].varDecl), classDecl=deepcopy(p[2].classDecl), statements=[p[1]]+deepcopy(p[2].statements))
+        p[0] = _add_to_scope(p[1], p[2], _location(p, 2))
+
+
+def p_all_statements_addClassDecl(p: YaccProduction):
+    """GlobalStatementList : GlobalStatementList ClassDecl"""
+    module = p[1]
+    if not p.emit(p[2]):
+        if _is_empty(module):
+            module.location = _location(p, 2)
+        module.classDecl.append(p[2])
+    p[0] = module
 
-def p_all_statements_addSClassDecl(p: YaccProduction):
-    """GlobalStatementList : ClassDecl GlobalStatementList"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
-    p[0] = PModule(loc, functions=deepcopy(p[2].funcDecl), varDecl=deepcopy(
-        p[2].varDecl), classDecl=[p[1]]+deepcopy(p[2].classDecl), statements=deepcopy(p[2].statements))
 
 def p_bloc_empty(p: YaccProduction):
     """StatementList : empty"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PScope(loc, functions=[], varDecl=[], statements=[])
 
-def p_bloc_single(p: YaccProduction):
-    """StatementList : Statement"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
-    if isinstance(p[1], PVarDecl):
-        p[0] = PScope(loc, functions=[], varDecl=[p[1]], statements=[])
-    elif isinstance(p[1], PFuncDecl):
-        p[0] = PScope(loc, functions=[p[1]], varDecl=[], statements=[])
-    else:
-        p[0] = PScope(loc, functions=[], varDecl=[], statements=[p[1]])
-
 
 def p_bloc_list(p: YaccProduction):
-    """StatementList : Statement StatementList"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
-    if isinstance(p[1], PVarDecl):
-        p[0] = PScope(loc, functions=deepcopy(p[2].funcDecl), varDecl=[p[1]]+deepcopy(
-            p[2].varDecl), statements=deepcopy(p[2].statements))
-    elif isinstance(p[1], PFuncDecl):
-        p[0] = PScope(loc, functions=[p[1]]+deepcopy(p[2].funcDecl), varDecl=deepcopy(
-            p[2].varDecl), statements=deepcopy(p[2].statements))
-    else:
-        p[0] = PScope(loc, functions=deepcopy(p[2].funcDecl), varDecl=deepcopy(
-            p[2].varDecl), statements=[p[1]]+deepcopy(p[2].statements))
+    """StatementList : StatementList Statement"""
+    p[0] = _add_to_scope(p[1], p[2], _location(p, 2))
 
 def p_empty(p: YaccProduction):
     'empty :'
@@ -390,7 +585,7 @@ def p_utype(p: YaccProduction):
             | Keyword_Type_Mod_Unsigned Keyword_Type_Int32
             | Keyword_Type_Mod_Unsigned Keyword_Type_Int64
             | Keyword_Type_Mod_Unsigned Keyword_Type_Char"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PUType(loc, p[2])
 
 
@@ -404,72 +599,72 @@ def p_type(p: YaccProduction):
             | Keyword_Type_Float_64
             | Keyword_Type_Char
             | Keyword_Type_Boolean"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PType(loc, p[1])
     
     
 def p_cast(p:YaccProduction):
     """Expr : Punctuation_OpenParen Type Punctuation_CloseParen Expr"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PCast(loc, p[2], p[4])
     
     
 def p_cast_2(p:YaccProduction):
     """Expr : Punctuation_OpenParen Ident Punctuation_CloseParen Expr"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     typ = PType(loc, p[2].identifier)
     p[0] = PCast(loc, typ, p[4])
 
 
 def p_var_declaration(p: YaccProduction):
     """VarDecl : Ident Ident Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     typ = PType(loc, p[1].identifier)
     p[0] = PVarDecl(loc, p[1], p[2])
     
 def p_var_declaration_2(p: YaccProduction):
     """VarDecl : Type Ident Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PVarDecl(loc, p[1], p[2])
 
 def p_var_declaration_and_assignment(p:YaccProduction):
     """VarDecl : Ident Ident Operator_Binary_Affectation Expr Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PAssign(loc, PVarDecl(loc, PType(loc, p[1].identifier),p[2]), p[4])
 
 def p_var_declaration_and_assignment_2(p:YaccProduction):
     """VarDecl : Type Ident Operator_Binary_Affectation Expr Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PAssign(loc, PVarDecl(loc, p[1],p[2]), p[4])
 
 
 def p_break(p: YaccProduction):
     """Break : Keyword_Control_Break Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PBreak(loc)
 
 
 def p_continue(p: YaccProduction):
     """Continue : Keyword_Control_Continue Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PContinue(loc)
 
 
 def p_return_void(p: YaccProduction):
     """Return : Keyword_Control_Return Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PReturn(loc, None)
 
 
 def p_return_value(p: YaccProduction):
     """Return : Keyword_Control_Return Expr Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PReturn(loc, p[2])
 
 
 def p_var_assignment(p: YaccProduction):
     """VarAssign : Ident Operator_Binary_Affectation Expr Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PAssign(loc, p[1], p[3])
 
 
@@ -480,12 +675,12 @@ def p_expr(p: YaccProduction):
             | ArrayIndex
             | FuncCall
             | String"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PExpression(loc, p[1])
 
 def p_string(p: YaccProduction):
     """String : Literal_String"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PString(loc, p[1])
 
 
@@ -494,7 +689,7 @@ def p_number(p: YaccProduction):
               | Number_Hex
               | Number_Int
               | Number_Float"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PNumeric(loc, p[1])
 
 
@@ -507,31 +702,31 @@ def p_expr_list(p: YaccProduction):
 
 def p_index(p: YaccProduction):
     """ArrayIndex : Expr Punctuation_OpenBracket Expr Punctuation_CloseBracket"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PIndex(loc, p[1], p[3])
 
 
 def p_new_array(p: YaccProduction):
     """Expr : Keyword_Object_New Ident Punctuation_OpenBracket Expr Punctuation_CloseBracket"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PNewArray(loc, PType(p[2].location, p[2].identifier), p[4])
 
 
 def p_new_array_2(p: YaccProduction):
     """Expr : Keyword_Object_New Type Punctuation_OpenBracket Expr Punctuation_CloseBracket"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PNewArray(loc, p[2], p[4])
 
 
 def p_new_obj(p: YaccProduction):
     """Expr : Keyword_Object_New Ident Punctuation_OpenParen ExprList Punctuation_CloseParen"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PNewObj(loc, PType(p[2].location, p[2].identifier), p[4])
 
 
 def p_new_obj_2(p: YaccProduction):
     """Expr : Keyword_Object_New Type Punctuation_OpenParen ExprList Punctuation_CloseParen"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PNewObj(loc, p[2], p[4])
 
 
@@ -555,19 +750,20 @@ def p_binop(p: YaccProduction):
             | Expr Operator_Binary_Shr Expr
             | Expr Operator_Binary_Bool_Or Expr
             | Expr Operator_Binary_Bool_And Expr"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PBinOp(loc, p[1], BinaryOperation(p[2]), p[3])
 
 
 def p_paren(p: YaccProduction):
     """Expr : Punctuation_OpenParen Expr Punctuation_CloseParen"""
+    _keep_location(p)
     p[0] = p[2]
 
 
 def p_UnOp(p: YaccProduction):
     '''Expr : Operator_Minus Expr
             | Operator_Unary_Not Expr %prec UNOP'''
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PUnOp(loc, UnaryOperation(p[1]), p[2])
 
 
@@ -576,7 +772,7 @@ def p_UnOp_IncDec(p: YaccProduction):
             | Ident Operator_Unary_Inc %prec UNOP
             | ArrayIndex Operator_Unary_Dec %prec UNOP
             | ArrayIndex Operator_Unary_Inc %prec UNOP'''
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PUnOp(loc, UnaryOperation(p[2]), p[1])
 
 
@@ -585,7 +781,7 @@ def p_ignore(p: YaccProduction):
               | Comment_Multiline
               | Whitespace
               | Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PSkip(loc)
 
 
@@ -608,7 +804,7 @@ def p_binop_assign(p: YaccProduction):
                   | ArrayIndex Operator_Binary_XorEq Expr
                   | ArrayIndex Operator_Binary_ShlEq Expr
                   | ArrayIndex Operator_Binary_ShrEq Expr"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PAssign(loc, p[1], PBinOp(
         loc, p[1], BinaryOperation(p[2].strip('=')), p[3]))
 
@@ -616,138 +812,140 @@ def p_binop_assign(p: YaccProduction):
 def p_copy_assign(p: YaccProduction):
     """VarAssign : Ident Operator_Binary_Copy Expr Punctuation_EoL
                  | ArrayIndex Operator_Binary_Copy Expr Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PCopyAssign(loc, p[1], p[3])
 
 
 def p_array_literal(p: YaccProduction):
     """ArrayLiteral : Punctuation_OpenBracket ExprList Punctuation_CloseBracket"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
-    p[0] = PExpression(loc, p[1])
+    loc = _location(p)
+    p[0] = PExpression(loc, p[2])
 
 
 def p_call(p: YaccProduction):
     """FuncCall : Ident Punctuation_OpenParen ExprList Punctuation_CloseParen %prec UNOP""" 
     #add precedence to avoid 'Ident (Expr)' getting reduced to 'Ident Expr'
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PCall(loc, p[1], p[3])
 
 
 def p_true(p: YaccProduction):
     """Expr : Keyword_Object_True"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PExpression(loc, True)
 
 
 def p_false(p: YaccProduction):
     """Expr : Keyword_Object_False"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PExpression(loc, False)
 
 
 def p_null(p: YaccProduction):
     """Expr : Keyword_Object_Null"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PExpression(loc, None)
 
 def p_typed_args_single(p: YaccProduction):
     """TypedArgs : Type Ident"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = [PVarDecl(loc, p[1], p[2])]
     
 def p_typed_args_single_2(p: YaccProduction):
     """TypedArgs : Ident Ident"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = [PVarDecl(loc, PType(loc, p[1].identifier), p[2])]
 
 def p_typed_args_multiple(p: YaccProduction):
-    """TypedArgs : Type Ident Punctuation_Comma TypedArgs"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
-    p[0] = [PVarDecl(loc, p[1], p[2])] + deepcopy(p[4])
+    """TypedArgs : TypedArgs Punctuation_Comma Type Ident"""
+    loc = _location(p, 3)
+    p[1].append(PVarDecl(loc, p[3], p[4]))
+    p[0] = p[1]
 
 def p_typed_args_multiple_2(p: YaccProduction):
-    """TypedArgs : Ident Ident Punctuation_Comma TypedArgs"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
-    p[0] = [PVarDecl(loc, PType(loc, p[1].identifier),p[2])] + deepcopy(p[4])
+    """TypedArgs : TypedArgs Punctuation_Comma Ident Ident"""
+    loc = _location(p, 3)
+    p[1].append(PVarDecl(loc, PType(loc, p[3].identifier), p[4]))
+    p[0] = p[1]
 
 def p_func_declaration(p: YaccProduction):
     """FuncDecl : Type Ident Punctuation_OpenParen TypedArgs Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PFuncDecl(loc, p[1], p[2], p[4], p[7])
 
 def p_func_declaration_2(p: YaccProduction):
     """FuncDecl : Ident Ident Punctuation_OpenParen TypedArgs Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PFuncDecl(loc, PType(loc, p[1].identifier),
                      p[2], p[4], p[7])
 
 def p_func_declaration_no_args(p: YaccProduction):
     """FuncDecl : Type Ident Punctuation_OpenParen Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PFuncDecl(loc, p[1], p[2], [], p[6])
 
 
 def p_func_declaration_no_args_2(p: YaccProduction):
     """FuncDecl : Ident Ident Punctuation_OpenParen Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PFuncDecl(loc, PType(loc, p[1].identifier),
                      p[2], [], p[6])
 
 def p_class_declaration(p: YaccProduction):
     """ClassDecl : Keyword_Object_Class Ident Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PClassDecl(loc, p[2], p[4])
 
 # For extension / implementing interfaces
 # def p_class_declaration(p:YaccProduction):
 #     """ClassDecl : Keyword_Object_Class Ident Punctuation_OpenParen Ident Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-#     loc = Location(p.lineno(1), p.lexspan(1)[0])
+#     loc = _location(p)
 #     p[0] = PClassDecl(loc, p[1], p[2], p[4], p[7])
 
 
 def p_if(p: YaccProduction):
     """IfBloc : Keyword_Control_If Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
-    p[0] = PIf(loc, p[3], p[6], PSkip())
+    loc = _location(p)
+    p[0] = PIf(loc, p[3], p[6], PSkip(loc))
 
 
 def p_if_else(p: YaccProduction):
     """IfBloc : Keyword_Control_If Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace Keyword_Control_Else Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PIf(loc, p[3], p[6], p[10])
 
 
 def p_for(p: YaccProduction):
     """ForBloc : Keyword_Control_For Punctuation_OpenParen VarDecl Expr Statement Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PFor(loc, p[3], p[4], p[5], p[8])
 
 
 def p_foreach(p: YaccProduction):
     """ForBloc : Keyword_Control_For Punctuation_OpenParen VarDecl Punctuation_TernarySeparator Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PForeach(loc, p[3], p[5], p[8])
 
 
 def p_while(p: YaccProduction):
     """WhileBloc : Keyword_Control_While Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PWhile(loc, p[3], p[6])
 
 def p_assert(p: YaccProduction):
     """Statement : Keyword_Control_Assert Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_EoL"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PAssert(loc, p[3])
 
 def p_var(p: YaccProduction):
     """Ident : ID"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PIdentifier(loc, p[1])
 
 
 def p_dot(p: YaccProduction):
     """Ident : Ident Operator_Dot Ident"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     if isinstance(p[3], PDot):
         p[1] = PDot(p[3].location, p[1], p[3].left)
         p[3] = p[3].rvalue
@@ -756,7 +954,7 @@ def p_dot(p: YaccProduction):
 
 def p_ternary(p: YaccProduction):
     """Expr : Expr Punctuation_TernaryConditional Expr Punctuation_TernarySeparator Expr"""
-    loc = Location(p.lineno(1), p.lexspan(1)[0])
+    loc = _location(p)
     p[0] = PTernary(loc, p[1], p[3], p[5])
 
 
@@ -768,4 +966,22 @@ def p_error(p: LexToken):
     raise ParsingError(f"Unexpected symbol '{p.value}' on "+str(loc), location=loc, problem_token=p.value)
 
 
-parser = yacc.yacc()
+# The LALR tables are cached between runs and rebuilt whenever the grammar changes
+PARSETAB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__', 'parsetab.pickle')
+
+parser = yacc.yacc(picklefile=PARSETAB_PATH)
+# Dense tables for parser.parse_compiled, terminals numbered like the lexer's token types.
+# They are kept in parsetab.pickle too, so only the first run after a change builds them
+parser.compile(tokens)
+
+
+def parse_declarations(code: str = None, lexer=None):
+    """Yields the top level declarations (PFuncDecl, PClassDecl, PVarDecl) and
+    statements of a module in order, each one as soon as it is parsed.
+
+    The module itself is never built, so a consumer that drops the declarations
+    it is done with only keeps one of them in memory. lexer defaults to a new
+    PS_Lexer; a TokenBuffer can be given instead of code."""
+    if lexer is None:
+        lexer = PS_Lexer()
+    yield from parser.parse_stream(code, lexer=lexer)
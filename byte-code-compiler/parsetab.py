@@ -1,167 +0,0 @@
-
-# parsetab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-_tabversion = '3.10'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'ModulenonassocOperator_Binary_Bool_EqOperator_Binary_Bool_NeqOperator_Binary_Bool_GeqOperator_Binary_Bool_LeqOperator_Binary_Bool_GtOperator_Binary_Bool_LtleftOperator_Binary_PlusEqOperator_Binary_MinusEqOperator_Binary_TimesEqOperator_Binary_DivEqOperator_Binary_AndEqOperator_Binary_OrEqOperator_Binary_XorEqOperator_Binary_ShlEqOperator_Binary_ShrEqrightOperator_Binary_ModOperator_Binary_AndOperator_Binary_OrleftOperator_Binary_XorOperator_Binary_ShlOperator_Binary_ShrleftOperator_Binary_PlusOperator_MinusleftOperator_Binary_TimesOperator_Binary_DivrightUNOPComment_Multiline Comment_Singleline ID Keyword_Control_Assert Keyword_Control_Break Keyword_Control_Continue Keyword_Control_Else Keyword_Control_For Keyword_Control_If Keyword_Control_Return Keyword_Control_While Keyword_Object_Class Keyword_Object_False Keyword_Object_New Keyword_Object_Null Keyword_Object_True Keyword_Type_Boolean Keyword_Type_Char Keyword_Type_Float_32 Keyword_Type_Float_64 Keyword_Type_Int16 Keyword_Type_Int32 Keyword_Type_Int64 Keyword_Type_Mod_Unsigned Keyword_Type_String Keyword_Type_Void Literal_String Number_Char Number_Float Number_Hex Number_Int Operator_Binary_Affectation Operator_Binary_And Operator_Binary_AndEq Operator_Binary_Bool_And Operator_Binary_Bool_Eq Operator_Binary_Bool_Geq Operator_Binary_Bool_Gt Operator_Binary_Bool_Leq Operator_Binary_Bool_Lt Operator_Binary_Bool_Neq Operator_Binary_Bool_Or Operator_Binary_Copy Operator_Binary_Div Operator_Binary_DivEq Operator_Binary_MinusEq Operator_Binary_Mod Operator_Binary_Or Operator_Binary_OrEq Operator_Binary_Plus Operator_Binary_PlusEq Operator_Binary_Shl Operator_Binary_ShlEq Operator_Binary_Shr Operator_Binary_ShrEq Operator_Binary_Times Operator_Binary_TimesEq Operator_Binary_Xor Operator_Binary_XorEq Operator_Dot Operator_Minus Operator_Unary_Dec Operator_Unary_Inc Operator_Unary_Not Punctuation_CloseBrace Punctuation_CloseBracket Punctuation_CloseParen Punctuation_Comma Punctuation_EoL Punctuation_OpenBrace Punctuation_OpenBracket Punctuation_OpenParen Punctuation_TernaryConditional Punctuation_TernarySeparator WhitespaceModule : GlobalStatementListStatement : VarDecl\n                 | VarAssign\n                 | FuncDecl\n                 | IfBloc\n                 | ForBloc\n                 | WhileBloc\n                 | Scope\n                 | Return\n                 | Break\n                 | Continue\n                 | Expr Punctuation_EoL\n                 | ignoreScope : Punctuation_OpenBrace StatementList Punctuation_CloseBraceGlobalStatementList : StatementListGlobalStatementList : ClassDeclGlobalStatementList : Statement GlobalStatementListGlobalStatementList : ClassDecl GlobalStatementListStatementList : emptyStatementList : StatementStatementList : Statement StatementListempty :Type : Keyword_Type_Mod_Unsigned Keyword_Type_Int16\n            | Keyword_Type_Mod_Unsigned Keyword_Type_Int32\n            | Keyword_Type_Mod_Unsigned Keyword_Type_Int64\n            | Keyword_Type_Mod_Unsigned Keyword_Type_CharType : Keyword_Type_Void\n            | Keyword_Type_Int16\n            | Keyword_Type_Int32\n            | Keyword_Type_Int64\n            | Keyword_Type_String\n            | Keyword_Type_Float_32\n            | Keyword_Type_Float_64\n            | Keyword_Type_Char\n            | Keyword_Type_BooleanExpr : Punctuation_OpenParen Type Punctuation_CloseParen ExprExpr : Punctuation_OpenParen Ident Punctuation_CloseParen ExprVarDecl : Ident Ident Punctuation_EoLVarDecl : Type Ident Punctuation_EoLVarDecl : Ident Ident Operator_Binary_Affectation Expr Punctuation_EoLVarDecl : Type Ident Operator_Binary_Affectation Expr Punctuation_EoLBreak : Keyword_Control_Break Punctuation_EoLContinue : Keyword_Control_Continue Punctuation_EoLReturn : Keyword_Control_Return Punctuation_EoLReturn : Keyword_Control_Return Expr Punctuation_EoLVarAssign : Ident Operator_Binary_Affectation Expr Punctuation_EoLExpr : Ident\n            | Number\n            | ArrayLiteral\n            | ArrayIndex\n            | FuncCall\n            | StringString : Literal_StringNumber : Number_Char\n              | Number_Hex\n              | Number_Int\n              | Number_FloatExprList : empty\n                | Expr\n                | ExprList Punctuation_Comma ExprArrayIndex : Expr Punctuation_OpenBracket Expr Punctuation_CloseBracketExpr : Keyword_Object_New Ident Punctuation_OpenBracket Expr Punctuation_CloseBracketExpr : Keyword_Object_New Type Punctuation_OpenBracket Expr Punctuation_CloseBracketExpr : Keyword_Object_New Ident Punctuation_OpenParen ExprList Punctuation_CloseParenExpr : Keyword_Object_New Type Punctuation_OpenParen ExprList Punctuation_CloseParenExpr : Expr Operator_Minus Expr %prec UNOP\n            | Expr Operator_Binary_Bool_Eq Expr\n            | Expr Operator_Binary_Bool_Neq Expr\n            | Expr Operator_Binary_Bool_Geq Expr\n            | Expr Operator_Binary_Bool_Leq Expr\n            | Expr Operator_Binary_Bool_Gt Expr\n            | Expr Operator_Binary_Bool_Lt Expr\n            | Expr Operator_Binary_Plus Expr\n            | Expr Operator_Binary_Times Expr\n            | Expr Operator_Binary_Div Expr\n            | Expr Operator_Binary_Mod Expr\n            | Expr Operator_Binary_And Expr\n            | Expr Operator_Binary_Or Expr\n            | Expr Operator_Binary_Xor Expr\n            | Expr Operator_Binary_Shl Expr\n            | Expr Operator_Binary_Shr Expr\n            | Expr Operator_Binary_Bool_Or Expr\n            | Expr Operator_Binary_Bool_And ExprExpr : Punctuation_OpenParen Expr Punctuation_CloseParenExpr : Operator_Minus Expr\n            | Operator_Unary_Not Expr %prec UNOPExpr : Ident Operator_Unary_Dec %prec UNOP\n            | Ident Operator_Unary_Inc %prec UNOP\n            | ArrayIndex Operator_Unary_Dec %prec UNOP\n            | ArrayIndex Operator_Unary_Inc %prec UNOPignore : Comment_Singleline\n              | Comment_Multiline\n              | Whitespace\n              | Punctuation_EoL VarAssign : Ident Operator_Binary_MinusEq Expr\n                  | Ident Operator_Binary_PlusEq Expr\n                  | Ident Operator_Binary_TimesEq Expr\n                  | Ident Operator_Binary_DivEq Expr\n                  | Ident Operator_Binary_AndEq Expr\n                  | Ident Operator_Binary_OrEq Expr\n                  | Ident Operator_Binary_XorEq Expr\n                  | Ident Operator_Binary_ShlEq Expr\n                  | Ident Operator_Binary_ShrEq Expr\n                  | ArrayIndex Operator_Binary_MinusEq Expr\n                  | ArrayIndex Operator_Binary_PlusEq Expr\n                  | ArrayIndex Operator_Binary_TimesEq Expr\n                  | ArrayIndex Operator_Binary_DivEq Expr\n                  | ArrayIndex Operator_Binary_AndEq Expr\n                  | ArrayIndex Operator_Binary_OrEq Expr\n                  | ArrayIndex Operator_Binary_XorEq Expr\n                  | ArrayIndex Operator_Binary_ShlEq Expr\n                  | ArrayIndex Operator_Binary_ShrEq ExprVarAssign : Ident Operator_Binary_Copy Expr Punctuation_EoL\n                 | ArrayIndex Operator_Binary_Copy Expr Punctuation_EoLArrayLiteral : Punctuation_OpenBracket ExprList Punctuation_CloseBracketFuncCall : Ident Punctuation_OpenParen ExprList Punctuation_CloseParen %prec UNOPExpr : Keyword_Object_TrueExpr : Keyword_Object_FalseExpr : Keyword_Object_NullTypedArgs : Type IdentTypedArgs : Ident IdentTypedArgs : Type Ident Punctuation_Comma TypedArgsTypedArgs : Ident Ident Punctuation_Comma TypedArgsFuncDecl : Type Ident Punctuation_OpenParen TypedArgs Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBraceFuncDecl : Ident Ident Punctuation_OpenParen TypedArgs Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBraceFuncDecl : Type Ident Punctuation_OpenParen Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBraceFuncDecl : Ident Ident Punctuation_OpenParen Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBraceClassDecl : Keyword_Object_Class Ident Punctuation_OpenBrace StatementList Punctuation_CloseBraceIfBloc : Keyword_Control_If Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBraceIfBloc : Keyword_Control_If Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace Keyword_Control_Else Punctuation_OpenBrace StatementList Punctuation_CloseBraceForBloc : Keyword_Control_For Punctuation_OpenParen VarDecl Expr Statement Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBraceForBloc : Keyword_Control_For Punctuation_OpenParen VarDecl Punctuation_TernarySeparator Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBraceWhileBloc : Keyword_Control_While Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBraceStatement : Keyword_Control_Assert Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_EoLIdent : IDIdent : Ident Operator_Dot IdentExpr : Expr Punctuation_TernaryConditional Expr Punctuation_TernarySeparator Expr'
-    
-_lr_action_items = {'Keyword_Object_Class':([0,4,5,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,85,110,122,123,127,129,130,131,137,138,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,240,241,246,247,248,257,258,259,260,275,278,279,282,283,284,289,290,292,],[7,7,7,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,-128,-40,-137,-134,-41,-62,-64,-63,-65,-127,-126,-129,-133,-125,-124,-131,-132,-130,]),'Keyword_Control_Assert':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[23,23,23,23,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,23,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,23,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,23,-128,-40,23,-137,-134,-41,23,23,23,-62,-64,-63,-65,23,23,-66,-127,-126,-129,23,23,-133,-125,-124,23,-131,-132,-130,]),'$end':([0,1,2,3,4,5,6,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,63,64,65,80,81,85,110,122,123,127,129,130,131,137,138,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,240,241,246,247,248,257,258,259,260,275,278,279,282,283,284,289,290,292,],[-22,0,-1,-15,-16,-20,-19,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-18,-17,-15,-87,-88,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,-128,-40,-137,-134,-41,-62,-64,-63,-65,-127,-126,-129,-133,-125,-124,-131,-132,-130,]),'Keyword_Control_If':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[27,27,27,27,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,27,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,27,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,27,-128,-40,27,-137,-134,-41,27,27,27,-62,-64,-63,-65,27,27,-66,-127,-126,-129,27,27,-133,-125,-124,27,-131,-132,-130,]),'Keyword_Control_For':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[28,28,28,28,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,28,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,28,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,28,-128,-40,28,-137,-134,-41,28,28,28,-62,-64,-63,-65,28,28,-66,-127,-126,-129,28,28,-133,-125,-124,28,-131,-132,-130,]),'Keyword_Control_While':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[29,29,29,29,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,29,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,29,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,29,-128,-40,29,-137,-134,-41,29,29,29,-62,-64,-63,-65,29,29,-66,-127,-126,-129,29,29,-133,-125,-124,29,-131,-132,-130,]),'Punctuation_OpenBrace':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,66,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,215,217,218,219,221,223,224,227,228,229,230,234,240,241,243,244,246,247,248,249,250,251,256,257,258,259,260,262,265,268,269,271,275,278,279,280,281,282,283,284,285,288,289,290,292,],[9,9,9,9,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,143,-87,-88,9,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,9,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,244,-46,-113,-116,-61,-36,-37,250,-114,251,9,256,-128,-40,262,9,-137,-134,-41,265,9,9,9,-62,-64,-63,-65,9,9,280,-66,281,-127,-126,-129,9,9,-133,-125,-124,288,9,-131,-132,-130,]),'Keyword_Control_Return':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[30,30,30,30,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,30,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,30,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,30,-128,-40,30,-137,-134,-41,30,30,30,-62,-64,-63,-65,30,30,-66,-127,-126,-129,30,30,-133,-125,-124,30,-131,-132,-130,]),'Keyword_Control_Break':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[31,31,31,31,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,31,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,31,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,31,-128,-40,31,-137,-134,-41,31,31,31,-62,-64,-63,-65,31,31,-66,-127,-126,-129,31,31,-133,-125,-124,31,-131,-132,-130,]),'Keyword_Control_Continue':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[32,32,32,32,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,32,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,32,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,32,-128,-40,32,-137,-134,-41,32,32,32,-62,-64,-63,-65,32,32,-66,-127,-126,-129,32,32,-133,-125,-124,32,-131,-132,-130,]),'Punctuation_OpenParen':([0,4,5,8,9,10,11,12,13,14,15,16,17,18,19,21,22,23,24,27,28,29,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,132,133,137,138,139,140,141,142,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[24,24,24,79,24,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,106,24,124,125,126,24,-48,-49,-51,-52,24,24,24,-117,-118,-119,-91,-92,-93,-135,-28,-29,-30,-34,-27,-31,-32,-33,-35,-54,-55,-56,-57,-53,146,24,24,24,24,24,24,24,24,24,24,24,24,-87,-88,24,-12,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,79,-50,188,24,24,24,24,24,24,24,24,24,24,-89,-90,24,24,-44,79,-42,-43,206,208,-85,-86,-23,-24,-25,-26,24,-38,24,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,24,-84,24,-39,24,-104,-105,-106,-107,-108,-109,-110,-111,-112,24,-45,24,24,24,24,-115,24,-46,-113,-116,24,-61,-36,-37,-114,24,24,-128,-40,24,-137,-134,-41,24,24,24,24,24,-62,-64,-63,-65,24,24,-66,-127,-126,-129,24,24,-133,-125,-124,24,-131,-132,-130,]),'Keyword_Object_New':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,137,138,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[37,37,37,37,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,37,37,-48,-49,-51,-52,37,37,37,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,37,37,37,37,37,37,37,37,37,37,37,37,-87,-88,37,-12,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-50,37,37,37,37,37,37,37,37,37,37,-89,-90,37,37,-44,-47,-42,-43,-85,-86,37,-38,37,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,37,-84,37,-39,37,-104,-105,-106,-107,-108,-109,-110,-111,-112,37,-45,37,37,37,37,-115,37,-46,-113,-116,37,-61,-36,-37,-114,37,37,-128,-40,37,-137,-134,-41,37,37,37,37,37,-62,-64,-63,-65,37,37,-66,-127,-126,-129,37,37,-133,-125,-124,37,-131,-132,-130,]),'Operator_Minus':([0,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,26,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,128,129,130,131,136,137,138,143,144,145,147,148,149,150,151,152,153,154,155,156,157,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,189,190,191,192,193,194,195,196,197,198,199,200,203,204,205,206,207,208,209,210,212,217,218,219,220,221,223,224,225,228,230,231,235,237,239,240,241,244,246,247,248,250,251,253,254,255,256,257,258,259,260,262,265,269,270,275,278,279,280,281,282,283,284,288,289,290,292,],[39,39,39,-47,39,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,86,-94,-13,39,-50,39,-48,-49,-51,-52,39,39,39,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,39,39,39,39,39,39,39,39,39,39,39,39,-87,-88,39,-12,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,86,-47,-50,39,39,39,39,39,39,39,39,39,39,-89,-90,39,39,-44,86,-47,-42,-43,86,-85,-86,39,-38,39,86,86,86,86,86,86,86,86,86,86,86,-136,-14,-66,86,86,86,86,86,86,-73,-74,-75,86,86,86,86,86,86,86,86,86,86,86,39,-84,39,-39,39,86,86,86,86,86,86,86,86,86,86,86,39,86,-45,39,39,39,39,-115,39,86,-46,-113,-116,39,-61,86,86,86,-114,253,39,86,86,86,-128,-40,39,86,-134,-41,39,39,39,39,86,39,-62,-64,-63,-65,39,39,-66,86,-127,-126,-129,39,39,-133,-125,-124,39,-131,-132,-130,]),'Operator_Unary_Not':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,137,138,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[40,40,40,40,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,40,40,-48,-49,-51,-52,40,40,40,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,40,40,40,40,40,40,40,40,40,40,40,40,-87,-88,40,-12,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,-50,40,40,40,40,40,40,40,40,40,40,-89,-90,40,40,-44,-47,-42,-43,-85,-86,40,-38,40,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,40,-84,40,-39,40,-104,-105,-106,-107,-108,-109,-110,-111,-112,40,-45,40,40,40,40,-115,40,-46,-113,-116,40,-61,-36,-37,-114,40,40,-128,-40,40,-137,-134,-41,40,40,40,40,40,-62,-64,-63,-65,40,40,-66,-127,-126,-129,40,40,-133,-125,-124,40,-131,-132,-130,]),'Keyword_Object_True':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,137,138,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[41,41,41,41,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,41,41,-48,-49,-51,-52,41,41,41,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,41,41,41,41,41,41,41,41,41,41,41,41,-87,-88,41,-12,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-50,41,41,41,41,41,41,41,41,41,41,-89,-90,41,41,-44,-47,-42,-43,-85,-86,41,-38,41,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,41,-84,41,-39,41,-104,-105,-106,-107,-108,-109,-110,-111,-112,41,-45,41,41,41,41,-115,41,-46,-113,-116,41,-61,-36,-37,-114,41,41,-128,-40,41,-137,-134,-41,41,41,41,41,41,-62,-64,-63,-65,41,41,-66,-127,-126,-129,41,41,-133,-125,-124,41,-131,-132,-130,]),'Keyword_Object_False':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,137,138,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[42,42,42,42,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,42,42,-48,-49,-51,-52,42,42,42,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,42,42,42,42,42,42,42,42,42,42,42,42,-87,-88,42,-12,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-50,42,42,42,42,42,42,42,42,42,42,-89,-90,42,42,-44,-47,-42,-43,-85,-86,42,-38,42,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,42,-84,42,-39,42,-104,-105,-106,-107,-108,-109,-110,-111,-112,42,-45,42,42,42,42,-115,42,-46,-113,-116,42,-61,-36,-37,-114,42,42,-128,-40,42,-137,-134,-41,42,42,42,42,42,-62,-64,-63,-65,42,42,-66,-127,-126,-129,42,42,-133,-125,-124,42,-131,-132,-130,]),'Keyword_Object_Null':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,137,138,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[43,43,43,43,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,43,43,-48,-49,-51,-52,43,43,43,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,43,43,43,43,43,43,43,43,43,43,43,43,-87,-88,43,-12,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-50,43,43,43,43,43,43,43,43,43,43,-89,-90,43,43,-44,-47,-42,-43,-85,-86,43,-38,43,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,43,-84,43,-39,43,-104,-105,-106,-107,-108,-109,-110,-111,-112,43,-45,43,43,43,43,-115,43,-46,-113,-116,43,-61,-36,-37,-114,43,43,-128,-40,43,-137,-134,-41,43,43,43,43,43,-62,-64,-63,-65,43,43,-66,-127,-126,-129,43,43,-133,-125,-124,43,-131,-132,-130,]),'Comment_Singleline':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[44,44,44,44,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,44,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,44,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,44,-128,-40,44,-137,-134,-41,44,44,44,-62,-64,-63,-65,44,44,-66,-127,-126,-129,44,44,-133,-125,-124,44,-131,-132,-130,]),'Comment_Multiline':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[45,45,45,45,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,45,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,45,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,45,-128,-40,45,-137,-134,-41,45,45,45,-62,-64,-63,-65,45,45,-66,-127,-126,-129,45,45,-133,-125,-124,45,-131,-132,-130,]),'Whitespace':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[46,46,46,46,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,46,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,46,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,46,-128,-40,46,-137,-134,-41,46,46,46,-62,-64,-63,-65,46,46,-66,-127,-126,-129,46,46,-133,-125,-124,46,-131,-132,-130,]),'Punctuation_EoL':([0,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,26,30,31,32,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,67,80,81,84,85,110,111,122,123,127,128,129,130,131,137,138,143,144,147,148,149,150,151,152,153,154,155,156,157,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,198,204,209,212,217,218,219,221,222,223,224,225,228,230,232,233,240,241,244,246,247,248,250,251,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[21,21,21,-47,21,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,85,-94,-13,-50,127,130,131,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,144,-87,-88,21,-12,-50,186,-89,-90,-44,204,-47,-42,-43,-85,-86,21,-38,217,-95,-96,-97,-98,-99,-100,-101,-102,-103,218,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,228,-45,-115,241,-46,-113,-116,-61,247,-36,-37,248,-114,21,144,186,-128,-40,21,-137,-134,-41,21,21,21,-62,-64,-63,-65,21,21,-66,-127,-126,-129,21,21,-133,-125,-124,21,-131,-132,-130,]),'ID':([0,4,5,7,8,9,10,11,12,13,14,15,16,17,18,19,21,22,24,25,30,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,129,130,131,137,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,200,201,202,204,205,206,207,208,209,210,213,216,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[47,47,47,47,47,47,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,47,47,47,-48,-49,-51,-52,47,47,47,47,-117,-118,-119,-91,-92,-93,-135,-28,-29,-30,-34,-27,-31,-32,-33,-35,-54,-55,-56,-57,-53,47,47,47,47,47,47,47,47,47,47,47,47,-87,-88,47,47,-12,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-50,47,47,47,47,47,47,47,47,47,47,-89,-90,47,47,47,-44,-47,-42,-43,-85,-86,-23,-24,-25,-26,47,-38,47,47,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,47,-84,47,-39,47,47,-104,-105,-106,-107,-108,-109,-110,-111,-112,47,47,47,-45,47,47,47,47,-115,47,47,47,-46,-113,-116,47,-61,-36,-37,-114,47,47,-128,-40,47,-137,-134,-41,47,47,47,47,47,-62,-64,-63,-65,47,47,47,47,-66,-127,-126,-129,47,47,-133,-125,-124,47,-131,-132,-130,]),'Keyword_Type_Mod_Unsigned':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,33,34,35,36,37,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,125,127,129,130,131,137,138,143,144,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,188,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[48,48,48,48,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,48,-48,-49,-51,-52,48,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,48,-12,-50,-89,-90,48,-44,-47,-42,-43,-85,-86,48,-38,48,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,48,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,48,-128,-40,48,-137,-134,-41,48,48,48,-62,-64,-63,-65,48,48,48,48,-66,-127,-126,-129,48,48,-133,-125,-124,48,-131,-132,-130,]),'Keyword_Type_Void':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,33,34,35,36,37,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,125,127,129,130,131,137,138,143,144,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,188,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[53,53,53,53,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,53,-48,-49,-51,-52,53,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,53,-12,-50,-89,-90,53,-44,-47,-42,-43,-85,-86,53,-38,53,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,53,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,53,-128,-40,53,-137,-134,-41,53,53,53,-62,-64,-63,-65,53,53,53,53,-66,-127,-126,-129,53,53,-133,-125,-124,53,-131,-132,-130,]),'Keyword_Type_Int16':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,33,34,35,36,37,41,42,43,44,45,46,47,48,58,59,60,61,62,80,81,84,85,110,122,123,125,127,129,130,131,137,138,143,144,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,188,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[49,49,49,49,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,49,-48,-49,-51,-52,49,-117,-118,-119,-91,-92,-93,-135,139,-54,-55,-56,-57,-53,-87,-88,49,-12,-50,-89,-90,49,-44,-47,-42,-43,-85,-86,49,-38,49,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,49,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,49,-128,-40,49,-137,-134,-41,49,49,49,-62,-64,-63,-65,49,49,49,49,-66,-127,-126,-129,49,49,-133,-125,-124,49,-131,-132,-130,]),'Keyword_Type_Int32':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,33,34,35,36,37,41,42,43,44,45,46,47,48,58,59,60,61,62,80,81,84,85,110,122,123,125,127,129,130,131,137,138,143,144,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,188,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[50,50,50,50,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,50,-48,-49,-51,-52,50,-117,-118,-119,-91,-92,-93,-135,140,-54,-55,-56,-57,-53,-87,-88,50,-12,-50,-89,-90,50,-44,-47,-42,-43,-85,-86,50,-38,50,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,50,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,50,-128,-40,50,-137,-134,-41,50,50,50,-62,-64,-63,-65,50,50,50,50,-66,-127,-126,-129,50,50,-133,-125,-124,50,-131,-132,-130,]),'Keyword_Type_Int64':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,33,34,35,36,37,41,42,43,44,45,46,47,48,58,59,60,61,62,80,81,84,85,110,122,123,125,127,129,130,131,137,138,143,144,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,188,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[51,51,51,51,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,51,-48,-49,-51,-52,51,-117,-118,-119,-91,-92,-93,-135,141,-54,-55,-56,-57,-53,-87,-88,51,-12,-50,-89,-90,51,-44,-47,-42,-43,-85,-86,51,-38,51,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,51,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,51,-128,-40,51,-137,-134,-41,51,51,51,-62,-64,-63,-65,51,51,51,51,-66,-127,-126,-129,51,51,-133,-125,-124,51,-131,-132,-130,]),'Keyword_Type_String':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,33,34,35,36,37,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,125,127,129,130,131,137,138,143,144,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,188,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[54,54,54,54,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,54,-48,-49,-51,-52,54,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,54,-12,-50,-89,-90,54,-44,-47,-42,-43,-85,-86,54,-38,54,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,54,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,54,-128,-40,54,-137,-134,-41,54,54,54,-62,-64,-63,-65,54,54,54,54,-66,-127,-126,-129,54,54,-133,-125,-124,54,-131,-132,-130,]),'Keyword_Type_Float_32':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,33,34,35,36,37,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,125,127,129,130,131,137,138,143,144,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,188,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[55,55,55,55,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,55,-48,-49,-51,-52,55,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,55,-12,-50,-89,-90,55,-44,-47,-42,-43,-85,-86,55,-38,55,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,55,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,55,-128,-40,55,-137,-134,-41,55,55,55,-62,-64,-63,-65,55,55,55,55,-66,-127,-126,-129,55,55,-133,-125,-124,55,-131,-132,-130,]),'Keyword_Type_Float_64':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,33,34,35,36,37,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,125,127,129,130,131,137,138,143,144,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,188,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[56,56,56,56,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,56,-48,-49,-51,-52,56,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,56,-12,-50,-89,-90,56,-44,-47,-42,-43,-85,-86,56,-38,56,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,56,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,56,-128,-40,56,-137,-134,-41,56,56,56,-62,-64,-63,-65,56,56,56,56,-66,-127,-126,-129,56,56,-133,-125,-124,56,-131,-132,-130,]),'Keyword_Type_Char':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,33,34,35,36,37,41,42,43,44,45,46,47,48,58,59,60,61,62,80,81,84,85,110,122,123,125,127,129,130,131,137,138,143,144,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,188,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[52,52,52,52,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,52,-48,-49,-51,-52,52,-117,-118,-119,-91,-92,-93,-135,142,-54,-55,-56,-57,-53,-87,-88,52,-12,-50,-89,-90,52,-44,-47,-42,-43,-85,-86,52,-38,52,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,52,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,52,-128,-40,52,-137,-134,-41,52,52,52,-62,-64,-63,-65,52,52,52,52,-66,-127,-126,-129,52,52,-133,-125,-124,52,-131,-132,-130,]),'Keyword_Type_Boolean':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,33,34,35,36,37,41,42,43,44,45,46,47,58,59,60,61,62,80,81,84,85,110,122,123,125,127,129,130,131,137,138,143,144,146,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,188,189,190,191,192,193,194,195,196,197,204,209,217,218,219,221,223,224,228,230,240,241,244,246,247,248,250,251,256,257,258,259,260,261,262,264,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[57,57,57,57,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,57,-48,-49,-51,-52,57,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,57,-12,-50,-89,-90,57,-44,-47,-42,-43,-85,-86,57,-38,57,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,57,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,-46,-113,-116,-61,-36,-37,-114,57,-128,-40,57,-137,-134,-41,57,57,57,-62,-64,-63,-65,57,57,57,57,-66,-127,-126,-129,57,57,-133,-125,-124,57,-131,-132,-130,]),'Number_Char':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,137,138,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[58,58,58,58,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,58,58,-48,-49,-51,-52,58,58,58,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,58,58,58,58,58,58,58,58,58,58,58,58,-87,-88,58,-12,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-50,58,58,58,58,58,58,58,58,58,58,-89,-90,58,58,-44,-47,-42,-43,-85,-86,58,-38,58,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,58,-84,58,-39,58,-104,-105,-106,-107,-108,-109,-110,-111,-112,58,-45,58,58,58,58,-115,58,-46,-113,-116,58,-61,-36,-37,-114,58,58,-128,-40,58,-137,-134,-41,58,58,58,58,58,-62,-64,-63,-65,58,58,-66,-127,-126,-129,58,58,-133,-125,-124,58,-131,-132,-130,]),'Number_Hex':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,137,138,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[59,59,59,59,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,59,59,-48,-49,-51,-52,59,59,59,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,59,59,59,59,59,59,59,59,59,59,59,59,-87,-88,59,-12,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-50,59,59,59,59,59,59,59,59,59,59,-89,-90,59,59,-44,-47,-42,-43,-85,-86,59,-38,59,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,59,-84,59,-39,59,-104,-105,-106,-107,-108,-109,-110,-111,-112,59,-45,59,59,59,59,-115,59,-46,-113,-116,59,-61,-36,-37,-114,59,59,-128,-40,59,-137,-134,-41,59,59,59,59,59,-62,-64,-63,-65,59,59,-66,-127,-126,-129,59,59,-133,-125,-124,59,-131,-132,-130,]),'Number_Int':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,137,138,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[60,60,60,60,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,60,60,-48,-49,-51,-52,60,60,60,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,60,60,60,60,60,60,60,60,60,60,60,60,-87,-88,60,-12,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-50,60,60,60,60,60,60,60,60,60,60,-89,-90,60,60,-44,-47,-42,-43,-85,-86,60,-38,60,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,60,-84,60,-39,60,-104,-105,-106,-107,-108,-109,-110,-111,-112,60,-45,60,60,60,60,-115,60,-46,-113,-116,60,-61,-36,-37,-114,60,60,-128,-40,60,-137,-134,-41,60,60,60,60,60,-62,-64,-63,-65,60,60,-66,-127,-126,-129,60,60,-133,-125,-124,60,-131,-132,-130,]),'Number_Float':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,137,138,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[61,61,61,61,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,61,61,-48,-49,-51,-52,61,61,61,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,61,61,61,61,61,61,61,61,61,61,61,61,-87,-88,61,-12,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-50,61,61,61,61,61,61,61,61,61,61,-89,-90,61,61,-44,-47,-42,-43,-85,-86,61,-38,61,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,61,-84,61,-39,61,-104,-105,-106,-107,-108,-109,-110,-111,-112,61,-45,61,61,61,61,-115,61,-46,-113,-116,61,-61,-36,-37,-114,61,61,-128,-40,61,-137,-134,-41,61,61,61,61,61,-62,-64,-63,-65,61,61,-66,-127,-126,-129,61,61,-133,-125,-124,61,-131,-132,-130,]),'Punctuation_OpenBracket':([0,4,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,26,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,108,109,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,128,129,130,131,132,133,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,152,153,154,155,156,157,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,189,190,191,192,193,194,195,196,197,198,199,200,203,204,205,206,207,208,209,210,212,217,218,219,220,221,223,224,225,228,230,231,235,237,239,240,241,244,246,247,248,250,251,253,254,255,256,257,258,259,260,262,265,269,270,275,278,279,280,281,282,283,284,288,289,290,292,],[38,38,38,-47,38,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,105,-94,-13,38,-50,38,-48,-49,-51,-52,38,38,38,-117,-118,-119,-91,-92,-93,-135,-28,-29,-30,-34,-27,-31,-32,-33,-35,-54,-55,-56,-57,-53,38,38,38,38,38,38,38,38,38,38,38,38,-87,-88,38,-12,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,105,-47,-50,38,38,38,38,38,38,38,38,38,38,-89,-90,38,38,-44,105,-47,-42,-43,205,207,105,-85,-86,-23,-24,-25,-26,38,-38,38,105,-95,-96,-97,-98,-99,-100,-101,-102,-103,105,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,105,105,105,105,105,38,-84,38,-39,38,-104,-105,-106,-107,-108,-109,-110,-111,-112,105,105,38,105,-45,38,38,38,38,-115,38,105,-46,-113,-116,38,-61,105,105,105,-114,254,38,105,105,105,-128,-40,38,105,-134,-41,38,38,38,38,105,38,-62,-64,-63,-65,38,38,-66,105,-127,-126,-129,38,38,-133,-125,-124,38,-131,-132,-130,]),'Literal_String':([0,4,5,9,10,11,12,13,14,15,16,17,18,19,21,22,24,30,33,34,35,36,38,39,40,41,42,43,44,45,46,47,58,59,60,61,62,68,69,70,71,72,73,74,75,76,77,78,79,80,81,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,112,113,114,115,116,117,118,119,120,121,122,123,124,126,127,129,130,131,137,138,143,144,145,148,149,150,151,152,153,154,155,156,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,183,184,185,186,187,189,190,191,192,193,194,195,196,197,200,204,205,206,207,208,209,210,217,218,219,220,221,223,224,228,230,231,240,241,244,246,247,248,250,251,253,254,256,257,258,259,260,262,265,269,275,278,279,280,281,282,283,284,288,289,290,292,],[62,62,62,62,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,62,62,-48,-49,-51,-52,62,62,62,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,62,62,62,62,62,62,62,62,62,62,62,62,-87,-88,62,-12,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-50,62,62,62,62,62,62,62,62,62,62,-89,-90,62,62,-44,-47,-42,-43,-85,-86,62,-38,62,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,62,-84,62,-39,62,-104,-105,-106,-107,-108,-109,-110,-111,-112,62,-45,62,62,62,62,-115,62,-46,-113,-116,62,-61,-36,-37,-114,62,62,-128,-40,62,-137,-134,-41,62,62,62,62,62,-62,-64,-63,-65,62,62,-66,-127,-126,-129,62,62,-133,-125,-124,62,-131,-132,-130,]),'Punctuation_CloseBrace':([6,9,10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,58,59,60,61,62,80,81,83,84,85,110,122,123,127,129,130,131,137,138,143,144,148,149,150,151,152,153,154,155,156,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,186,189,190,191,192,193,194,195,196,197,204,209,211,217,218,219,221,223,224,228,241,244,246,247,248,250,251,256,257,258,259,260,262,263,265,266,267,272,274,275,277,278,279,280,281,282,283,284,286,287,288,289,290,291,292,],[-19,-22,-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-54,-55,-56,-57,-53,-87,-88,160,-20,-12,-50,-89,-90,-44,-47,-42,-43,-85,-86,-22,-38,-95,-96,-97,-98,-99,-100,-101,-102,-103,-136,-14,-21,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-39,-104,-105,-106,-107,-108,-109,-110,-111,-112,-45,-115,240,-46,-113,-116,-61,-36,-37,-114,-40,-22,-137,-134,-41,-22,-22,-22,-62,-64,-63,-65,-22,275,-22,278,279,282,283,-127,284,-126,-129,-22,-22,-133,-125,-124,289,290,-22,-131,-132,292,-130,]),'Operator_Binary_Affectation':([8,47,67,111,159,232,233,],[68,-135,145,187,-136,145,187,]),'Operator_Binary_MinusEq':([8,26,47,159,221,],[69,112,-135,-136,-61,]),'Operator_Binary_PlusEq':([8,26,47,159,221,],[70,113,-135,-136,-61,]),'Operator_Binary_TimesEq':([8,26,47,159,221,],[71,114,-135,-136,-61,]),'Operator_Binary_DivEq':([8,26,47,159,221,],[72,115,-135,-136,-61,]),'Operator_Binary_AndEq':([8,26,47,159,221,],[73,116,-135,-136,-61,]),'Operator_Binary_OrEq':([8,26,47,159,221,],[74,117,-135,-136,-61,]),'Operator_Binary_XorEq':([8,26,47,159,221,],[75,118,-135,-136,-61,]),'Operator_Binary_ShlEq':([8,26,47,159,221,],[76,119,-135,-136,-61,]),'Operator_Binary_ShrEq':([8,26,47,159,221,],[77,120,-135,-136,-61,]),'Operator_Binary_Copy':([8,26,47,159,221,],[78,121,-135,-136,-61,]),'Operator_Binary_Bool_Eq':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,87,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,87,-47,-50,-89,-90,87,-47,87,-85,-86,87,87,87,87,87,87,87,87,87,87,87,-136,-66,None,None,None,None,None,None,-73,-74,-75,-76,-77,-78,-79,-80,-81,87,87,87,87,87,-84,87,87,87,87,87,87,87,87,87,87,87,87,-115,87,-116,-61,87,87,87,87,87,87,87,87,87,-62,-64,-63,-65,-66,87,]),'Operator_Binary_Bool_Neq':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,88,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,88,-47,-50,-89,-90,88,-47,88,-85,-86,88,88,88,88,88,88,88,88,88,88,88,-136,-66,None,None,None,None,None,None,-73,-74,-75,-76,-77,-78,-79,-80,-81,88,88,88,88,88,-84,88,88,88,88,88,88,88,88,88,88,88,88,-115,88,-116,-61,88,88,88,88,88,88,88,88,88,-62,-64,-63,-65,-66,88,]),'Operator_Binary_Bool_Geq':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,89,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,89,-47,-50,-89,-90,89,-47,89,-85,-86,89,89,89,89,89,89,89,89,89,89,89,-136,-66,None,None,None,None,None,None,-73,-74,-75,-76,-77,-78,-79,-80,-81,89,89,89,89,89,-84,89,89,89,89,89,89,89,89,89,89,89,89,-115,89,-116,-61,89,89,89,89,89,89,89,89,89,-62,-64,-63,-65,-66,89,]),'Operator_Binary_Bool_Leq':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,90,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,90,-47,-50,-89,-90,90,-47,90,-85,-86,90,90,90,90,90,90,90,90,90,90,90,-136,-66,None,None,None,None,None,None,-73,-74,-75,-76,-77,-78,-79,-80,-81,90,90,90,90,90,-84,90,90,90,90,90,90,90,90,90,90,90,90,-115,90,-116,-61,90,90,90,90,90,90,90,90,90,-62,-64,-63,-65,-66,90,]),'Operator_Binary_Bool_Gt':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,91,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,91,-47,-50,-89,-90,91,-47,91,-85,-86,91,91,91,91,91,91,91,91,91,91,91,-136,-66,None,None,None,None,None,None,-73,-74,-75,-76,-77,-78,-79,-80,-81,91,91,91,91,91,-84,91,91,91,91,91,91,91,91,91,91,91,91,-115,91,-116,-61,91,91,91,91,91,91,91,91,91,-62,-64,-63,-65,-66,91,]),'Operator_Binary_Bool_Lt':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,92,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,92,-47,-50,-89,-90,92,-47,92,-85,-86,92,92,92,92,92,92,92,92,92,92,92,-136,-66,None,None,None,None,None,None,-73,-74,-75,-76,-77,-78,-79,-80,-81,92,92,92,92,92,-84,92,92,92,92,92,92,92,92,92,92,92,92,-115,92,-116,-61,92,92,92,92,92,92,92,92,92,-62,-64,-63,-65,-66,92,]),'Operator_Binary_Plus':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,93,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,93,-47,-50,-89,-90,93,-47,93,-85,-86,93,93,93,93,93,93,93,93,93,93,93,-136,-66,93,93,93,93,93,93,-73,-74,-75,93,93,93,93,93,93,93,93,93,93,93,-84,93,93,93,93,93,93,93,93,93,93,93,93,-115,93,-116,-61,93,93,93,93,93,93,93,93,93,-62,-64,-63,-65,-66,93,]),'Operator_Binary_Times':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,94,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,94,-47,-50,-89,-90,94,-47,94,94,-86,94,94,94,94,94,94,94,94,94,94,94,-136,-66,94,94,94,94,94,94,94,-74,-75,94,94,94,94,94,94,94,94,94,94,94,-84,94,94,94,94,94,94,94,94,94,94,94,94,-115,94,-116,-61,94,94,94,94,94,94,94,94,94,-62,-64,-63,-65,-66,94,]),'Operator_Binary_Div':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,95,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,95,-47,-50,-89,-90,95,-47,95,95,-86,95,95,95,95,95,95,95,95,95,95,95,-136,-66,95,95,95,95,95,95,95,-74,-75,95,95,95,95,95,95,95,95,95,95,95,-84,95,95,95,95,95,95,95,95,95,95,95,95,-115,95,-116,-61,95,95,95,95,95,95,95,95,95,-62,-64,-63,-65,-66,95,]),'Operator_Binary_Mod':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,96,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,96,-47,-50,-89,-90,96,-47,96,-85,-86,96,96,96,96,96,96,96,96,96,96,96,-136,-66,96,96,96,96,96,96,-73,-74,-75,96,96,96,-79,-80,-81,96,96,96,96,96,-84,96,96,96,96,96,96,96,96,96,96,96,96,-115,96,-116,-61,96,96,96,96,96,96,96,96,96,-62,-64,-63,-65,-66,96,]),'Operator_Binary_And':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,97,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,97,-47,-50,-89,-90,97,-47,97,-85,-86,97,97,97,97,97,97,97,97,97,97,97,-136,-66,97,97,97,97,97,97,-73,-74,-75,97,97,97,-79,-80,-81,97,97,97,97,97,-84,97,97,97,97,97,97,97,97,97,97,97,97,-115,97,-116,-61,97,97,97,97,97,97,97,97,97,-62,-64,-63,-65,-66,97,]),'Operator_Binary_Or':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,98,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,98,-47,-50,-89,-90,98,-47,98,-85,-86,98,98,98,98,98,98,98,98,98,98,98,-136,-66,98,98,98,98,98,98,-73,-74,-75,98,98,98,-79,-80,-81,98,98,98,98,98,-84,98,98,98,98,98,98,98,98,98,98,98,98,-115,98,-116,-61,98,98,98,98,98,98,98,98,98,-62,-64,-63,-65,-66,98,]),'Operator_Binary_Xor':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,99,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,99,-47,-50,-89,-90,99,-47,99,-85,-86,99,99,99,99,99,99,99,99,99,99,99,-136,-66,99,99,99,99,99,99,-73,-74,-75,99,99,99,-79,-80,-81,99,99,99,99,99,-84,99,99,99,99,99,99,99,99,99,99,99,99,-115,99,-116,-61,99,99,99,99,99,99,99,99,99,-62,-64,-63,-65,-66,99,]),'Operator_Binary_Shl':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,100,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,100,-47,-50,-89,-90,100,-47,100,-85,-86,100,100,100,100,100,100,100,100,100,100,100,-136,-66,100,100,100,100,100,100,-73,-74,-75,100,100,100,-79,-80,-81,100,100,100,100,100,-84,100,100,100,100,100,100,100,100,100,100,100,100,-115,100,-116,-61,100,100,100,100,100,100,100,100,100,-62,-64,-63,-65,-66,100,]),'Operator_Binary_Shr':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,101,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,101,-47,-50,-89,-90,101,-47,101,-85,-86,101,101,101,101,101,101,101,101,101,101,101,-136,-66,101,101,101,101,101,101,-73,-74,-75,101,101,101,-79,-80,-81,101,101,101,101,101,-84,101,101,101,101,101,101,101,101,101,101,101,101,-115,101,-116,-61,101,101,101,101,101,101,101,101,101,-62,-64,-63,-65,-66,101,]),'Operator_Binary_Bool_Or':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,102,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,102,-47,-50,-89,-90,102,-47,102,-85,-86,102,102,102,102,102,102,102,102,102,102,102,-136,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,102,102,102,102,102,-84,102,102,102,102,102,102,102,102,102,102,102,102,-115,102,-116,-61,102,102,102,102,102,102,102,102,102,-62,-64,-63,-65,-66,102,]),'Operator_Binary_Bool_And':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,103,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,103,-47,-50,-89,-90,103,-47,103,-85,-86,103,103,103,103,103,103,103,103,103,103,103,-136,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,103,103,103,103,103,-84,103,103,103,103,103,103,103,103,103,103,103,103,-115,103,-116,-61,103,103,103,103,103,103,103,103,103,-62,-64,-63,-65,-66,103,]),'Punctuation_TernaryConditional':([8,20,26,33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,108,109,110,122,123,128,129,136,137,138,147,148,149,150,151,152,153,154,155,156,157,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,192,193,194,195,196,197,198,199,203,209,212,219,221,223,224,225,230,235,237,239,246,255,257,258,259,260,269,270,],[-47,104,-50,-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,104,-47,-50,-89,-90,104,-47,104,-85,-86,104,104,104,104,104,104,104,104,104,104,104,-136,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,104,104,104,104,104,-84,104,104,104,104,104,104,104,104,104,104,104,104,-115,104,-116,-61,104,104,104,104,104,104,104,104,104,-62,-64,-63,-65,-66,104,]),'Operator_Unary_Dec':([8,26,47,109,110,129,159,221,],[80,122,-135,80,122,80,-136,-61,]),'Operator_Unary_Inc':([8,26,47,109,110,129,159,221,],[81,123,-135,81,123,81,-136,-61,]),'Operator_Dot':([8,47,66,67,109,111,129,132,159,201,213,232,233,242,245,],[82,-135,82,82,82,82,82,82,82,82,82,82,82,82,82,]),'Punctuation_CloseParen':([10,11,12,13,14,15,16,17,18,19,21,22,33,34,35,36,41,42,43,44,45,46,47,49,50,51,52,53,54,55,56,57,58,59,60,61,62,79,80,81,85,107,108,109,110,122,123,127,129,130,131,135,136,137,138,139,140,141,142,144,146,148,149,150,151,152,153,154,155,156,158,159,160,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,182,184,186,188,189,190,191,192,193,194,195,196,197,199,203,204,206,208,209,214,217,218,219,221,223,224,226,228,236,238,239,241,242,245,246,247,248,252,255,257,258,259,260,273,275,276,278,279,282,283,284,289,290,292,],[-2,-3,-4,-5,-6,-7,-8,-9,-10,-11,-94,-13,-48,-49,-51,-52,-117,-118,-119,-91,-92,-93,-135,-28,-29,-30,-34,-27,-31,-32,-33,-35,-54,-55,-56,-57,-53,-22,-87,-88,-12,183,184,185,-50,-89,-90,-44,-47,-42,-43,-58,-59,-85,-86,-23,-24,-25,-26,-38,215,-95,-96,-97,-98,-99,-100,-101,-102,-103,219,-136,-14,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,222,-84,-39,227,-104,-105,-106,-107,-108,-109,-110,-111,-112,229,234,-45,-22,-22,-115,243,-46,-113,-116,-61,-36,-37,249,-114,258,260,-60,-40,-121,-120,-137,-134,-41,268,271,-62,-64,-63,-65,-123,-127,-122,-126,-129,-133,-125,-124,-131,-132,-130,]),'Punctuation_CloseBracket':([33,34,35,36,38,41,42,43,47,58,59,60,61,62,80,81,110,122,123,129,134,135,136,137,138,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,181,184,209,219,221,223,224,235,237,239,246,254,257,258,259,260,270,],[-48,-49,-51,-52,-22,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,-50,-89,-90,-47,209,-58,-59,-85,-86,-136,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,221,-84,-115,-116,-61,-36,-37,257,259,-60,-137,-22,-62,-64,-63,-65,221,]),'Punctuation_Comma':([33,34,35,36,38,41,42,43,47,58,59,60,61,62,79,80,81,110,122,123,129,134,135,136,137,138,158,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,184,206,208,209,219,221,223,224,236,238,239,242,245,246,254,257,258,259,260,270,],[-48,-49,-51,-52,-22,-117,-118,-119,-135,-54,-55,-56,-57,-53,-22,-87,-88,-50,-89,-90,-47,210,-58,-59,-85,-86,210,-136,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-22,-22,-115,-116,-61,-36,-37,210,210,-60,261,264,-137,-22,-62,-64,-63,-65,-59,]),'Punctuation_TernarySeparator':([33,34,35,36,41,42,43,47,58,59,60,61,62,80,81,110,122,123,129,137,138,144,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,184,186,200,209,219,221,223,224,241,246,248,257,258,259,260,],[-48,-49,-51,-52,-117,-118,-119,-135,-54,-55,-56,-57,-53,-87,-88,-50,-89,-90,-47,-85,-86,-38,-136,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,220,-84,-39,231,-115,-116,-61,-36,-37,-40,-137,-41,-62,-64,-63,-65,]),'Keyword_Control_Else':([279,],[285,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'Module':([0,],[1,]),'GlobalStatementList':([0,4,5,],[2,63,64,]),'StatementList':([0,4,5,9,84,143,244,250,251,256,262,265,280,281,288,],[3,3,65,83,161,211,263,266,267,272,274,277,286,287,291,]),'ClassDecl':([0,4,5,],[4,4,4,]),'Statement':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[5,5,5,84,84,84,252,84,84,84,84,84,84,84,84,84,]),'empty':([0,4,5,9,38,79,84,143,206,208,244,250,251,254,256,262,265,280,281,288,],[6,6,6,6,135,135,6,6,135,135,6,6,6,135,6,6,6,6,6,6,]),'Ident':([0,4,5,7,8,9,24,25,30,37,38,39,40,68,69,70,71,72,73,74,75,76,77,78,79,82,84,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,112,113,114,115,116,117,118,119,120,121,124,125,126,143,145,146,183,185,187,188,200,201,202,205,206,207,208,210,213,216,220,230,231,244,250,251,253,254,256,261,262,264,265,280,281,288,],[8,8,8,66,67,8,109,111,129,132,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,159,8,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,129,201,129,8,129,213,129,129,129,213,129,232,233,129,129,129,129,129,242,245,129,8,129,8,8,8,129,129,8,213,8,213,8,8,8,8,]),'VarDecl':([0,4,5,9,84,125,143,230,244,250,251,256,262,265,280,281,288,],[10,10,10,10,10,200,10,10,10,10,10,10,10,10,10,10,10,]),'VarAssign':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'FuncDecl':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'IfBloc':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'ForBloc':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'WhileBloc':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'Scope':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'Return':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'Break':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'Continue':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'Expr':([0,4,5,9,24,30,38,39,40,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,112,113,114,115,116,117,118,119,120,121,124,126,143,145,183,185,187,200,205,206,207,208,210,220,230,231,244,250,251,253,254,256,262,265,280,281,288,],[20,20,20,20,108,128,136,137,138,147,148,149,150,151,152,153,154,155,156,157,136,20,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,189,190,191,192,193,194,195,196,197,198,199,203,20,212,223,224,225,230,235,136,237,136,239,246,20,255,20,20,20,269,270,20,20,20,20,20,20,]),'ignore':([0,4,5,9,84,143,230,244,250,251,256,262,265,280,281,288,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'Type':([0,4,5,9,24,37,84,125,143,146,188,230,244,250,251,256,261,262,264,265,280,281,288,],[25,25,25,25,107,133,25,202,25,216,216,25,25,25,25,25,216,25,216,25,25,25,25,]),'ArrayIndex':([0,4,5,9,24,30,38,39,40,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,112,113,114,115,116,117,118,119,120,121,124,126,143,145,183,185,187,200,205,206,207,208,210,220,230,231,244,250,251,253,254,256,262,265,280,281,288,],[26,26,26,26,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,26,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,110,26,110,110,110,110,110,110,110,110,110,110,110,26,110,26,26,26,110,110,26,26,26,26,26,26,]),'Number':([0,4,5,9,24,30,38,39,40,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,112,113,114,115,116,117,118,119,120,121,124,126,143,145,183,185,187,200,205,206,207,208,210,220,230,231,244,250,251,253,254,256,262,265,280,281,288,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'ArrayLiteral':([0,4,5,9,24,30,38,39,40,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,112,113,114,115,116,117,118,119,120,121,124,126,143,145,183,185,187,200,205,206,207,208,210,220,230,231,244,250,251,253,254,256,262,265,280,281,288,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'FuncCall':([0,4,5,9,24,30,38,39,40,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,112,113,114,115,116,117,118,119,120,121,124,126,143,145,183,185,187,200,205,206,207,208,210,220,230,231,244,250,251,253,254,256,262,265,280,281,288,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'String':([0,4,5,9,24,30,38,39,40,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,112,113,114,115,116,117,118,119,120,121,124,126,143,145,183,185,187,200,205,206,207,208,210,220,230,231,244,250,251,253,254,256,262,265,280,281,288,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'ExprList':([38,79,206,208,254,],[134,158,236,238,134,]),'TypedArgs':([146,188,261,264,],[214,226,273,276,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> Module","S'",1,None,None,None),
-  ('Module -> GlobalStatementList','Module',1,'p_module','parser_tree.py',294),
-  ('Statement -> VarDecl','Statement',1,'p_statement','parser_tree.py',299),
-  ('Statement -> VarAssign','Statement',1,'p_statement','parser_tree.py',300),
-  ('Statement -> FuncDecl','Statement',1,'p_statement','parser_tree.py',301),
-  ('Statement -> IfBloc','Statement',1,'p_statement','parser_tree.py',302),
-  ('Statement -> ForBloc','Statement',1,'p_statement','parser_tree.py',303),
-  ('Statement -> WhileBloc','Statement',1,'p_statement','parser_tree.py',304),
-  ('Statement -> Scope','Statement',1,'p_statement','parser_tree.py',305),
-  ('Statement -> Return','Statement',1,'p_statement','parser_tree.py',306),
-  ('Statement -> Break','Statement',1,'p_statement','parser_tree.py',307),
-  ('Statement -> Continue','Statement',1,'p_statement','parser_tree.py',308),
-  ('Statement -> Expr Punctuation_EoL','Statement',2,'p_statement','parser_tree.py',309),
-  ('Statement -> ignore','Statement',1,'p_statement','parser_tree.py',310),
-  ('Scope -> Punctuation_OpenBrace StatementList Punctuation_CloseBrace','Scope',3,'p_scope','parser_tree.py',318),
-  ('GlobalStatementList -> StatementList','GlobalStatementList',1,'p_all_statements_statement','parser_tree.py',323),
-  ('GlobalStatementList -> ClassDecl','GlobalStatementList',1,'p_all_statements_classDecl','parser_tree.py',330),
-  ('GlobalStatementList -> Statement GlobalStatementList','GlobalStatementList',2,'p_all_statements_addStatement','parser_tree.py',336),
-  ('GlobalStatementList -> ClassDecl GlobalStatementList','GlobalStatementList',2,'p_all_statements_addSClassDecl','parser_tree.py',349),
-  ('StatementList -> empty','StatementList',1,'p_bloc_empty','parser_tree.py',355),
-  ('StatementList -> Statement','StatementList',1,'p_bloc_single','parser_tree.py',360),
-  ('StatementList -> Statement StatementList','StatementList',2,'p_bloc_list','parser_tree.py',371),
-  ('empty -> <empty>','empty',0,'p_empty','parser_tree.py',384),
-  ('Type -> Keyword_Type_Mod_Unsigned Keyword_Type_Int16','Type',2,'p_utype','parser_tree.py',389),
-  ('Type -> Keyword_Type_Mod_Unsigned Keyword_Type_Int32','Type',2,'p_utype','parser_tree.py',390),
-  ('Type -> Keyword_Type_Mod_Unsigned Keyword_Type_Int64','Type',2,'p_utype','parser_tree.py',391),
-  ('Type -> Keyword_Type_Mod_Unsigned Keyword_Type_Char','Type',2,'p_utype','parser_tree.py',392),
-  ('Type -> Keyword_Type_Void','Type',1,'p_type','parser_tree.py',398),
-  ('Type -> Keyword_Type_Int16','Type',1,'p_type','parser_tree.py',399),
-  ('Type -> Keyword_Type_Int32','Type',1,'p_type','parser_tree.py',400),
-  ('Type -> Keyword_Type_Int64','Type',1,'p_type','parser_tree.py',401),
-  ('Type -> Keyword_Type_String','Type',1,'p_type','parser_tree.py',402),
-  ('Type -> Keyword_Type_Float_32','Type',1,'p_type','parser_tree.py',403),
-  ('Type -> Keyword_Type_Float_64','Type',1,'p_type','parser_tree.py',404),
-  ('Type -> Keyword_Type_Char','Type',1,'p_type','parser_tree.py',405),
-  ('Type -> Keyword_Type_Boolean','Type',1,'p_type','parser_tree.py',406),
-  ('Expr -> Punctuation_OpenParen Type Punctuation_CloseParen Expr','Expr',4,'p_cast','parser_tree.py',412),
-  ('Expr -> Punctuation_OpenParen Ident Punctuation_CloseParen Expr','Expr',4,'p_cast_2','parser_tree.py',418),
-  ('VarDecl -> Ident Ident Punctuation_EoL','VarDecl',3,'p_var_declaration','parser_tree.py',425),
-  ('VarDecl -> Type Ident Punctuation_EoL','VarDecl',3,'p_var_declaration_2','parser_tree.py',431),
-  ('VarDecl -> Ident Ident Operator_Binary_Affectation Expr Punctuation_EoL','VarDecl',5,'p_var_declaration_and_assignment','parser_tree.py',436),
-  ('VarDecl -> Type Ident Operator_Binary_Affectation Expr Punctuation_EoL','VarDecl',5,'p_var_declaration_and_assignment_2','parser_tree.py',441),
-  ('Break -> Keyword_Control_Break Punctuation_EoL','Break',2,'p_break','parser_tree.py',447),
-  ('Continue -> Keyword_Control_Continue Punctuation_EoL','Continue',2,'p_continue','parser_tree.py',453),
-  ('Return -> Keyword_Control_Return Punctuation_EoL','Return',2,'p_return_void','parser_tree.py',459),
-  ('Return -> Keyword_Control_Return Expr Punctuation_EoL','Return',3,'p_return_value','parser_tree.py',465),
-  ('VarAssign -> Ident Operator_Binary_Affectation Expr Punctuation_EoL','VarAssign',4,'p_var_assignment','parser_tree.py',471),
-  ('Expr -> Ident','Expr',1,'p_expr','parser_tree.py',477),
-  ('Expr -> Number','Expr',1,'p_expr','parser_tree.py',478),
-  ('Expr -> ArrayLiteral','Expr',1,'p_expr','parser_tree.py',479),
-  ('Expr -> ArrayIndex','Expr',1,'p_expr','parser_tree.py',480),
-  ('Expr -> FuncCall','Expr',1,'p_expr','parser_tree.py',481),
-  ('Expr -> String','Expr',1,'p_expr','parser_tree.py',482),
-  ('String -> Literal_String','String',1,'p_string','parser_tree.py',487),
-  ('Number -> Number_Char','Number',1,'p_number','parser_tree.py',493),
-  ('Number -> Number_Hex','Number',1,'p_number','parser_tree.py',494),
-  ('Number -> Number_Int','Number',1,'p_number','parser_tree.py',495),
-  ('Number -> Number_Float','Number',1,'p_number','parser_tree.py',496),
-  ('ExprList -> empty','ExprList',1,'p_expr_list','parser_tree.py',502),
-  ('ExprList -> Expr','ExprList',1,'p_expr_list','parser_tree.py',503),
-  ('ExprList -> ExprList Punctuation_Comma Expr','ExprList',3,'p_expr_list','parser_tree.py',504),
-  ('ArrayIndex -> Expr Punctuation_OpenBracket Expr Punctuation_CloseBracket','ArrayIndex',4,'p_index','parser_tree.py',509),
-  ('Expr -> Keyword_Object_New Ident Punctuation_OpenBracket Expr Punctuation_CloseBracket','Expr',5,'p_new_array','parser_tree.py',515),
-  ('Expr -> Keyword_Object_New Type Punctuation_OpenBracket Expr Punctuation_CloseBracket','Expr',5,'p_new_array_2','parser_tree.py',521),
-  ('Expr -> Keyword_Object_New Ident Punctuation_OpenParen ExprList Punctuation_CloseParen','Expr',5,'p_new_obj','parser_tree.py',527),
-  ('Expr -> Keyword_Object_New Type Punctuation_OpenParen ExprList Punctuation_CloseParen','Expr',5,'p_new_obj_2','parser_tree.py',533),
-  ('Expr -> Expr Operator_Minus Expr','Expr',3,'p_binop','parser_tree.py',539),
-  ('Expr -> Expr Operator_Binary_Bool_Eq Expr','Expr',3,'p_binop','parser_tree.py',540),
-  ('Expr -> Expr Operator_Binary_Bool_Neq Expr','Expr',3,'p_binop','parser_tree.py',541),
-  ('Expr -> Expr Operator_Binary_Bool_Geq Expr','Expr',3,'p_binop','parser_tree.py',542),
-  ('Expr -> Expr Operator_Binary_Bool_Leq Expr','Expr',3,'p_binop','parser_tree.py',543),
-  ('Expr -> Expr Operator_Binary_Bool_Gt Expr','Expr',3,'p_binop','parser_tree.py',544),
-  ('Expr -> Expr Operator_Binary_Bool_Lt Expr','Expr',3,'p_binop','parser_tree.py',545),
-  ('Expr -> Expr Operator_Binary_Plus Expr','Expr',3,'p_binop','parser_tree.py',546),
-  ('Expr -> Expr Operator_Binary_Times Expr','Expr',3,'p_binop','parser_tree.py',547),
-  ('Expr -> Expr Operator_Binary_Div Expr','Expr',3,'p_binop','parser_tree.py',548),
-  ('Expr -> Expr Operator_Binary_Mod Expr','Expr',3,'p_binop','parser_tree.py',549),
-  ('Expr -> Expr Operator_Binary_And Expr','Expr',3,'p_binop','parser_tree.py',550),
-  ('Expr -> Expr Operator_Binary_Or Expr','Expr',3,'p_binop','parser_tree.py',551),
-  ('Expr -> Expr Operator_Binary_Xor Expr','Expr',3,'p_binop','parser_tree.py',552),
-  ('Expr -> Expr Operator_Binary_Shl Expr','Expr',3,'p_binop','parser_tree.py',553),
-  ('Expr -> Expr Operator_Binary_Shr Expr','Expr',3,'p_binop','parser_tree.py',554),
-  ('Expr -> Expr Operator_Binary_Bool_Or Expr','Expr',3,'p_binop','parser_tree.py',555),
-  ('Expr -> Expr Operator_Binary_Bool_And Expr','Expr',3,'p_binop','parser_tree.py',556),
-  ('Expr -> Punctuation_OpenParen Expr Punctuation_CloseParen','Expr',3,'p_paren','parser_tree.py',563),
-  ('Expr -> Operator_Minus Expr','Expr',2,'p_UnOp','parser_tree.py',568),
-  ('Expr -> Operator_Unary_Not Expr','Expr',2,'p_UnOp','parser_tree.py',569),
-  ('Expr -> Ident Operator_Unary_Dec','Expr',2,'p_UnOp_IncDec','parser_tree.py',575),
-  ('Expr -> Ident Operator_Unary_Inc','Expr',2,'p_UnOp_IncDec','parser_tree.py',576),
-  ('Expr -> ArrayIndex Operator_Unary_Dec','Expr',2,'p_UnOp_IncDec','parser_tree.py',577),
-  ('Expr -> ArrayIndex Operator_Unary_Inc','Expr',2,'p_UnOp_IncDec','parser_tree.py',578),
-  ('ignore -> Comment_Singleline','ignore',1,'p_ignore','parser_tree.py',584),
-  ('ignore -> Comment_Multiline','ignore',1,'p_ignore','parser_tree.py',585),
-  ('ignore -> Whitespace','ignore',1,'p_ignore','parser_tree.py',586),
-  ('ignore -> Punctuation_EoL','ignore',1,'p_ignore','parser_tree.py',587),
-  ('VarAssign -> Ident Operator_Binary_MinusEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',593),
-  ('VarAssign -> Ident Operator_Binary_PlusEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',594),
-  ('VarAssign -> Ident Operator_Binary_TimesEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',595),
-  ('VarAssign -> Ident Operator_Binary_DivEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',596),
-  ('VarAssign -> Ident Operator_Binary_AndEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',597),
-  ('VarAssign -> Ident Operator_Binary_OrEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',598),
-  ('VarAssign -> Ident Operator_Binary_XorEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',599),
-  ('VarAssign -> Ident Operator_Binary_ShlEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',600),
-  ('VarAssign -> Ident Operator_Binary_ShrEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',601),
-  ('VarAssign -> ArrayIndex Operator_Binary_MinusEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',602),
-  ('VarAssign -> ArrayIndex Operator_Binary_PlusEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',603),
-  ('VarAssign -> ArrayIndex Operator_Binary_TimesEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',604),
-  ('VarAssign -> ArrayIndex Operator_Binary_DivEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',605),
-  ('VarAssign -> ArrayIndex Operator_Binary_AndEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',606),
-  ('VarAssign -> ArrayIndex Operator_Binary_OrEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',607),
-  ('VarAssign -> ArrayIndex Operator_Binary_XorEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',608),
-  ('VarAssign -> ArrayIndex Operator_Binary_ShlEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',609),
-  ('VarAssign -> ArrayIndex Operator_Binary_ShrEq Expr','VarAssign',3,'p_binop_assign','parser_tree.py',610),
-  ('VarAssign -> Ident Operator_Binary_Copy Expr Punctuation_EoL','VarAssign',4,'p_copy_assign','parser_tree.py',617),
-  ('VarAssign -> ArrayIndex Operator_Binary_Copy Expr Punctuation_EoL','VarAssign',4,'p_copy_assign','parser_tree.py',618),
-  ('ArrayLiteral -> Punctuation_OpenBracket ExprList Punctuation_CloseBracket','ArrayLiteral',3,'p_array_literal','parser_tree.py',624),
-  ('FuncCall -> Ident Punctuation_OpenParen ExprList Punctuation_CloseParen','FuncCall',4,'p_call','parser_tree.py',630),
-  ('Expr -> Keyword_Object_True','Expr',1,'p_true','parser_tree.py',637),
-  ('Expr -> Keyword_Object_False','Expr',1,'p_false','parser_tree.py',643),
-  ('Expr -> Keyword_Object_Null','Expr',1,'p_null','parser_tree.py',649),
-  ('TypedArgs -> Type Ident','TypedArgs',2,'p_typed_args_single','parser_tree.py',654),
-  ('TypedArgs -> Ident Ident','TypedArgs',2,'p_typed_args_single_2','parser_tree.py',659),
-  ('TypedArgs -> Type Ident Punctuation_Comma TypedArgs','TypedArgs',4,'p_typed_args_multiple','parser_tree.py',664),
-  ('TypedArgs -> Ident Ident Punctuation_Comma TypedArgs','TypedArgs',4,'p_typed_args_multiple_2','parser_tree.py',669),
-  ('FuncDecl -> Type Ident Punctuation_OpenParen TypedArgs Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace','FuncDecl',8,'p_func_declaration','parser_tree.py',674),
-  ('FuncDecl -> Ident Ident Punctuation_OpenParen TypedArgs Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace','FuncDecl',8,'p_func_declaration_2','parser_tree.py',679),
-  ('FuncDecl -> Type Ident Punctuation_OpenParen Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace','FuncDecl',7,'p_func_declaration_no_args','parser_tree.py',685),
-  ('FuncDecl -> Ident Ident Punctuation_OpenParen Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace','FuncDecl',7,'p_func_declaration_no_args_2','parser_tree.py',691),
-  ('ClassDecl -> Keyword_Object_Class Ident Punctuation_OpenBrace StatementList Punctuation_CloseBrace','ClassDecl',5,'p_class_declaration','parser_tree.py',697),
-  ('IfBloc -> Keyword_Control_If Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace','IfBloc',7,'p_if','parser_tree.py',709),
-  ('IfBloc -> Keyword_Control_If Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace Keyword_Control_Else Punctuation_OpenBrace StatementList Punctuation_CloseBrace','IfBloc',11,'p_if_else','parser_tree.py',715),
-  ('ForBloc -> Keyword_Control_For Punctuation_OpenParen VarDecl Expr Statement Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace','ForBloc',9,'p_for','parser_tree.py',721),
-  ('ForBloc -> Keyword_Control_For Punctuation_OpenParen VarDecl Punctuation_TernarySeparator Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace','ForBloc',9,'p_foreach','parser_tree.py',727),
-  ('WhileBloc -> Keyword_Control_While Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_OpenBrace StatementList Punctuation_CloseBrace','WhileBloc',7,'p_while','parser_tree.py',733),
-  ('Statement -> Keyword_Control_Assert Punctuation_OpenParen Expr Punctuation_CloseParen Punctuation_EoL','Statement',5,'p_assert','parser_tree.py',738),
-  ('Ident -> ID','Ident',1,'p_var','parser_tree.py',743),
-  ('Ident -> Ident Operator_Dot Ident','Ident',3,'p_dot','parser_tree.py',749),
-  ('Expr -> Expr Punctuation_TernaryConditional Expr Punctuation_TernarySeparator Expr','Expr',5,'p_ternary','parser_tree.py',758),
-]
@@ -39,6 +39,7 @@ import types
 import copy
 import os
 import inspect
+import pickle
 
 # This tuple contains acceptable string types
 StringTypes = (str, bytes)
@@ -143,7 +144,13 @@ class Lexer:
             c.lexstateerrorf = {}
             for key, ef in self.lexstateerrorf.items():
                 c.lexstateerrorf[key] = getattr(object, ef.__name__)
+            c.lexstateeoff = {}
+            for key, ef in self.lexstateeoff.items():
+                c.lexstateeoff[key] = getattr(object, ef.__name__)
             c.lexmodule = object
+            # The current state tables still point to the methods of the old object
+            c.begin(c.lexstate)
+        c.lexstatestack = list(self.lexstatestack)
         return c
 
     # ------------------------------------------------------------
@@ -353,23 +360,7 @@ def _form_master_re(relist, reflags, ldict, toknames):
     regex = '|'.join(relist)
     try:
         lexre = re.compile(regex, reflags)
-
-        # Build the index to function map for the matching engine
-        lexindexfunc = [None] * (max(lexre.groupindex.values()) + 1)
-        lexindexnames = lexindexfunc[:]
-
-        for f, i in lexre.groupindex.items():
-            handle = ldict.get(f, None)
-            if type(handle) in (types.FunctionType, types.MethodType):
-                lexindexfunc[i] = (handle, toknames[f])
-                lexindexnames[i] = f
-            elif handle is not None:
-                lexindexnames[i] = f
-                if f.find('ignore_') > 0:
-                    lexindexfunc[i] = (None, None)
-                else:
-                    lexindexfunc[i] = (None, toknames[f])
-
+        lexindexfunc, lexindexnames = _master_index(lexre, ldict, toknames)
         return [(lexre, lexindexfunc)], [regex], [lexindexnames]
     except Exception:
         m = (len(relist) // 2) + 1
@@ -377,6 +368,68 @@ def _form_master_re(relist, reflags, ldict, toknames):
         rlist, rre, rnames = _form_master_re(relist[m:], reflags, ldict, toknames)
         return (llist+rlist), (lre+rre), (lnames+rnames)
 
+# -----------------------------------------------------------------------------
+# _master_index()
+#
+# Builds the index to function map of a compiled master regex for the matching
+# engine, and the list of the rule names of its groups.
+# -----------------------------------------------------------------------------
+def _master_index(lexre, ldict, toknames):
+    lexindexfunc = [None] * (max(lexre.groupindex.values()) + 1)
+    lexindexnames = lexindexfunc[:]
+
+    for f, i in lexre.groupindex.items():
+        handle = ldict.get(f, None)
+        if type(handle) in (types.FunctionType, types.MethodType):
+            lexindexfunc[i] = (handle, toknames[f])
+            lexindexnames[i] = f
+        elif handle is not None:
+            lexindexnames[i] = f
+            if f.find('ignore_') > 0:
+                lexindexfunc[i] = (None, None)
+            else:
+                lexindexfunc[i] = (None, toknames[f])
+    return lexindexfunc, lexindexnames
+
+# -----------------------------------------------------------------------------
+#                            === TABLE CACHE ===
+#
+# Validating the rules and forming the master regular expressions can be
+# skipped by later runs: the master regex strings of each state, already split
+# the way re accepts them, are stored in a pickle file keyed by the signature
+# of the rules. Any change to the tokens, literals, states or rule regexes
+# triggers a rebuild.
+# -----------------------------------------------------------------------------
+
+__tabversion__ = '2022.10.27-cache-1'
+
+def write_lexer_cache(stateretext, signature, filename):
+    data = {
+        'tabversion': __tabversion__,
+        'signature': signature,
+        'stateretext': stateretext,
+    }
+    dirname = os.path.dirname(filename)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    tmpname = '%s.%d.tmp' % (filename, os.getpid())
+    with open(tmpname, 'wb') as f:
+        pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmpname, filename)
+
+# Returns the master regex strings of each state stored in filename, or None
+# if there is no usable cache for this signature.
+def read_lexer_cache(signature, filename):
+    try:
+        with open(filename, 'rb') as f:
+            data = pickle.load(f)
+        if data['tabversion'] != __tabversion__ or data['signature'] != signature:
+            return None
+        return data['stateretext']
+    except Exception:
+        # Missing, unreadable or corrupted cache: the rules get validated again
+        return None
+
 # -----------------------------------------------------------------------------
 # def _statetoken(s,names)
 #
@@ -434,6 +487,15 @@ class LexerReflect(object):
         self.validate_rules()
         return self.error
 
+    # Compute a signature over the rules
+    def signature(self):
+        parts = [repr(self.reflags), ' '.join(self.tokens), repr(self.literals), repr(sorted(self.stateinfo.items()))]
+        for state in sorted(self.stateinfo):
+            parts.append(repr(self.ignore.get(state, '')))
+            parts.extend('%s=%s' % (fname, _get_regex(f)) for fname, f in self.funcsym.get(state, []))
+            parts.extend('%s=%s' % (name, r) for name, r in self.strsym.get(state, []))
+        return '\n'.join(parts)
+
     # Get the tokens map
     def get_tokens(self):
         tokens = self.ldict.get('tokens', None)
@@ -715,7 +777,7 @@ class LexerReflect(object):
 # Build all of the regular expression rules from definitions in the supplied module
 # -----------------------------------------------------------------------------
 def lex(*, module=None, object=None, debug=False, 
-        reflags=int(re.VERBOSE), debuglog=None, errorlog=None):
+        reflags=int(re.VERBOSE), debuglog=None, errorlog=None, picklefile=None):
 
     global lexer
 
@@ -748,7 +810,18 @@ def lex(*, module=None, object=None, debug=False,
     # Collect parser information from the dictionary
     linfo = LexerReflect(ldict, log=errorlog, reflags=reflags)
     linfo.get_all()
-    if linfo.validate_all():
+
+    # Reuse the master regexes of a previous run if the rules did not change,
+    # they were validated when they were built
+    signature = None
+    stateretext = None
+    if picklefile and not debug and not linfo.error:
+        signature = linfo.signature()
+        stateretext = read_lexer_cache(signature, picklefile)
+    if stateretext is None:
+        if linfo.validate_all():
+            raise SyntaxError("Can't build lexer")
+    elif linfo.error:
         raise SyntaxError("Can't build lexer")
 
     # Dump some basic debugging information
@@ -773,9 +846,22 @@ def lex(*, module=None, object=None, debug=False,
     # Get the stateinfo dictionary
     stateinfo = linfo.stateinfo
 
+    if stateretext is not None:
+        for state, re_text in stateretext.items():
+            lexre = []
+            re_names = []
+            for regex in re_text:
+                cre = re.compile(regex, reflags)
+                lexindexfunc, lexindexnames = _master_index(cre, ldict, linfo.toknames)
+                lexre.append((cre, lexindexfunc))
+                re_names.append(lexindexnames)
+            lexobj.lexstatere[state] = lexre
+            lexobj.lexstateretext[state] = list(re_text)
+            lexobj.lexstaterenames[state] = re_names
+
     regexs = {}
     # Build the master regular expressions
-    for state in stateinfo:
+    for state in (stateinfo if stateretext is None else ()):
         regex_list = []
 
         # Add rules defined by functions first
@@ -806,6 +892,13 @@ def lex(*, module=None, object=None, debug=False,
             for i, text in enumerate(re_text):
                 debuglog.info("lex: state '%s' : regex[%d] = '%s'", state, i, text)
 
+    if picklefile and stateretext is None:
+        try:
+            write_lexer_cache({state: list(re_text) for state, re_text in lexobj.lexstateretext.items()},
+                              signature or linfo.signature(), picklefile)
+        except IOError as e:
+            errorlog.warning("Couldn't write lexer cache %r. %s" % (picklefile, e))
+
     # For inclusive states, we need to add the regular expressions from the INITIAL state
     for state, stype in stateinfo.items():
         if state != 'INITIAL' and stype == 'inclusive':
@@ -64,7 +64,9 @@
 import re
 import types
 import sys
+import os
 import inspect
+import pickle
 
 #-----------------------------------------------------------------------------
 #                     === User configurable parameters ===
@@ -175,6 +177,7 @@ class YaccProduction:
         self.stack = stack
         self.lexer = None
         self.parser = None
+        self.emitted = None
 
     def __getitem__(self, n):
         if isinstance(n, slice):
@@ -218,6 +221,16 @@ class YaccProduction:
     def error(self):
         raise SyntaxError
 
+    # Hands value to the consumer of LRParser.parse_stream() as soon as the
+    # current reduction is done. Returns False without doing anything when the
+    # parser is not streaming: the action then has to keep value itself.
+    def emit(self, value):
+        emitted = self.emitted
+        if emitted is None:
+            return False
+        emitted.append(value)
+        return True
+
 # -----------------------------------------------------------------------------
 #                               == LRParser ==
 #
@@ -232,6 +245,10 @@ class LRParser:
         self.errorfunc = errorf
         self.set_defaulted_states()
         self.errorok = True
+        # Table cache (filename, signature) compile() stores its tables in, and
+        # the tables already stored there by terminal list
+        self.table_cache = None
+        self.compiled_tables = {}
 
     def errok(self):
         self.errorok = True
@@ -580,6 +597,207 @@ class LRParser:
             # If we'r here, something really bad happened
             raise RuntimeError('yacc: internal parser error!!!\n')
 
+    # compile().
+    #
+    # Builds dense versions of the action and goto tables for parse_compiled().
+    # Every terminal and nonterminal is given a small integer id and the tables
+    # become lists indexed by [state][symbol id], so the parsing loop does not
+    # hash symbol names anymore. terminals gives the order of the first ids: a
+    # lexer numbering its token types the same way can emit the ids directly.
+    # '$end' and any terminal not listed get the following ids.
+    # When the parser was given a table cache, the tables are read from it for
+    # a terminal list already compiled, or added to it.
+
+    def compile(self, terminals=()):
+        key = tuple(terminals)
+        compiled = self.compiled_tables.get(key)
+        if compiled is None:
+            compiled = self.build_compiled(key)
+            self.compiled_tables[key] = compiled
+            if self.table_cache is not None:
+                filename, signature = self.table_cache
+                try:
+                    write_compiled_cache(key, compiled, signature, filename)
+                except OSError:
+                    pass
+        (self.terminal_ids, self.nonterminal_ids, self.dense_action, self.dense_goto,
+         self.dense_defaulted, self.production_lhs, self.end_id) = compiled
+
+    def build_compiled(self, terminals):
+        terminal_names = list(terminals)
+        nonterminal_names = []
+        for p in self.productions:
+            if p.name not in nonterminal_names:
+                nonterminal_names.append(p.name)
+        for actions in self.action.values():
+            for name in actions:
+                if name not in terminal_names and name not in nonterminal_names:
+                    terminal_names.append(name)
+        if '$end' not in terminal_names:
+            terminal_names.append('$end')
+
+        terminal_ids = {name: i for i, name in enumerate(terminal_names)}
+        nonterminal_ids = {name: i for i, name in enumerate(nonterminal_names)}
+
+        nstates = max(self.action) + 1
+        dense_action = [[None] * len(terminal_names) for _ in range(nstates)]
+        dense_goto = [[None] * len(nonterminal_names) for _ in range(nstates)]
+        for state, actions in self.action.items():
+            row = dense_action[state]
+            for name, t in actions.items():
+                row[terminal_ids[name]] = t
+        for state, gotos in self.goto.items():
+            row = dense_goto[state]
+            for name, g in gotos.items():
+                row[nonterminal_ids[name]] = g
+        dense_defaulted = [self.defaulted_states.get(state) for state in range(nstates)]
+        production_lhs = [nonterminal_ids[p.name] for p in self.productions]
+        return (terminal_ids, nonterminal_ids, dense_action, dense_goto,
+                dense_defaulted, production_lhs, terminal_ids['$end'])
+
+    # parse_compiled().
+    #
+    # Same parsing engine as parse(), running on the tables built by compile().
+    # The lexer may give token types either as names or directly as terminal ids.
+    # Error recovery through 'error' productions is not supported: on a syntax
+    # error the error function is called with the offending token (None at the
+    # end of the input) and, if it returns, parsing stops and None is returned.
+
+    def parse_compiled(self, input=None, lexer=None, tracking=False):
+        steps = self.run_compiled(input, lexer, tracking)
+        try:
+            while True:
+                next(steps)
+        except StopIteration as e:
+            return e.value
+
+    # parse_stream().
+    #
+    # Generator version of parse_compiled(): yields, in order, the values the
+    # grammar actions pass to YaccProduction.emit() as soon as they are reduced,
+    # instead of leaving them in the final result. The final result is the value
+    # of the StopIteration ending the generator.
+
+    def parse_stream(self, input=None, lexer=None, tracking=False):
+        return (yield from self.run_compiled(input, lexer, tracking, emitted=[]))
+
+    # run_compiled().
+    #
+    # The parsing loop of parse_compiled() and parse_stream(). It is a generator
+    # returning the result. When given an emitted list, the values the actions
+    # emit are collected in it and yielded after each reduction.
+
+    def run_compiled(self, input=None, lexer=None, tracking=False, emitted=None):
+        if not hasattr(self, 'dense_action'):
+            self.compile()
+
+        actions  = self.dense_action
+        goto     = self.dense_goto
+        defaulted_states = self.dense_defaulted
+        prod     = self.productions
+        prod_lhs = self.production_lhs
+        term_ids = self.terminal_ids
+        end_id   = self.end_id
+        pslice   = YaccProduction(None)
+
+        if lexer is None:
+            from . import lex
+            lexer = lex.lexer
+
+        pslice.lexer = lexer
+        pslice.parser = self
+        pslice.emitted = emitted
+
+        if input is not None:
+            lexer.input(input)
+
+        get_token = self.token = lexer.token
+
+        statestack = self.statestack = []
+        symstack = self.symstack = []
+        pslice.stack = symstack
+
+        statestack.append(0)
+        sym = YaccSymbol()
+        sym.type = '$end'
+        symstack.append(sym)
+        state = 0
+        lookahead = None
+        ltype = None
+        while True:
+            t = defaulted_states[state]
+            if t is None:
+                if lookahead is None:
+                    lookahead = get_token()
+                    if lookahead is None:
+                        lookahead = YaccSymbol()
+                        lookahead.type = '$end'
+                        ltype = end_id
+                    else:
+                        ltype = lookahead.type
+                        if ltype.__class__ is not int:
+                            ltype = term_ids.get(ltype)
+                t = actions[state][ltype] if ltype is not None else None
+
+            if t is None:
+                self.state = state
+                errtoken = None if ltype == end_id else lookahead
+                if self.errorfunc:
+                    if errtoken is not None and not hasattr(errtoken, 'lexer'):
+                        errtoken.lexer = lexer
+                    self.errorfunc(errtoken)
+                return None
+
+            if t > 0:
+                # shift
+                statestack.append(t)
+                state = t
+                symstack.append(lookahead)
+                lookahead = None
+                continue
+
+            if t < 0:
+                # reduce
+                p = prod[-t]
+                plen = p.len
+                sym = YaccSymbol()
+                sym.type = p.name
+                sym.value = None
+
+                if plen:
+                    targ = symstack[-plen-1:]
+                    targ[0] = sym
+                    if tracking:
+                        t1 = targ[1]
+                        sym.lineno = t1.lineno
+                        sym.lexpos = t1.lexpos
+                        t1 = targ[-1]
+                        sym.endlineno = getattr(t1, 'endlineno', t1.lineno)
+                        sym.endlexpos = getattr(t1, 'endlexpos', t1.lexpos)
+                    pslice.slice = targ
+                    del symstack[-plen:]
+                    self.state = state
+                    p.callable(pslice)
+                    del statestack[-plen:]
+                else:
+                    if tracking:
+                        sym.lineno = lexer.lineno
+                        sym.lexpos = lexer.lexpos
+                    pslice.slice = [sym]
+                    self.state = state
+                    p.callable(pslice)
+
+                symstack.append(sym)
+                state = goto[statestack[-1]][prod_lhs[-t]]
+                statestack.append(state)
+                if emitted:
+                    yield from emitted
+                    emitted.clear()
+                continue
+
+            # accept
+            return getattr(symstack[-1], 'value', None)
+
 # -----------------------------------------------------------------------------
 #                          === Grammar Representation ===
 #
@@ -1922,6 +2140,132 @@ class LRTable:
             goto[st] = st_goto
             st += 1
 
+# -----------------------------------------------------------------------------
+#                            === TABLE CACHE ===
+#
+# Building the LALR tables is by far the most expensive part of yacc(). The
+# following functions and classes store the generated action/goto tables and
+# the production list in a pickle file so that later runs can load them instead
+# of building them again. The cache is keyed by the grammar signature: any change
+# to the start symbol, precedence, tokens or rule docstrings triggers a rebuild.
+# -----------------------------------------------------------------------------
+
+__tabversion__ = '2022.10.27-cache-2'
+
+# -----------------------------------------------------------------------------
+# class MiniProduction:
+#
+# Reduced version of Production holding only what the LRParser needs at parse
+# time. Productions loaded from the table cache are MiniProductions.
+# -----------------------------------------------------------------------------
+
+class MiniProduction(object):
+    def __init__(self, str, name, len, func, file, line):
+        self.name     = name
+        self.len      = len
+        self.func     = func
+        self.callable = None
+        self.file     = file
+        self.line     = line
+        self.str      = str
+
+    def __str__(self):
+        return self.str
+
+    def __repr__(self):
+        return 'MiniProduction(%s)' % self.str
+
+    # Bind the production function name to a callable
+    def bind(self, pdict):
+        if self.func:
+            self.callable = pdict[self.func]
+
+# -----------------------------------------------------------------------------
+# class LRCachedTable:
+#
+# Parsing tables read back from the cache. Provides the same attributes as
+# LRTable used by LRParser (lr_action, lr_goto and lr_productions).
+# -----------------------------------------------------------------------------
+
+class LRCachedTable(object):
+    def __init__(self, productions, action, goto, compiled):
+        self.lr_productions = productions
+        self.lr_action      = action
+        self.lr_goto        = goto
+        self.lr_compiled    = compiled
+
+    def bind_callables(self, pdict):
+        for p in self.lr_productions:
+            p.bind(pdict)
+
+# -----------------------------------------------------------------------------
+# write_table_cache()
+#
+# Pickles the tables of lrtab to filename. The file is first written next to its
+# final location and then moved in place so concurrent processes never read a
+# partially written cache.
+# -----------------------------------------------------------------------------
+
+def write_table_cache(lrtab, signature, filename):
+    productions = [(p.str, p.name, p.len, p.func, os.path.basename(p.file), p.line)
+                   for p in lrtab.lr_productions]
+    data = {
+        'tabversion': __tabversion__,
+        'signature': signature,
+        'productions': productions,
+        'action': lrtab.lr_action,
+        'goto': lrtab.lr_goto,
+        'compiled': {},
+    }
+    dump_table_cache(data, filename)
+
+def dump_table_cache(data, filename):
+    dirname = os.path.dirname(filename)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    tmpname = '%s.%d.tmp' % (filename, os.getpid())
+    with open(tmpname, 'wb') as f:
+        pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmpname, filename)
+
+# -----------------------------------------------------------------------------
+# write_compiled_cache()
+#
+# Adds the tables LRParser.compile() built for a terminal list to the cache
+# entry of the grammar signature in filename. Nothing is written if the file
+# does not hold the tables of this grammar anymore.
+# -----------------------------------------------------------------------------
+
+def write_compiled_cache(terminals, compiled, signature, filename):
+    try:
+        with open(filename, 'rb') as f:
+            data = pickle.load(f)
+        if data['tabversion'] != __tabversion__ or data['signature'] != signature:
+            return
+    except Exception:
+        return
+    data['compiled'][terminals] = compiled
+    dump_table_cache(data, filename)
+
+# -----------------------------------------------------------------------------
+# read_table_cache()
+#
+# Returns the LRCachedTable stored in filename, or None if there is no usable
+# cache for this grammar signature.
+# -----------------------------------------------------------------------------
+
+def read_table_cache(signature, filename):
+    try:
+        with open(filename, 'rb') as f:
+            data = pickle.load(f)
+        if data['tabversion'] != __tabversion__ or data['signature'] != signature:
+            return None
+        productions = [MiniProduction(*p) for p in data['productions']]
+        return LRCachedTable(productions, data['action'], data['goto'], data['compiled'])
+    except Exception:
+        # Missing, unreadable or corrupted cache: the tables get rebuilt
+        return None
+
 # -----------------------------------------------------------------------------
 #                            === INTROSPECTION ===
 #
@@ -2035,6 +2379,7 @@ class ParserReflect(object):
                 parts.append(' '.join(self.tokens))
             for f in self.pfuncs:
                 if f[3]:
+                    parts.append(f[2])
                     parts.append(f[3])
         except (TypeError, ValueError):
             pass
@@ -2270,7 +2615,7 @@ class ParserReflect(object):
 
 def yacc(*, debug=yaccdebug, module=None, start=None,
          check_recursion=True, optimize=False, debugfile=debug_file,
-         debuglog=None, errorlog=None):
+         debuglog=None, errorlog=None, picklefile=None):
 
     # Reference to the parsing method of the last built parser
     global parse
@@ -2303,6 +2648,22 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
     if pinfo.error:
         raise YaccError('Unable to build parser')
 
+    # Reuse the tables of a previous run if the grammar did not change
+    signature = pinfo.signature()
+    if picklefile and not debug:
+        lr = read_table_cache(signature, picklefile)
+        if lr is not None:
+            try:
+                lr.bind_callables(pinfo.pdict)
+            except KeyError:
+                lr = None
+        if lr is not None:
+            parser = LRParser(lr, pinfo.error_func)
+            parser.table_cache = (picklefile, signature)
+            parser.compiled_tables = lr.lr_compiled
+            parse = parser.parse
+            return parser
+
     if debuglog is None:
         if debug:
             try:
@@ -2474,9 +2835,18 @@ def yacc(*, debug=yaccdebug, module=None, start=None,
                 errorlog.warning('Rule (%s) is never reduced', rejected)
                 warned_never.append(rejected)
 
+    table_cache = None
+    if picklefile:
+        try:
+            write_table_cache(lr, signature, picklefile)
+            table_cache = (picklefile, signature)
+        except OSError as e:
+            errorlog.warning("Couldn't write table cache %r. %s" % (picklefile, e))
+
     # Build the parser
     lr.bind_callables(pinfo.pdict)
     parser = LRParser(lr, pinfo.error_func)
+    parser.table_cache = table_cache
 
     parse = parser.parse
     return parser
@@ -0,0 +1,139 @@
+"""Symbol table of the typing stage, and the symbols it binds names to.
+
+A name is resolved with a single dict probe however deep the scopes are: the
+table maps each name to its innermost visible declaration, and each open scope
+keeps the declarations it shadows to put them back when it closes.
+
+Each variable gets a slot in the frame it lives in, so later stages address
+variables by (frame, slot) and never by name:
+ - the module frame holds the globals and the variables of the module code,
+ - the frame of a function its arguments (first) and its locals,
+ - the frame of a class the fields of its instances.
+The slots of a closed scope are reused by the next scopes of the same frame, the
+size of a frame is the largest number of its variables alive at once.
+"""
+
+GLOBAL = 'global'
+LOCAL = 'local'
+FIELD = 'field'
+
+
+class Variable:
+    """A declared variable. frame is the Function whose frame holds it, None
+    for the module frame and the class Type for a field."""
+    __slots__ = ('name', 'type', 'kind', 'frame', 'slot', 'depth')
+
+    def __init__(self, name:str, typ, kind:str, frame, slot:int, depth:int) -> None:
+        self.name = name
+        self.type = typ
+        self.kind = kind
+        self.frame = frame
+        self.slot = slot
+        # Scope depth of the declaration
+        self.depth = depth
+
+    def __repr__(self) -> str:
+        return f"Variable({self.name}: {self.type}, {self.kind} slot {self.slot})"
+
+
+class Function:
+    """Signature of a declared function or method, and the size of its frame
+    once its body is checked"""
+    __slots__ = ('name', 'returnType', 'argTypes', 'node', 'depth', 'frameSize')
+
+    def __init__(self, name:str, returnType, argTypes:tuple, node, depth:int) -> None:
+        self.name = name
+        self.returnType = returnType
+        self.argTypes = argTypes
+        self.node = node
+        self.depth = depth
+        self.frameSize = None
+
+    def __repr__(self) -> str:
+        return f"Function({self.name})"
+
+
+class Frame:
+    __slots__ = ('owner', 'nextSlot', 'size')
+
+    def __init__(self, owner) -> None:
+        self.owner = owner
+        self.nextSlot = 0
+        self.size = 0
+
+
+class SymbolTable:
+    def __init__(self) -> None:
+        # Innermost visible symbol of each name
+        self.names = {}
+        self.depth = 0
+        # For each open scope, the (name, shadowed symbol or None) it bound
+        self.shadowed = []
+        # First free slot of the frame when each open scope was opened
+        self.slots = []
+        self.frame = Frame(None)
+
+    def openScope(self) -> None:
+        self.depth += 1
+        self.shadowed.append([])
+        self.slots.append(self.frame.nextSlot)
+
+    def closeScope(self) -> None:
+        names = self.names
+        for name, previous in reversed(self.shadowed.pop()):
+            if previous is None:
+                del names[name]
+            else:
+                names[name] = previous
+        self.depth -= 1
+        self.frame.nextSlot = self.slots.pop()
+
+    def scopeSymbols(self) -> dict:
+        """Symbols bound by the innermost scope"""
+        return {name: self.names[name] for name, _ in self.shadowed[-1]}
+
+    def bind(self, name:str, symbol):
+        """Makes name refer to symbol in the innermost scope. Returns the symbol
+        name was already bound to in this scope, if any."""
+        previous = self.names.get(name)
+        self.shadowed[-1].append((name, previous))
+        self.names[name] = symbol
+        if previous is not None and previous.depth == self.depth:
+            return previous
+        return None
+
+    def enterFrame(self, owner) -> Frame:
+        """Starts allocating slots in the frame of owner, returns the frame to
+        give back to leaveFrame"""
+        saved = self.frame
+        self.frame = Frame(owner)
+        return saved
+
+    def leaveFrame(self, saved:Frame) -> int:
+        """Goes back to the frame before enterFrame, returns the size of the left one"""
+        size = self.frame.size
+        self.frame = saved
+        return size
+
+    def newVariable(self, name:str, typ) -> Variable:
+        frame = self.frame
+        owner = frame.owner
+        if owner is None:
+            kind = GLOBAL
+        elif owner.__class__ is Function:
+            kind = LOCAL
+        else:
+            kind = FIELD
+        variable = Variable(name, typ, kind, owner, frame.nextSlot, self.depth)
+        frame.nextSlot += 1
+        if frame.nextSlot > frame.size:
+            frame.size = frame.nextSlot
+        return variable
+
+
+def signature(symbol) -> str:
+    """What the code using symbol relies on: the type of a variable, the
+    signature of a function"""
+    if symbol.__class__ is Function:
+        return f"{symbol.returnType}({','.join(map(str, symbol.argTypes))})"
+    return str(symbol.type)
@@ -0,0 +1,929 @@
+"""Typing stage: checks the types of a parsed module, and annotates each of its
+expressions with the interned Type of its value (the `type` slot of the nodes).
+
+Each identifier is resolved once, here: its `symbol` slot gets the Variable
+(frame and slot) or the Function it names, and the declarations of functions
+and the module get the `frameSize` their variables need.
+
+Type errors do not stop the check: they are collected, ordered by location, and
+an expression which could not be typed gets the error type so it is not
+reported again by the expressions using it.
+
+Once the declarations of the module are known, the bodies of its functions and
+methods are checked independently of each other, so they can be spread over
+worker processes (see check_module).
+"""
+import gc
+import multiprocessing
+import os
+import time
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+
+from operations import BinaryOperation, UnaryOperation
+from parser_tree import (PArray, PAssert, PAssign, PBinOp, PBreak, PCall, PCast, PContinue, PCopyAssign, PDot,
+                         PExpression, PFor, PForeach, PFuncDecl, PIdentifier, PIf, PIndex, PModule, PNewArray, PNewObj,
+                         PNumeric, PReturn, PScope, PSkip, PString, PTernary, PTreeElem, PType, PUType, PUnOp, PVarDecl,
+                         PWhile)
+from symbols import GLOBAL, LOCAL, Function, SymbolTable, Variable, signature
+from type_system import (ARRAY, BOOL_TYPE, CHAR_TYPE, CLASS, ERROR_TYPE, FLOAT, FLOAT64_TYPE, INT, INT32_TYPE,
+                         INT64_TYPE, NULL_TYPE, STRING_TYPE, TYPE_NAMES, UNSIGNED_TYPE_NAMES, VOID_TYPE, Type, array_of,
+                         castable, class_type, convertible, integer_range, type_named)
+
+ARITHMETIC = 'arithmetic'
+COMPARISON = 'comparison'
+EQUALITY = 'equality'
+LOGICAL = 'logical'
+BITWISE = 'bitwise'
+SHIFT = 'shift'
+
+# Kind of each BinaryOperation, by member name: hashing an Enum member runs Python code
+OPERATOR_KINDS = {
+    'PLUS': ARITHMETIC, 'MINUS': ARITHMETIC, 'TIMES': ARITHMETIC, 'DIVIDE': ARITHMETIC, 'MOD': ARITHMETIC,
+    'BOOL_EQ': EQUALITY, 'BOOL_NEQ': EQUALITY,
+    'BOOL_GEQ': COMPARISON, 'BOOL_LEQ': COMPARISON, 'BOOL_GT': COMPARISON, 'BOOL_LT': COMPARISON,
+    'BOOL_AND': LOGICAL, 'BOOL_OR': LOGICAL,
+    'LOGIC_AND': BITWISE, 'LOGIC_OR': BITWISE, 'LOGIC_XOR': BITWISE,
+    'SHIFT_LEFT': SHIFT, 'SHIFT_RIGHT': SHIFT,
+}
+
+# Members every array and string has
+LENGTH_MEMBER = 'Len'
+
+# Costs of spreading bodies over workers, in walks of their nodes (body_nodes):
+# a worker encodes the annotations of the bodies it checked, and the parent walks
+# the bodies while the workers check, then sets the annotations they send back
+ENCODE_WALKS = 1.6
+RESTORE_WALKS = 0.35
+# Estimated number of nodes under which forking the workers costs more than it saves
+MIN_PARALLEL_NODES = 50_000
+# Part of the time of checking here the workers must be estimated to take at most,
+# the estimate being rough
+MAX_PARALLEL_SHARE = 0.75
+# Part of the bodies the parent checks first to estimate their work
+SAMPLE_PART = 16
+
+
+def class_dependency(name:str) -> str:
+    """Name under which a body depends on the class called name: classes are
+    not in the namespace of the variables and functions"""
+    return 'class ' + name
+
+
+class TypingError(Exception):
+    """A type error of the source. The checker collects them instead of raising them."""
+
+    def __init__(self, msg:str, location) -> None:
+        # Both in args, for the errors of workers are pickled
+        super().__init__(msg, location)
+        self.msg = msg
+        self.location = location
+
+    def __str__(self) -> str:
+        return f"{self.msg} on {self.location}"
+
+
+def expression_list(items) -> list:
+    """Expressions of an ExprList, which the parser nests as [[[a], ',', b], ',', c]"""
+    if len(items) == 1 and items[0].__class__ is not list:
+        return items if items[0] is not None else []
+    found = []
+    stack = [items]
+    while stack:
+        item = stack.pop()
+        if item.__class__ is list:
+            stack.extend(reversed(item))
+        elif item is not None and item.__class__ is not str:
+            found.append(item)
+    return found
+
+
+def literal_value(node):
+    """The number a numeric literal (maybe negated) evaluates to, None for other expressions"""
+    sign = 1
+    if node.__class__ is PUnOp and node.op is UnaryOperation.MINUS:
+        sign = -1
+        node = node.rvalue
+    if node.__class__ is PExpression:
+        node = node.rvalue
+    if node.__class__ is PNumeric:
+        return sign * node.rvalue
+    return None
+
+
+def literal_fits(node, target:Type) -> bool:
+    """Whether node is a numeric literal whose value target can hold: literals
+    convert to narrower types when their value fits"""
+    value = literal_value(node)
+    if value is None:
+        return False
+    if target.kind == FLOAT:
+        return True
+    if target.kind != INT or isinstance(value, float):
+        return False
+    low, high = integer_range(target)
+    return low <= value <= high
+
+
+class TypeChecker:
+    def __init__(self) -> None:
+        self.errors = []
+        # Names visible from the checked code, bound to Variables and Functions
+        self.symbols = SymbolTable()
+        # Members (Variables of fields, Functions of methods) of each class Type
+        self.classes = {}
+        self.typeNames = dict(TYPE_NAMES)
+        # (class Type or None, Function) of each body to check once the module is declared
+        self.bodies = []
+        # Module level names (see signatures) used by the body being checked
+        self.used = set()
+        # Function whose body is checked, and number of loops around the statement
+        self.function = None
+        self.loops = 0
+        # See sharedSymbols
+        self.shared = None
+        self.expressionRules = {
+            PExpression: self.typeValue,
+            PNumeric: self.typeNumber,
+            PString: self.typeString,
+            PBinOp: self.typeBinOp,
+            PAssign: self.typeAssign,
+            PCopyAssign: self.typeAssign,
+            PUnOp: self.typeUnOp,
+            PCall: self.typeCall,
+            PCast: self.typeCast,
+            PIndex: self.typeIndex,
+            PDot: self.typeDot,
+            PIdentifier: self.lookupVariable,
+            PNewArray: self.typeNewArray,
+            PNewObj: self.typeNewObj,
+            PTernary: self.typeTernary,
+        }
+        self.statementRules = {
+            PVarDecl: self.declare,
+            PIf: self.checkIf,
+            PWhile: self.checkWhile,
+            PFor: self.checkFor,
+            PForeach: self.checkForeach,
+            PReturn: self.checkReturn,
+            PBreak: self.checkLoopJump,
+            PContinue: self.checkLoopJump,
+            PAssert: self.checkAssert,
+            PScope: self.checkScope,
+            PSkip: self.checkSkip,
+        }
+
+    def error(self, msg:str, node) -> Type:
+        self.errors.append(TypingError(msg, node.location))
+        return ERROR_TYPE
+
+    # Declarations
+
+    def resolveType(self, node) -> Type:
+        """Type named by a PType, or by a PIdentifier for the declarations the
+        parser gives the class name as it is"""
+        cls = node.__class__
+        if cls is PType:
+            typ = self.typeNames.get(node.type_identifier)
+        elif cls is PUType:
+            typ = UNSIGNED_TYPE_NAMES.get(node.type_identifier)
+            if typ is None:
+                return self.error(f"Type {node.type_identifier} can not be unsigned", node)
+            return typ
+        elif cls is PArray:
+            return array_of(self.resolveType(node.type_identifier))
+        else:
+            typ = self.typeNames.get(node.identifier)
+        if typ is None or typ.kind == CLASS:
+            name = node.type_identifier if cls is PType else node.identifier
+            self.used.add(class_dependency(name))
+            if typ is None:
+                return self.error(f"Unknown type {name}", node)
+        return typ
+
+    def declare(self, node:PVarDecl) -> Type:
+        """Declares a variable in the innermost scope, in the next slot of the current frame"""
+        typ = self.resolveType(node.typ)
+        name = node.id.identifier
+        if typ is VOID_TYPE:
+            typ = self.error(f"Variable {name} can not be void", node)
+        variable = self.symbols.newVariable(name, typ)
+        if self.symbols.bind(name, variable) is not None:
+            self.error(f"{name} is already declared in this scope", node)
+        node.id.symbol = variable
+        node.type = typ
+        return typ
+
+    def declareFunction(self, node:PFuncDecl) -> Function:
+        function = Function(node.id.identifier, self.resolveType(node.returnType),
+                            tuple(self.resolveType(arg.typ) for arg in node.args), node, self.symbols.depth)
+        if self.symbols.bind(function.name, function) is not None:
+            self.error(f"{function.name} is already declared in this scope", node)
+        node.id.symbol = function
+        return function
+
+    # Module, classes and functions
+
+    def checkModule(self, module:PModule, jobs:int=1) -> None:
+        self.declareModule(module)
+        for errors, _ in self.checkBodies(range(len(self.bodies)), jobs):
+            self.errors.extend(errors)
+        self.finishModule()
+
+    def declareModule(self, module:PModule) -> None:
+        """Checks all of the module but the bodies of its functions and methods,
+        which are then listed in self.bodies"""
+        symbols = self.symbols
+        symbols.openScope()
+        classes = []
+        for node in module.classDecl:
+            name = node.identifier.identifier
+            if name in self.typeNames:
+                self.error(f"Type {name} is already declared", node)
+                continue
+            typ = self.typeNames[name] = class_type(name)
+            self.classes[typ] = {}
+            classes.append((typ, node))
+        for node in module.varDecl:
+            self.declare(node)
+        functions = [self.declareFunction(node) for node in module.funcDecl]
+        # Members are all declared before the bodies using them are checked, the
+        # fields in the slots of the instances
+        for typ, node in classes:
+            frame = symbols.enterFrame(typ)
+            symbols.openScope()
+            for field in node.inner_scope.varDecl:
+                self.declare(field)
+            for statement in node.inner_scope.statements:
+                if statement.__class__ is PAssign and statement.left.__class__ is PVarDecl:
+                    self.declare(statement.left)
+            methods = [self.declareFunction(method) for method in node.inner_scope.funcDecl]
+            self.classes[typ] = symbols.scopeSymbols()
+            self.bodies.extend((typ, method) for method in methods)
+            symbols.closeScope()
+            node.frameSize = symbols.leaveFrame(frame)
+        self.bodies.extend((None, function) for function in functions)
+
+        for statement in module.statements:
+            self.checkStatement(statement)
+        for typ, node in classes:
+            self.checkClass(typ, node)
+        module.frameSize = symbols.frame.size
+
+    def finishModule(self) -> None:
+        self.symbols.closeScope()
+        self.errors.sort(key=lambda error: error.location.packed)
+
+    def signatures(self) -> dict:
+        """Signature of each module level declaration a body can use, by the name
+        the body depends on it under"""
+        signatures = {name: signature(symbol) for name, symbol in self.symbols.scopeSymbols().items()}
+        for typ, members in self.classes.items():
+            signatures[class_dependency(typ.name)] = ';'.join(f"{name} {signature(member)}"
+                                                              for name, member in members.items())
+        return signatures
+
+    def bodyKeys(self) -> list:
+        """Name of each body, unique in the module"""
+        keys = []
+        seen = {}
+        for owner, function in self.bodies:
+            key = function.name if owner is None else f"{owner.name}.{function.name}"
+            count = seen[key] = seen.get(key, 0) + 1
+            keys.append(key if count == 1 else f"{key}#{count}")
+        return keys
+
+    def openClassScope(self, typ:Type) -> None:
+        symbols = self.symbols
+        symbols.openScope()
+        for name, member in self.classes[typ].items():
+            symbols.bind(name, member)
+
+    def checkClass(self, typ:Type, node) -> None:
+        """Checks the initial values of the fields, the methods are bodies"""
+        self.openClassScope(typ)
+        for statement in node.inner_scope.statements:
+            if statement.__class__ is PAssign and statement.left.__class__ is PVarDecl:
+                # Field already declared with the members
+                self.checkAssignedValue(statement, statement.left.type)
+            else:
+                self.checkStatement(statement)
+        self.symbols.closeScope()
+
+    def checkBody(self, owner:Type, function:Function) -> None:
+        """Checks a function, or a method of the class owner"""
+        if owner is None:
+            self.checkFunction(function)
+        else:
+            self.openClassScope(owner)
+            self.checkFunction(function)
+            self.symbols.closeScope()
+
+    def checkBodies(self, indexes, jobs:int=1) -> list:
+        """Checks the bodies at indexes, returns the errors of each one and the
+        module level names it used"""
+        jobs = min(jobs, usable_cpus())
+        if jobs > 1 and len(indexes) > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            # The first bodies are checked here and timed against a walk of their
+            # nodes: the other ones are forked only when the workers and restoring
+            # their annotations are estimated to take less time than checking them
+            indexes = list(indexes)
+            sample = indexes[:max(1, len(indexes) // SAMPLE_PART)]
+            start = time.perf_counter()
+            results = self.checkBodies(sample)
+            checking = time.perf_counter() - start
+            start = time.perf_counter()
+            nodes = sum(len(body_nodes(self.bodies[index][1].node)) for index in sample)
+            walking = time.perf_counter() - start
+            rest = indexes[len(sample):]
+            parallel = max(walking, (checking + ENCODE_WALKS * walking) / jobs) + RESTORE_WALKS * walking
+            if nodes * len(rest) / len(sample) >= MIN_PARALLEL_NODES and parallel < MAX_PARALLEL_SHARE * checking:
+                return results + self.checkBodiesInParallel(rest, jobs)
+            return results + self.checkBodies(rest)
+        results = []
+        errors = self.errors
+        for index in indexes:
+            owner, function = self.bodies[index]
+            self.errors = []
+            # Methods always depend on the members of their class
+            self.used = set() if owner is None else {class_dependency(owner.name)}
+            self.checkBody(owner, function)
+            results.append((self.errors, self.used))
+        self.errors = errors
+        return results
+
+    def checkBodiesInParallel(self, indexes, jobs:int) -> list:
+        # Workers are forked once the declarations are checked, so they start
+        # with this checker as it is and no tree is sent to them
+        global _forkedChecker
+        indexes = list(indexes)
+        # More chunks than workers, for the bodies are of uneven sizes
+        size = max(1, len(indexes) // (jobs * 4))
+        chunks = [indexes[start:start + size] for start in range(0, len(indexes), size)]
+        results = []
+        _forkedChecker = self
+        # Objects the collector of a worker would touch are copied on write
+        gc.freeze()
+        try:
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('fork')) as executor:
+                futures = [executor.submit(_check_bodies, chunk) for chunk in chunks]
+                for chunk, future in zip(chunks, futures):
+                    # The nodes to annotate are listed while the workers check
+                    nodes = [body_nodes(self.bodies[index][1].node) for index in chunk]
+                    checked, annotations = future.result()
+                    results.extend(checked)
+                    # The annotations of the workers are set on the nodes here
+                    for index, values, found in zip(chunk, annotations, nodes):
+                        if values is None:
+                            self.checkBodies([index])
+                        else:
+                            self.annotateBody(index, values, found)
+        finally:
+            gc.unfreeze()
+            _forkedChecker = None
+        return results
+
+    def sharedSymbols(self) -> tuple:
+        """({key: symbol}, {id(symbol): key}) of the module level symbols and of
+        the class members, the symbols of other bodies a body can use. A key
+        names the same declaration in any process and compilation of the module."""
+        if self.shared is None:
+            symbols = dict(self.symbols.scopeSymbols())
+            for typ, members in self.classes.items():
+                for name, member in members.items():
+                    symbols[f"{typ.name}.{name}"] = member
+            self.shared = symbols, {id(symbol): key for key, symbol in symbols.items()}
+        return self.shared
+
+    def bodyAnnotations(self, index:int):
+        """Annotations of the checked body at index as marshalable values: its frame
+        size, its distinct annotations, and the index of the annotation of each
+        node of body_nodes (None when unset). An annotation is a type name, the
+        (key,) of a shared symbol or the (name, type name, slot, depth) of a local
+        variable. None if the body refers to a symbol which has no key."""
+        function = self.bodies[index][1]
+        keys = self.sharedSymbols()[1]
+        annotations = []
+        indexes = {}
+        values = []
+        for node, slot in body_nodes(function.node):
+            value = getattr(node, slot, None)
+            if value is not None:
+                found = indexes.get(id(value))
+                if found is None:
+                    if slot == 'type':
+                        annotation = value.name
+                    elif id(value) in keys:
+                        annotation = (keys[id(value)],)
+                    elif value.__class__ is Variable and value.frame is function:
+                        annotation = (value.name, value.type.name, value.slot, value.depth)
+                    else:
+                        return None
+                    found = indexes[id(value)] = len(annotations)
+                    annotations.append(annotation)
+                value = found
+            values.append(value)
+        return function.frameSize, annotations, values
+
+    def annotateBody(self, index:int, annotations, nodes:list=None) -> None:
+        """Annotates the body at index as it was when bodyAnnotations gave annotations.
+        nodes is its body_nodes if already listed"""
+        function = self.bodies[index][1]
+        frameSize, annotations, values = annotations
+        shared = self.sharedSymbols()[0]
+        table = []
+        for annotation in annotations:
+            if annotation.__class__ is str:
+                table.append(type_named(annotation))
+            elif len(annotation) == 1:
+                table.append(shared[annotation[0]])
+            else:
+                name, typ, slot, depth = annotation
+                table.append(Variable(name, type_named(typ), LOCAL, function, slot, depth))
+        if nodes is None:
+            nodes = body_nodes(function.node)
+        for (node, slot), value in zip(nodes, values):
+            if value is not None:
+                setattr(node, slot, table[value])
+        function.frameSize = function.node.frameSize = frameSize
+
+    def checkFunction(self, function:Function) -> None:
+        saved = self.function, self.loops
+        self.function, self.loops = function, 0
+        symbols = self.symbols
+        frame = symbols.enterFrame(function)
+        symbols.openScope()
+        for arg in function.node.args:
+            self.declare(arg)
+        self.checkScope(function.node.body)
+        symbols.closeScope()
+        function.frameSize = function.node.frameSize = symbols.leaveFrame(frame)
+        self.function, self.loops = saved
+
+    # Statements
+
+    def checkStatement(self, node) -> None:
+        rule = self.statementRules.get(node.__class__)
+        if rule is None:
+            self.expressionRules[node.__class__](node)
+        else:
+            rule(node)
+
+    def checkScope(self, node:PScope) -> None:
+        self.symbols.openScope()
+        for decl in node.varDecl:
+            self.declare(decl)
+        functions = [self.declareFunction(decl) for decl in node.funcDecl]
+        for statement in node.statements:
+            self.checkStatement(statement)
+        for function in functions:
+            self.checkFunction(function)
+        self.symbols.closeScope()
+
+    def checkSkip(self, node:PSkip) -> None:
+        pass
+
+    def checkCondition(self, node) -> None:
+        typ = self.expressionRules[node.__class__](node)
+        if typ is not BOOL_TYPE and typ is not ERROR_TYPE:
+            self.error(f"Condition must be a bool, not {typ}", node)
+
+    def checkIf(self, node:PIf) -> None:
+        self.checkCondition(node.condition)
+        self.checkScope(node.if_true)
+        if node.if_false is not None:
+            self.checkStatement(node.if_false)
+
+    def checkWhile(self, node:PWhile) -> None:
+        self.checkCondition(node.condition)
+        self.loops += 1
+        self.checkScope(node.bloc)
+        self.loops -= 1
+
+    def checkFor(self, node:PFor) -> None:
+        self.symbols.openScope()
+        self.checkStatement(node.init)
+        self.checkCondition(node.condition)
+        self.loops += 1
+        self.checkScope(node.bloc)
+        self.checkStatement(node.postExpr)
+        self.loops -= 1
+        self.symbols.closeScope()
+
+    def checkForeach(self, node:PForeach) -> None:
+        iterable = self.typeOf(node.iterable)
+        if iterable.kind == ARRAY:
+            element = iterable.element
+        elif iterable is STRING_TYPE:
+            element = CHAR_TYPE
+        else:
+            element = ERROR_TYPE
+            if iterable is not ERROR_TYPE:
+                self.error(f"Can not iterate over {iterable}", node.iterable)
+        self.symbols.openScope()
+        declared = self.declare(node.varDecl)
+        if not convertible(element, declared):
+            self.error(f"Can not convert {element} to {declared}", node.varDecl)
+        self.loops += 1
+        self.checkScope(node.bloc)
+        self.loops -= 1
+        self.symbols.closeScope()
+
+    def checkReturn(self, node:PReturn) -> None:
+        if self.function is None:
+            self.error("Return outside of a function", node)
+            if node.returnVal is not None:
+                self.typeOf(node.returnVal)
+            return
+        expected = self.function.returnType
+        if node.returnVal is None:
+            if expected is not VOID_TYPE and expected is not ERROR_TYPE:
+                self.error(f"{self.function.name} must return a value of type {expected}", node)
+            return
+        typ = self.typeOf(node.returnVal)
+        if expected is VOID_TYPE:
+            self.error(f"{self.function.name} returns void, it can not return a value", node)
+        elif not convertible(typ, expected) and not literal_fits(node.returnVal, expected):
+            self.error(f"Can not return a value of type {typ} from {self.function.name}, which returns {expected}", node)
+
+    def checkLoopJump(self, node) -> None:
+        if not self.loops:
+            self.error(f"{'Break' if node.__class__ is PBreak else 'Continue'} outside of a loop", node)
+
+    def checkAssert(self, node:PAssert) -> None:
+        self.checkCondition(node.assertExpr)
+
+    # Expressions, each rule returns the type of the node and stores it on it
+
+    def typeOf(self, node) -> Type:
+        return self.expressionRules[node.__class__](node)
+
+    def typeValue(self, node:PExpression) -> Type:
+        """Type of an expression wrapping a name, a literal or another expression"""
+        value = node.rvalue
+        cls = value.__class__
+        if cls is PIdentifier:
+            symbol = self.symbols.names.get(value.identifier)
+            if symbol.__class__ is Variable:
+                value.symbol = symbol
+                typ = symbol.type
+                if symbol.kind is GLOBAL:
+                    self.used.add(symbol.name)
+            else:
+                typ = self.lookupVariable(value)
+        elif cls is PNumeric:
+            typ = self.typeNumber(value)
+        elif value is True or value is False:
+            typ = BOOL_TYPE
+        elif value is None:
+            typ = NULL_TYPE
+        elif cls is list:
+            typ = self.typeArrayLiteral(node)
+        else:
+            typ = self.expressionRules[cls](value)
+        node.type = typ
+        return typ
+
+    def typeNumber(self, node:PNumeric) -> Type:
+        value = node.rvalue
+        if isinstance(value, float):
+            typ = FLOAT64_TYPE
+        elif -0x80000000 <= value <= 0x7FFFFFFF:
+            typ = INT32_TYPE
+        elif -0x8000000000000000 <= value <= 0x7FFFFFFFFFFFFFFF:
+            typ = INT64_TYPE
+        else:
+            typ = self.error(f"{value} does not fit in an int_64", node)
+        node.type = typ
+        return typ
+
+    def typeString(self, node:PString) -> Type:
+        node.type = STRING_TYPE
+        return STRING_TYPE
+
+    def typeArrayLiteral(self, node:PExpression) -> Type:
+        element = None
+        for item in expression_list(node.rvalue):
+            typ = self.typeOf(item)
+            if element is None or convertible(typ, element):
+                element = element or typ
+            elif convertible(element, typ):
+                element = typ
+            elif element.common.get(typ) is not None:
+                element = element.common[typ]
+            else:
+                self.error(f"Array items of types {element} and {typ}", item)
+                element = ERROR_TYPE
+        # The items of an empty literal can be of any type
+        return ERROR_TYPE if element is None or element is ERROR_TYPE else array_of(element)
+
+    def lookupVariable(self, node:PIdentifier) -> Type:
+        name = node.identifier
+        found = self.symbols.names.get(name)
+        if found is None or found.__class__ is Function or found.kind is GLOBAL:
+            # Declaring the name would change the error
+            self.used.add(name)
+        if found is None:
+            return self.error(f"Unknown variable {name}", node)
+        if found.__class__ is Function:
+            return self.error(f"{name} is a function, not a variable", node)
+        node.symbol = found
+        return found.type
+
+    def typeDot(self, node:PDot) -> Type:
+        owner = self.typeOf(node.left)
+        name = node.rvalue.identifier
+        if owner.kind == CLASS:
+            self.used.add(class_dependency(owner.name))
+            member = self.classes[owner].get(name)
+            if member is None:
+                typ = self.error(f"{owner} has no member {name}", node.rvalue)
+            elif member.__class__ is Function:
+                typ = self.error(f"{owner}.{name} is a method, not a field", node.rvalue)
+            else:
+                node.rvalue.symbol = member
+                typ = member.type
+        elif (owner.kind == ARRAY or owner is STRING_TYPE) and name == LENGTH_MEMBER:
+            typ = INT32_TYPE
+        elif owner is ERROR_TYPE:
+            typ = ERROR_TYPE
+        else:
+            typ = self.error(f"{owner} has no member {name}", node.rvalue)
+        node.type = typ
+        return typ
+
+    def typeBinOp(self, node:PBinOp) -> Type:
+        left = self.expressionRules[node.left.__class__](node.left)
+        right = self.expressionRules[node.rvalue.__class__](node.rvalue)
+        typ = self.binaryResult(node, left, right)
+        node.type = typ
+        return typ
+
+    def binaryResult(self, node:PBinOp, left:Type, right:Type) -> Type:
+        kind = OPERATOR_KINDS[node.op._name_]
+        if kind is LOGICAL:
+            if (left is BOOL_TYPE or left is ERROR_TYPE) and (right is BOOL_TYPE or right is ERROR_TYPE):
+                return BOOL_TYPE
+            return self.operatorError(node, left, right)
+        if kind is SHIFT:
+            if left.kind == INT and right.kind == INT:
+                return left
+            return self.operatorError(node, left, right)
+        common = left.common.get(right)
+        if common is not None:
+            # A literal operand takes the type of the other operand if it fits
+            if common is not left and node.rvalue.__class__ is PExpression and literal_fits(node.rvalue, left):
+                common = left
+            elif common is not right and node.left.__class__ is PExpression and literal_fits(node.left, right):
+                common = right
+        elif literal_fits(node.rvalue, left):
+            common = left
+        elif literal_fits(node.left, right):
+            common = right
+        if kind is ARITHMETIC:
+            if common is not None:
+                if common is BOOL_TYPE and (node.op is BinaryOperation.DIVIDE or node.op is BinaryOperation.MOD):
+                    return self.operatorError(node, left, right)
+                return common
+            if node.op is BinaryOperation.PLUS and left is STRING_TYPE and right is STRING_TYPE:
+                return STRING_TYPE
+        elif kind is COMPARISON:
+            if common is not None:
+                return BOOL_TYPE
+        elif kind is EQUALITY:
+            if common is not None or convertible(left, right) or convertible(right, left):
+                return BOOL_TYPE
+        elif common is not None and common.kind != FLOAT:
+            # Bitwise operations, on integers and bools
+            return common
+        return self.operatorError(node, left, right)
+
+    def operatorError(self, node:PBinOp, left:Type, right:Type) -> Type:
+        if left is ERROR_TYPE or right is ERROR_TYPE:
+            return ERROR_TYPE
+        return self.error(f"Operator {node.op.value} is not defined for {left} and {right}", node)
+
+    def typeUnOp(self, node:PUnOp) -> Type:
+        operand = node.rvalue
+        typ = self.expressionRules[operand.__class__](operand)
+        op = node.op
+        if typ is ERROR_TYPE:
+            pass
+        elif op is UnaryOperation.LOGIC_NOT:
+            if typ is not BOOL_TYPE:
+                typ = self.error(f"Operator not is not defined for {typ}", node)
+        elif typ.kind != INT and typ.kind != FLOAT:
+            typ = self.error(f"Operator {op.value} is not defined for {typ}", node)
+        elif op is not UnaryOperation.MINUS and operand.__class__ not in (PIdentifier, PDot, PIndex):
+            typ = self.error(f"Operator {op.value} needs a variable", node)
+        node.type = typ
+        return typ
+
+    def typeAssign(self, node:PAssign) -> Type:
+        left = node.left
+        if left.__class__ is PVarDecl:
+            # The declared variable is not visible from its initial value
+            value = node.rvalue
+            typ = self.expressionRules[value.__class__](value)
+            target = self.declare(left)
+            self.checkConversion(value, typ, target)
+        else:
+            target = self.expressionRules[left.__class__](left)
+            self.checkAssignedValue(node, target)
+        node.type = target
+        return target
+
+    def checkAssignedValue(self, node:PAssign, target:Type) -> None:
+        value = node.rvalue
+        if value.__class__ is PBinOp and value.left is node.left:
+            # Compound assignment (+=...): the result is converted back to the variable
+            right = value.rvalue
+            typ = self.expressionRules[right.__class__](right)
+            result = self.binaryResult(value, target, typ)
+            if result is not ERROR_TYPE and not castable(result, target):
+                self.error(f"Can not assign a value of type {result} to {target}", node)
+            value.type = target
+            return
+        typ = self.expressionRules[value.__class__](value)
+        self.checkConversion(value, typ, target)
+
+    def checkConversion(self, node, typ:Type, target:Type) -> None:
+        if typ is target or target in typ.widening or convertible(typ, target) or literal_fits(node, target):
+            return
+        self.error(f"Can not convert {typ} to {target}", node)
+
+    def typeCall(self, node:PCall) -> Type:
+        callee = node.id
+        args = expression_list(node.args)
+        argTypes = [self.expressionRules[arg.__class__](arg) for arg in args]
+        if callee.__class__ is PDot:
+            owner = self.typeOf(callee.left)
+            name = callee.rvalue.identifier
+            if owner is ERROR_TYPE:
+                function = None
+            elif owner.kind != CLASS:
+                function = self.error(f"{owner} has no method {name}", callee.rvalue)
+            else:
+                self.used.add(class_dependency(owner.name))
+                function = self.classes[owner].get(name)
+        else:
+            name = callee.identifier
+            function = self.symbols.names.get(name)
+            # Module level functions are at depth 1
+            if function is None or (function.depth == 1 if function.__class__ is Function else function.kind is GLOBAL):
+                self.used.add(name)
+        if function is None:
+            typ = ERROR_TYPE if callee.__class__ is PDot else self.error(f"Unknown function {name}", callee)
+        elif function is ERROR_TYPE:
+            typ = ERROR_TYPE
+        elif function.__class__ is not Function:
+            typ = self.error(f"{name} is not a function", callee)
+        else:
+            if callee.__class__ is PDot:
+                callee.rvalue.symbol = function
+            else:
+                callee.symbol = function
+            typ = function.returnType
+            if len(args) != len(function.argTypes):
+                self.error(f"{name} takes {len(function.argTypes)} arguments, {len(args)} given", node)
+            else:
+                for arg, argType, expected in zip(args, argTypes, function.argTypes):
+                    self.checkConversion(arg, argType, expected)
+        node.type = typ
+        return typ
+
+    def typeCast(self, node:PCast) -> Type:
+        target = self.resolveType(node.cast_to)
+        source = self.typeOf(node.rvalue)
+        if not castable(source, target) and not literal_fits(node.rvalue, target):
+            target = self.error(f"Can not cast {source} to {target}", node)
+        node.type = target
+        return target
+
+    def typeIndex(self, node:PIndex) -> Type:
+        array = self.typeOf(node.rvalue)
+        index = self.typeOf(node.index)
+        if index.kind != INT and index is not BOOL_TYPE and index is not ERROR_TYPE:
+            self.error(f"Index must be an integer, not {index}", node.index)
+        if array.kind == ARRAY:
+            typ = array.element
+        elif array is STRING_TYPE:
+            typ = CHAR_TYPE
+        elif array is ERROR_TYPE:
+            typ = ERROR_TYPE
+        else:
+            typ = self.error(f"{array} can not be indexed", node)
+        node.type = typ
+        return typ
+
+    def typeNewArray(self, node:PNewArray) -> Type:
+        element = self.resolveType(node.typ)
+        length = self.typeOf(node.rvalue)
+        if length.kind != INT and length is not ERROR_TYPE:
+            self.error(f"Array length must be an integer, not {length}", node.rvalue)
+        typ = array_of(element) if element is not ERROR_TYPE else ERROR_TYPE
+        node.type = typ
+        return typ
+
+    def typeNewObj(self, node:PNewObj) -> Type:
+        typ = self.resolveType(node.object)
+        args = expression_list(node.args)
+        for arg in args:
+            self.typeOf(arg)
+        if typ is not ERROR_TYPE and typ.kind != CLASS:
+            typ = self.error(f"{typ} is not a class", node)
+        elif args:
+            self.error(f"Classes have no constructor, {len(args)} arguments given", node)
+        node.type = typ
+        return typ
+
+    def typeTernary(self, node:PTernary) -> Type:
+        self.checkCondition(node.condition)
+        first = self.typeOf(node.if_true)
+        second = self.typeOf(node.if_false)
+        if convertible(second, first):
+            typ = first
+        elif convertible(first, second):
+            typ = second
+        else:
+            typ = first.common.get(second) or self.error(f"Branches of types {first} and {second}", node)
+        node.type = typ
+        return typ
+
+
+# Checker of the forked worker processes, inherited from the checking process
+_forkedChecker = None
+
+
+def usable_cpus() -> int:
+    """Number of processors this process may run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _check_bodies(chunk) -> tuple:
+    return _forkedChecker.checkBodies(chunk), [_forkedChecker.bodyAnnotations(index) for index in chunk]
+
+
+# (getter of the fields which can hold nodes, annotated slot or None) of each
+# node class: a node has at most one, its type or the symbol of an identifier
+_layouts = {}
+# Nodes which hold no other node but types, and fields which never hold nodes
+_LEAF_CLASSES = (PIdentifier, PNumeric, PString, PType)
+_LEAF_FIELDS = frozenset({'location', 'op'})
+
+
+def node_layout(cls:type) -> tuple:
+    layout = _layouts.get(cls)
+    if layout is None:
+        fields = [] if issubclass(cls, _LEAF_CLASSES) else [name for name in cls.fields() if name not in _LEAF_FIELDS]
+        if not fields:
+            getter = None
+        elif len(fields) == 1:
+            single = attrgetter(fields[0])
+            getter = lambda node: (single(node),)
+        else:
+            getter = attrgetter(*fields)
+        slots = [name for klass in cls.__mro__ for name in klass.__dict__.get('__slots__', ())
+                 if name == 'type' or name == 'symbol']
+        layout = _layouts[cls] = (getter, slots[0] if slots else None)
+    return layout
+
+
+def body_nodes(node:PFuncDecl) -> list:
+    """(node, annotated slot) of the nodes of the arguments and of the body of a
+    function which have one, always in the same order"""
+    found = []
+    stack = [node.body, node.args]
+    layouts = _layouts
+    while stack:
+        elem = stack.pop()
+        cls = elem.__class__
+        if cls is list:
+            stack.extend(elem)
+            continue
+        layout = layouts.get(cls)
+        if layout is None:
+            if not isinstance(elem, PTreeElem):
+                continue
+            layout = node_layout(cls)
+        getter, slot = layout
+        if slot is not None:
+            found.append((elem, slot))
+        if getter is not None:
+            stack.extend(getter(elem))
+    return found
+
+
+def check_module(module:PModule, jobs:int=1) -> list:
+    """Types the module in place, returns its TypingErrors in source order.
+
+    With more than one job, the bodies of the functions and methods are checked by
+    that many forked processes (where fork is available, and at most one per
+    processor), which send back their errors and annotations: the tree is annotated
+    as by a single process. Bodies too few or too cheap to check to make up for
+    restoring their annotations are checked by this process."""
+    checker = TypeChecker()
+    checker.checkModule(module, jobs)
+    return checker.errors
@@ -0,0 +1,177 @@
+"""Types of P#, interned: there is a single object for each type, so types are
+compared with `is` and never structurally.
+
+The implicit conversions (bool -> integers -> floats, unsigned -> wider signed,
+narrower -> wider) and the common type of two operands are computed once for
+the primitive types and looked up in tables afterwards.
+"""
+
+VOID = 'void'
+BOOL = 'bool'
+INT = 'int'
+FLOAT = 'float'
+STRING = 'string'
+NULL = 'null'
+ARRAY = 'array'
+CLASS = 'class'
+ERROR = 'error'
+
+
+class Type:
+    """A type. Only built through the module functions, which intern them.
+
+    widening holds the types it converts to implicitly, common the result type of
+    an arithmetic operation with each primitive type it has one with."""
+    __slots__ = ('name', 'kind', 'bits', 'signed', 'element', 'reference', 'widening', 'common')
+
+    def __init__(self, name:str, kind:str, bits:int=0, signed:bool=True, element:'Type'=None) -> None:
+        self.name = name
+        self.kind = kind
+        self.bits = bits
+        self.signed = signed
+        # Type of the items of an array
+        self.element = element
+        # null converts to reference types
+        self.reference = kind in (STRING, ARRAY, CLASS)
+        self.widening = frozenset()
+        self.common = {}
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def __reduce__(self):
+        # Unpickled types are the interned ones of the process
+        if self.kind == ARRAY:
+            return array_of, (self.element,)
+        if self.kind == CLASS:
+            return class_type, (self.name,)
+        return _primitive, (self.name,)
+
+    @property
+    def numeric(self) -> bool:
+        return self.kind in (BOOL, INT, FLOAT)
+
+    @property
+    def integer(self) -> bool:
+        return self.kind == INT
+
+
+def _declare(name:str, kind:str, bits:int=0, signed:bool=True) -> Type:
+    typ = _interned[name] = Type(name, kind, bits, signed)
+    return typ
+
+
+_interned = {}
+
+VOID_TYPE = _declare('void', VOID)
+BOOL_TYPE = _declare('bool', BOOL, 1, False)
+CHAR_TYPE = _declare('char', INT, 8)
+UCHAR_TYPE = _declare('unsigned char', INT, 8, False)
+INT16_TYPE = _declare('int_16', INT, 16)
+UINT16_TYPE = _declare('unsigned int_16', INT, 16, False)
+INT32_TYPE = _declare('int_32', INT, 32)
+UINT32_TYPE = _declare('unsigned int_32', INT, 32, False)
+INT64_TYPE = _declare('int_64', INT, 64)
+UINT64_TYPE = _declare('unsigned int_64', INT, 64, False)
+FLOAT32_TYPE = _declare('float_32', FLOAT, 32)
+FLOAT64_TYPE = _declare('float_64', FLOAT, 64)
+STRING_TYPE = _declare('string', STRING)
+NULL_TYPE = _declare('null', NULL)
+# Type of what could not be typed: it converts to and from anything, so one
+# error is not reported again by every expression using its result
+ERROR_TYPE = _declare('<error>', ERROR)
+
+# From the narrowest to the widest, the common type of two operands is the first
+# one both convert to
+NUMERIC_TYPES = (BOOL_TYPE, UCHAR_TYPE, CHAR_TYPE, UINT16_TYPE, INT16_TYPE, UINT32_TYPE, INT32_TYPE,
+                 UINT64_TYPE, INT64_TYPE, FLOAT32_TYPE, FLOAT64_TYPE)
+
+# Names of the types in the sources. 'int' is the int_32 of the older samples.
+TYPE_NAMES = {
+    'void': VOID_TYPE, 'bool': BOOL_TYPE, 'char': CHAR_TYPE, 'int': INT32_TYPE,
+    'int_16': INT16_TYPE, 'int_32': INT32_TYPE, 'int_64': INT64_TYPE,
+    'float_32': FLOAT32_TYPE, 'float_64': FLOAT64_TYPE, 'string': STRING_TYPE,
+}
+UNSIGNED_TYPE_NAMES = {
+    'char': UCHAR_TYPE, 'int_16': UINT16_TYPE, 'int_32': UINT32_TYPE, 'int_64': UINT64_TYPE,
+}
+
+
+def _widens(source:Type, target:Type) -> bool:
+    if source.kind == BOOL:
+        return target.kind in (INT, FLOAT)
+    if source.kind == INT:
+        if target.kind == FLOAT:
+            return True
+        if target.kind != INT:
+            return False
+        if source.signed == target.signed:
+            return target.bits >= source.bits
+        # Unsigned values fit in wider signed integers
+        return not source.signed and target.bits > source.bits
+    return source.kind == FLOAT and target.kind == FLOAT and target.bits >= source.bits
+
+
+for _source in NUMERIC_TYPES:
+    _source.widening = frozenset(target for target in NUMERIC_TYPES if target is not _source and _widens(_source, target))
+for _left in NUMERIC_TYPES:
+    for _right in NUMERIC_TYPES:
+        for _target in NUMERIC_TYPES:
+            if _target.kind == FLOAT and _left.kind != FLOAT and _right.kind != FLOAT:
+                # Integers without a common integer type (int_64 and unsigned int_64)
+                break
+            if (_target is _left or _target in _left.widening) and (_target is _right or _target in _right.widening):
+                _left.common[_right] = _target
+                break
+
+
+def _primitive(name:str) -> Type:
+    return _interned[name]
+
+
+def array_of(element:Type) -> Type:
+    """The type of the arrays of element"""
+    name = element.name + '[]'
+    typ = _interned.get(name)
+    if typ is None:
+        typ = _interned[name] = Type(name, ARRAY, element=element)
+    return typ
+
+
+def class_type(name:str) -> Type:
+    """The type of the instances of the class called name"""
+    typ = _interned.get(name)
+    if typ is None:
+        typ = _interned[name] = Type(name, CLASS)
+    elif typ.kind != CLASS:
+        raise ValueError(f"{name} is a primitive type, not a class")
+    return typ
+
+
+def type_named(name:str) -> Type:
+    """The type whose name is name (the one printed, not the one of the sources)"""
+    typ = _interned.get(name)
+    if typ is not None:
+        return typ
+    if name.endswith('[]'):
+        return array_of(type_named(name[:-2]))
+    return class_type(name)
+
+
+def convertible(source:Type, target:Type) -> bool:
+    """Whether a value of type source can be used where target is expected
+    without an explicit cast"""
+    return (source is target or target in source.widening or (source is NULL_TYPE and target.reference)
+            or source is ERROR_TYPE or target is ERROR_TYPE)
+
+
+def castable(source:Type, target:Type) -> bool:
+    """Whether an explicit cast from source to target is allowed"""
+    return convertible(source, target) or (source.numeric and target.numeric)
+
+
+def integer_range(typ:Type) -> tuple:
+    """(smallest, largest) value of an integer type"""
+    if typ.signed:
+        return -(1 << (typ.bits - 1)), (1 << (typ.bits - 1)) - 1
+    return 0, (1 << typ.bits) - 1
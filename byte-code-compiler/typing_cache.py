@@ -0,0 +1,163 @@
+"""Results of the typing stage kept between two compilations of a file.
+
+For each body of a function or method, the cache keeps a fingerprint of its
+text, the signatures of the module level declarations it used (globals,
+functions, classes, and the names it could not resolve), its errors and its
+annotations. When the file is compiled again, its declarations and module code
+are checked as usual, then a body is only checked if its text changed or one of
+the signatures it used did. The errors of the other bodies are taken from the
+cache, moved to where the body now is, and their nodes annotated from it when
+the tree goes on to the next stages. The compiler only uses it with --typing-cache.
+"""
+import hashlib
+import marshal
+import os
+import re
+from bisect import bisect_right
+from itertools import accumulate
+
+from ast_cache import compiler_version
+from lexer import Location
+from type_checker import TypeChecker, TypingError
+
+# With the files of ast_cache.COMPILER_FILES, the files the typing results depend on
+TYPING_FILES = ('symbols.py', 'type_system.py', 'type_checker.py', 'typing_cache.py')
+MAGIC = b'PSTYP2'
+_NEWLINE = re.compile(b'\n')
+
+
+def typing_version() -> str:
+    h = hashlib.sha256(compiler_version().encode())
+    root = os.path.dirname(os.path.abspath(__file__))
+    for name in TYPING_FILES:
+        with open(os.path.join(root, name), 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def line_offsets(code) -> list:
+    """Offset in code of the start of each line, lines counting from 1"""
+    if not isinstance(code, (str, bytes)):
+        # Memory mapped: scanned in place instead of copied
+        offsets = [0, 0]
+        offsets.extend(match.end() for match in _NEWLINE.finditer(code))
+        offsets.append(len(code) + 1)
+        return offsets
+    lines = code.split('\n' if isinstance(code, str) else b'\n')
+    offsets = [0]
+    # Only builtins, no Python code per line
+    offsets.extend(accumulate(map((1).__add__, map(len, lines)), initial=0))
+    return offsets
+
+
+def body_fingerprints(code, module, functions:list) -> list:
+    """Fingerprint of the text of each function of module, code being its source.
+
+    The text of a function runs from its start to the start of the next
+    declaration or statement of the module or of a class. It does not depend on
+    the line the function starts on, so the functions after an edit keep theirs."""
+    offsets = line_offsets(code)
+    scopes = [module.classDecl, module.varDecl, module.funcDecl, module.statements]
+    for node in module.classDecl:
+        scopes.extend((node.inner_scope.varDecl, node.inner_scope.funcDecl, node.inner_scope.statements))
+    starts = sorted(offsets[item.location.line] + item.location.col - 1
+                    for items in scopes for item in items if item.location is not None)
+    starts.append(len(code))
+    fingerprints = []
+    for function in functions:
+        location = function.location
+        start = offsets[location.line] + location.col - 1
+        text = code[start:starts[bisect_right(starts, start)]]
+        h = hashlib.blake2b(text.encode('utf-8', 'surrogatepass') if isinstance(text, str) else text, digest_size=16)
+        # Errors on the first line keep their column only if the body does
+        h.update(location.col.to_bytes(8, 'little'))
+        fingerprints.append(h.digest())
+    return fingerprints
+
+
+class TypingCache:
+    """Typing results of source files stored on disk, one entry per source file
+    kept in directory and replaced by each compilation of the file."""
+
+    def __init__(self, directory:str) -> None:
+        self.directory = directory
+        self.version = typing_version()
+        self.reused = 0
+        self.checked = 0
+
+    def path(self, source:str) -> str:
+        key = hashlib.sha256(os.path.abspath(source).encode('utf-8', 'surrogatepass')).hexdigest()
+        return os.path.join(self.directory, key + '.typ')
+
+    def load(self, source:str) -> dict:
+        """(fingerprint, {name: signature}, [(message, line delta, column)],
+        annotations) of each body of source last time it was checked, by body
+        key. The annotations are those of TypeChecker.bodyAnnotations."""
+        try:
+            with open(self.path(source), 'rb') as f:
+                data = f.read()
+            if not data.startswith(MAGIC):
+                return {}
+            version, records = marshal.loads(data[len(MAGIC):])
+        except (OSError, ValueError, EOFError, TypeError):
+            return {}
+        return records if version == self.version else {}
+
+    def store(self, source:str, records:dict) -> bool:
+        path = self.path(source)
+        tmpname = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmpname, 'wb') as f:
+                f.write(MAGIC + marshal.dumps((self.version, records)))
+            os.replace(tmpname, path)
+        except OSError:
+            return False
+        return True
+
+    def check(self, source:str, code, module, jobs:int=1, annotate:bool=True) -> list:
+        """Types module, the tree of code read from source, checking again only the
+        bodies which changed since the last check of source or use declarations
+        which did. Returns the TypingErrors in source order.
+
+        Restoring the annotations of a body costs about as much as checking it:
+        the bodies taken from the cache are only annotated when annotate is set
+        and the module has no errors, the only case the later stages use them."""
+        checker = TypeChecker()
+        checker.declareModule(module)
+        bodies = checker.bodies
+        keys = checker.bodyKeys()
+        fingerprints = body_fingerprints(code, module, [function.node for _, function in bodies])
+        signatures = checker.signatures()
+        previous = self.load(source)
+        records = {}
+        pending = []
+        reused = []
+        for index, key in enumerate(keys):
+            record = previous.get(key)
+            if (record is None or record[0] != fingerprints[index] or record[3] is None
+                    or any(signatures.get(name) != used for name, used in record[1].items())):
+                pending.append(index)
+                continue
+            line = bodies[index][1].node.location.line
+            checker.errors.extend(TypingError(msg, Location(line + delta, col)) for msg, delta, col in record[2])
+            reused.append(index)
+            records[key] = record
+        for index, (errors, used) in zip(pending, checker.checkBodies(pending, jobs)):
+            line = bodies[index][1].node.location.line
+            checker.errors.extend(errors)
+            records[keys[index]] = (fingerprints[index], {name: signatures.get(name) for name in used},
+                                    [(error.msg, error.location.line - line, error.location.col) for error in errors],
+                                    checker.bodyAnnotations(index))
+        if annotate and not checker.errors:
+            for index in reused:
+                checker.annotateBody(index, records[keys[index]][3])
+        checker.finishModule()
+        self.reused += len(reused)
+        self.checked += len(pending)
+        if pending or len(records) != len(previous):
+            self.store(source, records)
+        return checker.errors
+
+    def stats(self) -> dict:
+        return {'reused bodies': self.reused, 'checked bodies': self.checked}
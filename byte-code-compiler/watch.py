@@ -0,0 +1,83 @@
+"""Watch mode: recompiles the sources of a directory as they change.
+
+`main.py --watch DIR` compiles every .psc file of DIR, then polls the
+modification time and size of the files. Each cycle only recompiles the files
+which changed or appeared. The lexer, the parser and the tree caches stay
+loaded between cycles, and the files which did not change are not compiled
+again.
+
+Files importing a changed file are not recompiled with it: the grammar does
+not parse imports yet.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from driver import get_lexer, source_files
+from main import print_error, run
+
+
+def scan(directory:str) -> dict:
+    """(modification time, size) of each source file of directory"""
+    stamps = {}
+    for path in source_files([directory]):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Removed since the directory was listed
+            continue
+        stamps[path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+class Watcher:
+    def __init__(self, directory:str, options, out=print, err=print_error, executor=None) -> None:
+        self.directory = directory
+        self.options = options
+        self.out = out
+        self.err = err
+        self.executor = executor
+        self.stamps = {}
+
+    def poll(self) -> list:
+        """Files which changed or appeared since the last poll"""
+        stamps = scan(self.directory)
+        changed = sorted(path for path, stamp in stamps.items() if self.stamps.get(path) != stamp)
+        self.stamps = stamps
+        return changed
+
+    def cycle(self, paths:list) -> int:
+        start = time.perf_counter()
+        status = run(self.options, self.out, self.err, self.executor, paths=paths)
+        self.out(f"Watch: compiled {len(paths)} file{'s' if len(paths) != 1 else ''} "
+                 f"in {(time.perf_counter() - start) * 1000:.1f}ms")
+        return status
+
+    def run(self, interval:float) -> None:
+        """Compiles all the files, then the changed ones until interrupted"""
+        self.cycle(self.poll())
+        while True:
+            time.sleep(interval)
+            paths = self.poll()
+            if paths:
+                self.cycle(paths)
+
+
+def watch(options) -> int:
+    if not os.path.isdir(options.watch):
+        print_error(f"Watched path ({options.watch}) must point to an existing DIRECTORY!")
+        return 1
+    if options.jobs < 1:
+        raise ValueError(f"--jobs must be at least 1, got {options.jobs}")
+    # Recompilations share one pool, whose workers keep their lexer and caches
+    executor = ProcessPoolExecutor(max_workers=options.jobs, initializer=get_lexer) if options.jobs > 1 else None
+    try:
+        # Printed as it comes, the output of a cycle may be piped
+        out = lambda line: print(line, flush=True)
+        Watcher(options.watch, options, out, executor=executor).run(options.poll_interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    return 0